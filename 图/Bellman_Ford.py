@@ -1,5 +1,7 @@
 import numpy as np
 
+from Graph_Store import Graph
+
 def Bellman_Ford(G, s):
     """
     Bellman-Ford算法：单源最短路径算法，支持负权边，能检测负环
@@ -18,25 +20,32 @@ def Bellman_Ford(G, s):
         return {}, {}
     
     # 获取所有顶点（包括只有入边的顶点）
-    vertices = set(G.keys())
-    for neighbors in G.values():
-        vertices.update(neighbors.keys())
+    if isinstance(G, Graph):
+        vertices = G.vertices()
+    else:
+        vertices = set(G.keys())
+        for neighbors in G.values():
+            vertices.update(neighbors.keys())
     
     # 初始化距离和前驱
     dist = {v: np.inf for v in vertices}  # 到各顶点的最短距离
     pred = {v: None for v in vertices}    # 前驱节点
     dist[s] = 0                           # 源点到自身距离为0
     
-    # 提取所有边，格式为(起点, 终点, 权重)
-    edges = []
-    for u in G:
-        for v, weight in G[u].items():
-            edges.append((u, v, weight))
+    # 提取所有边，格式为(起点, 终点, 权重)；Graph直接使用缓存的边列表
+    if isinstance(G, Graph):
+        edges = G.edges()
+    else:
+        edges = []
+        for u in G:
+            for v, weight in G[u].items():
+                edges.append((u, v, weight))
     
     # 主循环：对所有边进行 |V|-1 次松弛操作
     # 原理：每次松弛都会使某些顶点的最短距离变得更优
     # 进行 |V|-1 次可以确保所有顶点的最短距离最终确定
     for _ in range(len(vertices) - 1):
+        updated = False
         # 遍历每条边 (u, v)
         for u, v, weight in edges:
             # 如果通过u到v的路径更短，则更新dist和pred
@@ -44,6 +53,10 @@ def Bellman_Ford(G, s):
             if dist[u] + weight < dist[v]:
                 dist[v] = dist[u] + weight
                 pred[v] = u
+                updated = True
+        # 本轮没有任何松弛发生，说明最短距离已经确定，可以提前结束
+        if not updated:
+            break
     
     # 负环检测：再进行一次遍历
     # 如果还能松弛，说明存在负权环
@@ -89,32 +102,33 @@ def reconstruct_path(pred, s, t):
     return " -> ".join(reversed(path))
 
 
-# 测试图（有向带权图）
-G = {
-    "s": {"t": 8, "y": 5},
-    "t": {"x": 1, "y": 2},
-    "x": {"z": 4},
-    "y": {"t": 3, "x": 9, "z": 2},
-    "z": {"x": 6}
-}
+if __name__ == "__main__":
+    # 测试图（有向带权图）
+    G = {
+        "s": {"t": 8, "y": 5},
+        "t": {"x": 1, "y": 2},
+        "x": {"z": 4},
+        "y": {"t": 3, "x": 9, "z": 2},
+        "z": {"x": 6}
+    }
 
-# 执行Bellman-Ford算法，源点为"s"
-distances, predecessors = Bellman_Ford(G, s="s")
+    # 执行Bellman-Ford算法，源点为"s"
+    distances, predecessors = Bellman_Ford(G, s="s")
 
-# 打印结果
-if distances is not None:
-    print("从源点's'出发的最短距离:")
-    for vertex in sorted(G.keys()):
-        print(f"  到 {vertex}: 距离 = {distances[vertex]}")
-    
-    print("\n前驱节点（用于重构路径）:")
-    for vertex in sorted(G.keys()):
-        if predecessors[vertex] is not None:
-            print(f"  {vertex} <- {predecessors[vertex]}")
-        else:
-            print(f"  {vertex} <- None (源点)")
-    
-    # 示例：重构从s到z的路径
-    print(f"\n从s到z的最短路径: {reconstruct_path(predecessors, 's', 'z')}")
-else:
-    print("算法检测到图中存在负权环")
\ No newline at end of file
+    # 打印结果
+    if distances is not None:
+        print("从源点's'出发的最短距离:")
+        for vertex in sorted(G.keys()):
+            print(f"  到 {vertex}: 距离 = {distances[vertex]}")
+    
+        print("\n前驱节点（用于重构路径）:")
+        for vertex in sorted(G.keys()):
+            if predecessors[vertex] is not None:
+                print(f"  {vertex} <- {predecessors[vertex]}")
+            else:
+                print(f"  {vertex} <- None (源点)")
+    
+        # 示例：重构从s到z的路径
+        print(f"\n从s到z的最短路径: {reconstruct_path(predecessors, 's', 'z')}")
+    else:
+        print("算法检测到图中存在负权环")
\ No newline at end of file
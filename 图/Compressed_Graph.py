@@ -0,0 +1,408 @@
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from Union_Find import UnionFind
+
+
+def varint_length(values):
+    """每个非负整数编码成变长整数后占的字节数"""
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        nbytes += values >= np.uint64(1 << (7 * k))
+    return nbytes
+
+def varint_encode(values):
+    """
+    把非负整数数组编码为变长整数（LEB128）：每字节7位数据，最高位表示后面还有字节
+
+    参数:
+        values: 非负整数数组
+
+    返回:
+        ndarray: uint8字节数组
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    nbytes = varint_length(values)
+    start = np.zeros(len(values), dtype=np.int64)
+    np.cumsum(nbytes[:-1], out=start[1:])
+    out = np.empty(int(nbytes.sum()), dtype=np.uint8)
+    for k in range(int(nbytes.max(initial=0))):
+        has = nbytes > k
+        byte = (values[has] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (nbytes[has] > k + 1).astype(np.uint64) << np.uint64(7)
+        out[start[has] + k] = byte | more
+    return out
+
+def varint_decode(data):
+    """
+    解码变长整数字节数组
+
+    返回:
+        ndarray: uint64数组
+    """
+    data = np.asarray(data, dtype=np.uint8)
+    if len(data) == 0:
+        return np.zeros(0, dtype=np.uint64)
+    last = (data & 0x80) == 0                      # 每个整数的最后一个字节
+    value_id = np.zeros(len(data), dtype=np.int64)
+    np.cumsum(last[:-1], out=value_id[1:])
+    starts = np.flatnonzero(np.concatenate(([True], last[:-1])))
+    shift = (np.arange(len(data)) - starts[value_id]) * 7
+    parts = (data & 0x7F).astype(np.uint64) << shift.astype(np.uint64)
+    return np.add.reduceat(parts, starts)
+
+
+class CompressedGraph:
+    """
+    压缩邻接表：邻居列表排序后做差分（gap）编码，再用变长整数按块存储
+
+    每B个顶点为一块，块内先存B个度数，再依次存各顶点的邻居：第一个邻居与顶点编号之差
+    （zigzag编码成非负数），之后是相邻邻居之差。块的字节偏移单独保存，
+    因此可以随机访问任意一块；解码一块是几次NumPy向量运算，
+    最近解码过的块保存在LRU缓存中
+    """
+    def __init__(self, indptr, indices, block=64, cache_blocks=1024):
+        """
+        参数:
+            indptr, indices: CSR数组（例如 Graph.csr() 的前两项）
+            block: 每块的顶点数
+            cache_blocks: 解码缓存最多保存的块数
+        """
+        indptr = np.asarray(indptr, dtype=np.int64)
+        indices = np.asarray(indices, dtype=np.int64)
+        self.n = len(indptr) - 1
+        self.m = len(indices)
+        self.block = block
+        self.cache_blocks = cache_blocks
+        self._cache = OrderedDict()
+
+        n = self.n
+        degree = np.diff(indptr)
+        row = np.repeat(np.arange(n), degree)
+        order = np.lexsort((indices, row))  # 每行邻居升序
+        indices = indices[order]
+
+        # 差分：每行第一个邻居相对顶点编号，之后相对前一个邻居
+        gaps = np.diff(indices, prepend=0)
+        first = indptr[:-1][degree > 0]
+        delta = indices[first] - row[first]
+        gaps[first] = np.where(delta >= 0, 2 * delta, -2 * delta - 1)  # zigzag
+
+        # 每块的数据：块内各顶点的度数，接着块内所有顶点的差分序列
+        n_blocks = (n + block - 1) // block
+        block_of_value = np.concatenate([np.arange(n) // block, row // block])
+        kind = np.concatenate([np.zeros(n, dtype=np.int64), np.ones(self.m, dtype=np.int64)])
+        position = np.concatenate([np.arange(n), np.arange(self.m)])
+        values = np.concatenate([degree, gaps])
+        layout = np.lexsort((position, kind, block_of_value))
+        encoded_values = values[layout]
+
+        encoded = varint_encode(encoded_values)
+        # 每个整数占的字节数，用来求各块的起始字节偏移
+        value_bytes = varint_length(encoded_values)
+        block_bytes = np.bincount(block_of_value[layout], weights=value_bytes, minlength=n_blocks)
+        self.offsets = np.zeros(n_blocks + 1, dtype=np.int64)
+        np.cumsum(block_bytes.astype(np.int64), out=self.offsets[1:])
+        self.data = encoded
+
+    def nbytes(self):
+        """压缩表示占用的字节数"""
+        return self.data.nbytes + self.offsets.nbytes
+
+    def decode_block(self, b):
+        """
+        解码第b块（带LRU缓存）
+
+        返回:
+            tuple: (ptr, nbrs)，块内第i个顶点的邻居为 nbrs[ptr[i]:ptr[i+1]]
+        """
+        cache = self._cache
+        if b in cache:
+            cache.move_to_end(b)
+            return cache[b]
+        cache[b] = self._decode(b)
+        if len(cache) > self.cache_blocks:
+            cache.popitem(last=False)
+        return cache[b]
+
+    def _decode(self, b):
+        """解码第b块（不经过缓存）"""
+        values = varint_decode(self.data[self.offsets[b]:self.offsets[b + 1]]).astype(np.int64)
+        lo = b * self.block
+        count = min(self.block, self.n - lo)
+        degree = values[:count]
+        gaps = values[count:]
+        ptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(degree, out=ptr[1:])
+
+        # 还原每行第一个邻居（zigzag解码后加上顶点编号），再做分段前缀和
+        starts = ptr[:-1][degree > 0]
+        z = gaps[starts]
+        gaps[starts] = np.where(z & 1, -(z + 1) // 2, z // 2) + lo + np.flatnonzero(degree > 0)
+        total = np.cumsum(gaps)
+        base = np.repeat(total[starts] - gaps[starts], degree[degree > 0])
+        nbrs = total - base
+        return ptr, nbrs
+
+    def neighbors(self, u):
+        """返回顶点u的邻居数组（升序）"""
+        ptr, nbrs = self.decode_block(u // self.block)
+        i = u % self.block
+        return nbrs[ptr[i]:ptr[i + 1]]
+
+    def neighbors_many(self, us):
+        """
+        批量取邻居：按块分组，每块只解码一次
+
+        返回:
+            tuple: (sources, targets)，所有边 us[k] -> 邻居
+        """
+        us = np.unique(np.asarray(us, dtype=np.int64))
+        sources, targets = [], []
+        blocks = us // self.block
+        cut = np.flatnonzero(np.diff(blocks)) + 1
+        for group in np.split(us, cut):
+            if len(group) == 0:
+                continue
+            ptr, nbrs = self.decode_block(int(group[0]) // self.block)
+            local = group % self.block
+            degree = ptr[local + 1] - ptr[local]
+            offset = np.repeat(ptr[local] - np.concatenate(([0], np.cumsum(degree)[:-1])), degree)
+            targets.append(nbrs[np.arange(degree.sum()) + offset])
+            sources.append(np.repeat(group, degree))
+        if not sources:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(sources), np.concatenate(targets)
+
+    def blocks(self):
+        """依次产生每一块的所有边 (sources, targets)"""
+        for b in range(len(self.offsets) - 1):
+            ptr, nbrs = self.decode_block(b)
+            lo = b * self.block
+            yield np.repeat(np.arange(lo, lo + len(ptr) - 1), np.diff(ptr)), nbrs
+
+    def _source_blocks(self):
+        """依次产生每一块的所有边 (sources, targets)，不经过缓存（用于整图扫描）"""
+        for b in range(len(self.offsets) - 1):
+            ptr, nbrs = self._decode(b)
+            lo = b * self.block
+            yield np.repeat(np.arange(lo, lo + len(ptr) - 1), np.diff(ptr)), nbrs
+
+    @staticmethod
+    def _reverse_gaps(sources, targets, last):
+        """
+        一块边在反向图中的差分值
+
+        按起点升序扫描各块时，每个目标的入边起点天然是升序的，因此只需记住每个目标上一次
+        出现的起点 last[t]（-1表示还没有出现过），就能直接算出反向邻居列表的差分
+
+        返回:
+            tuple: (targets, gaps, first)，按 (目标, 起点) 排序；first标记每个目标在本块中的第一条边
+        """
+        order = np.lexsort((sources, targets))
+        sources, targets = sources[order], targets[order]
+        first = np.ones(len(targets), dtype=bool)
+        first[1:] = targets[1:] != targets[:-1]
+        prev = np.empty_like(sources)
+        prev[1:] = sources[:-1]
+        prev[first] = last[targets[first]]
+        gaps = sources - prev
+        # 整行的第一个邻居：相对顶点编号，zigzag编码
+        head = first & (prev == -1)
+        delta = sources[head] - targets[head]
+        gaps[head] = np.where(delta >= 0, 2 * delta, -2 * delta - 1)
+        final = np.ones(len(targets), dtype=bool)
+        final[:-1] = first[1:]
+        last[targets[final]] = sources[final]
+        return targets, gaps, first
+
+    def transpose(self):
+        """
+        反向图的压缩表示，流式构建，不会解码出整个边表
+
+        第一遍逐块扫描，统计反向图每行的度数和差分编码后的字节数，由此算出每块、每行的字节位置；
+        第二遍再逐块扫描，把反向差分直接写到压缩数组中的对应位置。
+        除结果外只需要几个长度为n的数组和一块边的临时空间
+        """
+        n, B = self.n, self.block
+        n_blocks = len(self.offsets) - 1
+
+        # 第一遍：反向图每行的度数和字节数
+        in_degree = np.zeros(n, dtype=np.int64)
+        row_bytes = np.zeros(n, dtype=np.int64)
+        last = np.full(n, -1, dtype=np.int64)
+        for sources, targets in self._source_blocks():
+            if len(targets) == 0:
+                continue
+            targets, gaps, first = self._reverse_gaps(sources, targets, last)
+            starts = np.flatnonzero(first)
+            in_degree[targets[starts]] += np.diff(np.append(starts, len(targets)))
+            row_bytes[targets[starts]] += np.add.reduceat(varint_length(gaps), starts)
+
+        # 每块：先是块内各顶点的度数，再是各行的差分
+        header = varint_encode(in_degree)
+        degree_bytes = varint_length(in_degree)
+        block_of = np.arange(n) // B
+        header_bytes = np.bincount(block_of, weights=degree_bytes, minlength=n_blocks).astype(np.int64)
+        block_bytes = header_bytes + np.bincount(block_of, weights=row_bytes, minlength=n_blocks).astype(np.int64)
+        offsets = np.zeros(n_blocks + 1, dtype=np.int64)
+        np.cumsum(block_bytes, out=offsets[1:])
+        data = np.empty(offsets[-1], dtype=np.uint8)
+
+        header_start = np.zeros(n_blocks, dtype=np.int64)
+        np.cumsum(header_bytes[:-1], out=header_start[1:])
+        data[np.arange(len(header)) + np.repeat(offsets[:-1] - header_start, header_bytes)] = header
+        # 每行差分的写入位置：所在块的起点 + 度数部分 + 块内前面各行的字节数
+        row_start = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(row_bytes, out=row_start[1:])
+        cursor = (offsets[:-1] + header_bytes)[block_of] + row_start[:-1] - row_start[block_of * B]
+        del row_bytes, row_start
+
+        # 第二遍：逐块写入反向差分
+        last[:] = -1
+        for sources, targets in self._source_blocks():
+            if len(targets) == 0:
+                continue
+            targets, gaps, first = self._reverse_gaps(sources, targets, last)
+            encoded = varint_encode(gaps)
+            nbytes = varint_length(gaps)
+            value_start = np.zeros(len(gaps), dtype=np.int64)
+            np.cumsum(nbytes[:-1], out=value_start[1:])
+            starts = np.flatnonzero(first)
+            group = np.cumsum(first) - 1
+            # 同一目标的字节在encoded中连续，整段平移到cursor[目标]
+            shift = cursor[targets[starts]] - value_start[starts]
+            data[np.arange(len(encoded)) + np.repeat(shift[group], nbytes)] = encoded
+            cursor[targets[starts]] += np.add.reduceat(nbytes, starts)
+
+        R = CompressedGraph.__new__(CompressedGraph)
+        R.n, R.m, R.block, R.cache_blocks = n, self.m, B, self.cache_blocks
+        R._cache = OrderedDict()
+        R.offsets, R.data = offsets, data
+        return R
+
+def BFS_Compressed(C, s):
+    """
+    在压缩图上按层BFS：每一层的所有前沿顶点按块批量解码邻居
+
+    返回:
+        ndarray: 各顶点到s的距离，不可达为-1
+    """
+    dist = np.full(C.n, -1, dtype=np.int64)
+    dist[s] = 0
+    frontier = np.array([s], dtype=np.int64)
+    level = 0
+    while len(frontier):
+        level += 1
+        _, targets = C.neighbors_many(frontier)
+        targets = np.unique(targets)
+        frontier = targets[dist[targets] == -1]
+        dist[frontier] = level
+    return dist
+
+def Connected_Components_Compressed(C):
+    """
+    在压缩图上求（弱）连通分量：逐块解码边，交给并查集
+
+    返回:
+        ndarray: 每个顶点所在分量的代表顶点
+    """
+    uf = UnionFind(C.n)
+    for sources, targets in C.blocks():
+        uf.union_many(sources, targets)
+    return uf.components()
+
+def SCC_Compressed(C):
+    """
+    在压缩图上用Kosaraju算法求强连通分量（迭代DFS，不会递归爆栈）
+
+    返回:
+        list: 强连通分量列表，每个分量是一个顶点编号列表
+    """
+    n = C.n
+    visited = bytearray(n)
+    finish_order = []
+    for root in range(n):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        stack = [(root, iter(C.neighbors(root).tolist()))]
+        while stack:
+            v, it = stack[-1]
+            for w in it:
+                if not visited[w]:
+                    visited[w] = 1
+                    stack.append((w, iter(C.neighbors(w).tolist())))
+                    break
+            else:
+                stack.pop()
+                finish_order.append(v)
+
+    R = C.transpose()
+    visited = bytearray(n)
+    components = []
+    for root in reversed(finish_order):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        component = [root]
+        queue = deque([root])
+        while queue:
+            v = queue.popleft()
+            for w in R.neighbors(v).tolist():
+                if not visited[w]:
+                    visited[w] = 1
+                    component.append(w)
+                    queue.append(w)
+        components.append(component)
+    return components
+
+
+if __name__ == "__main__":
+    import time
+    from Strongly_Connected_Component import Strongly_Connected_Component
+    from Vertex_Reordering import csr_arrays, Reorder
+
+    # 与Strongly_Connected_Component.py相同的示例图（顶点编号减1）
+    G = {0: [9, 2], 1: [5], 2: [3, 6], 3: [0, 5], 4: [1], 5: [4], 6: [6], 7: [8, 9], 8: [6, 7], 9: [0]}
+    indptr, indices, _, _ = csr_arrays(G)
+    C = CompressedGraph(indptr, indices, block=4)
+    print(f"压缩图上的强连通分量: {SCC_Compressed(C)}")
+    print(f"Kosaraju:             {Strongly_Connected_Component(G)}")
+    print(f"从0出发的BFS距离: {BFS_Compressed(C, 0).tolist()}")
+
+    # 大规模图：随机几何图（邻居在空间上相近），先按RCM重新编号
+    rng = np.random.default_rng(0)
+    n, k = 100000, 8
+    x = rng.random(n)
+    order = np.argsort(x)
+    sources = np.repeat(np.arange(n), k)
+    targets = order[np.clip(np.searchsorted(x[order], x)[:, None] + rng.integers(-50, 50, (n, k)), 0, n - 1)].ravel()
+    key = np.unique(sources[sources != targets] * n + targets[sources != targets])  # 去掉自环和重边
+    sources, targets = key // n, key % n
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    indices = targets[np.argsort(sources, kind="stable")]
+
+    for name, (ip, ix) in (("原始编号", (indptr, indices)),
+                           ("RCM编号", (lambda R: (R.indptr, R.indices))(
+                               Reorder({u: indices[indptr[u]:indptr[u + 1]].tolist() for u in range(n)}, "rcm")))):
+        start = time.perf_counter()
+        C = CompressedGraph(ip, ix)
+        build = time.perf_counter() - start
+        csr_bytes = ip.nbytes + ix.nbytes
+        print(f"\n{name}: {n}个顶点 {len(ix)}条边，CSR {csr_bytes / 2 ** 20:.1f}MB，"
+              f"压缩后 {C.nbytes() / 2 ** 20:.1f}MB（{csr_bytes / C.nbytes():.1f}倍），构建 {build:.3f}s")
+
+        start = time.perf_counter()
+        dist = BFS_Compressed(C, 0)
+        print(f"  BFS: 可达 {(dist >= 0).sum()} 个顶点，用时 {time.perf_counter() - start:.3f}s")
+        start = time.perf_counter()
+        labels = Connected_Components_Compressed(C)
+        print(f"  连通分量: {len(np.unique(labels))} 个，用时 {time.perf_counter() - start:.3f}s")
+        start = time.perf_counter()
+        scc = SCC_Compressed(C)
+        print(f"  强连通分量: {len(scc)} 个，最大 {max(map(len, scc))}，用时 {time.perf_counter() - start:.3f}s")
@@ -2,6 +2,8 @@ import heapq
 import numpy as np
 from collections import defaultdict
 
+from Graph_Store import Graph
+
 def Dijkstra_PriQueue(G, source):
     """
     Dijkstra算法：使用优先队列优化的单源最短路径
@@ -18,10 +20,13 @@ def Dijkstra_PriQueue(G, source):
     if not G or source not in G:
         return {}, {}
     
-    # 获取所有顶点（包括只有入边的顶点）
-    all_vertices = set(G.keys())
-    for neighbors in G.values():
-        all_vertices.update(neighbors.keys())
+    # 获取所有顶点（包括只有入边的顶点）；Graph直接使用缓存的顶点列表
+    if isinstance(G, Graph):
+        all_vertices = G.vertices()
+    else:
+        all_vertices = set(G.keys())
+        for neighbors in G.values():
+            all_vertices.update(neighbors.keys())
     
     # 初始化
     color = {v: "white" for v in all_vertices}  # white=未访问, black=已确定最短距离
@@ -84,35 +89,36 @@ def reconstruct_path(pred, source, target):
     return " -> ".join(reversed(path))
 
 
-# 测试图（有向带权图）
-G = {
-    "s": {"t": 8, "y": 5},
-    "t": {"x": 1, "y": 2},
-    "x": {"z": 4},
-    "y": {"t": 3, "x": 9, "z": 2},
-    "z": {"x": 6}
-}
+if __name__ == "__main__":
+    # 测试图（有向带权图）
+    G = {
+        "s": {"t": 8, "y": 5},
+        "t": {"x": 1, "y": 2},
+        "x": {"z": 4},
+        "y": {"t": 3, "x": 9, "z": 2},
+        "z": {"x": 6}
+    }
 
-# 执行Dijkstra算法，源点为"s"
-distances, predecessors = Dijkstra_PriQueue(G, source="s")
+    # 执行Dijkstra算法，源点为"s"
+    distances, predecessors = Dijkstra_PriQueue(G, source="s")
 
-# 打印结果
-print("从源点's'出发的最短距离:")
-for vertex in sorted(G.keys()):
-    print(f"  到 {vertex}: 距离 = {distances[vertex]}")
+    # 打印结果
+    print("从源点's'出发的最短距离:")
+    for vertex in sorted(G.keys()):
+        print(f"  到 {vertex}: 距离 = {distances[vertex]}")
 
-print("\n前驱节点（用于重构路径）:")
-for vertex in sorted(G.keys()):
-    if predecessors[vertex] is not None:
-        print(f"  {vertex} <- {predecessors[vertex]}")
-    else:
-        print(f"  {vertex} <- None (源点)")
+    print("\n前驱节点（用于重构路径）:")
+    for vertex in sorted(G.keys()):
+        if predecessors[vertex] is not None:
+            print(f"  {vertex} <- {predecessors[vertex]}")
+        else:
+            print(f"  {vertex} <- None (源点)")
 
-# 示例：重构从s到x的最短路径
-print(f"\n从s到x的最短路径: {reconstruct_path(predecessors, 's', 'x')}")
-print(f"从s到z的最短路径: {reconstruct_path(predecessors, 's', 'z')}")
+    # 示例：重构从s到x的最短路径
+    print(f"\n从s到x的最短路径: {reconstruct_path(predecessors, 's', 'x')}")
+    print(f"从s到z的最短路径: {reconstruct_path(predecessors, 's', 'z')}")
 
-# 验证算法正确性：检查s到x的路径
-# 预期：s(0) -> y(5) -> t(5+3=8) -> x(8+1=9)
-# 实际输出应为9
-assert abs(distances['x'] - 9) < 0.001, "s到x的距离应为9"
\ No newline at end of file
+    # 验证算法正确性：检查s到x的路径
+    # 预期：s(0) -> y(5) -> t(5+3=8) -> x(8+1=9)
+    # 实际输出应为9
+    assert abs(distances['x'] - 9) < 0.001, "s到x的距离应为9"
\ No newline at end of file
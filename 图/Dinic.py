@@ -0,0 +1,218 @@
+from collections import defaultdict, deque
+
+
+def build_residual(G):
+    """
+    把 {起点: {终点: 容量}} 格式的网络转换为数组形式的残差图
+
+    第e条边与第e^1条边互为反向边：正向边初始残差为容量，反向边初始残差为0，
+    增广时只需 cap[e] -= f, cap[e ^ 1] += f，不再用(u, v)元组做字典查找
+
+    参数:
+        G: 网络的邻接表表示，格式为 {起点: {终点: 容量}}
+
+    返回:
+        tuple: (vertices, vertex_to_index, to, cap, adj)
+               vertices: 顶点列表（索引 -> 顶点）
+               vertex_to_index: 顶点 -> 索引
+               to: to[e] 为边e的终点索引
+               cap: cap[e] 为边e的残差容量
+               adj: adj[u] 为从u出发的边编号列表（含反向边）
+    """
+    vertices = list(G.keys())
+    seen = set(vertices)
+    for neighbors in G.values():
+        for v in neighbors:
+            if v not in seen:
+                seen.add(v)
+                vertices.append(v)
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+
+    to = []
+    cap = []
+    adj = [[] for _ in vertices]
+    for u, neighbors in G.items():
+        i = vertex_to_index[u]
+        for v, capacity in neighbors.items():
+            j = vertex_to_index[v]
+            adj[i].append(len(to))
+            to.append(j)
+            cap.append(capacity)
+            adj[j].append(len(to))
+            to.append(i)
+            cap.append(0)
+
+    return vertices, vertex_to_index, to, cap, adj
+
+
+def residual_to_flow(G, vertex_to_index, cap):
+    """
+    从残差图还原与Ford_Fulkerson相同格式的流量字典
+
+    参数:
+        G: 原网络
+        vertex_to_index: 顶点 -> 索引
+        cap: 残差容量数组（边的编号与build_residual一致）
+
+    返回:
+        defaultdict: 键为(起点, 终点)，值为净流量，满足 flow[(v, u)] = -flow[(u, v)]
+    """
+    flow = defaultdict(int)
+    e = 0
+    for u, neighbors in G.items():
+        for v in neighbors:
+            f = cap[e ^ 1]  # 反向边的残差 = 正向边上的流量
+            flow[(u, v)] += f
+            flow[(v, u)] -= f
+            e += 2
+    return flow
+
+
+def Dinic_Augment(to, cap, adj, si, ti, limit=float('inf')):
+    """
+    在数组形式的残差图上，从当前流出发用Dinic算法继续增广
+
+    参数:
+        to, cap, adj: 数组形式的残差图（见build_residual），cap被原地修改
+        si: 源点索引
+        ti: 汇点索引
+        limit: 最多增加的流量，默认不限
+
+    返回:
+        增加的流量
+    """
+    n = len(adj)
+
+    max_flow = 0
+    while max_flow < limit:
+        # 第一步：BFS构建分层图，level[v]为s到v的残差图最短距离
+        level = [-1] * n
+        level[si] = 0
+        queue = deque([si])
+        while queue:
+            u = queue.popleft()
+            for e in adj[u]:
+                v = to[e]
+                if cap[e] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+
+        # 汇点不可达，说明不存在增广路径
+        if level[ti] < 0:
+            break
+
+        # 第二步：在分层图上用迭代DFS求阻塞流
+        # it[u]为当前弧指针：adj[u]中it[u]之前的边都已经不可用，不再重复检查
+        it = [0] * n
+        path = []  # 当前路径上的边编号
+        u = si
+        while True:
+            if u == ti:
+                # 找到一条增广路径，沿路径推送瓶颈流量
+                f = min(min(cap[e] for e in path), limit - max_flow)
+                for e in path:
+                    cap[e] -= f
+                    cap[e ^ 1] += f
+                max_flow += f
+                if max_flow >= limit:
+                    return max_flow
+                # 回退到第一条被饱和的边的起点，继续从那里寻找
+                k = 0
+                while cap[path[k]] > 0:
+                    k += 1
+                del path[k:]
+                u = to[path[-1]] if path else si
+                continue
+
+            arcs = adj[u]
+            p = it[u]
+            next_level = level[u] + 1
+            while p < len(arcs):
+                e = arcs[p]
+                if cap[e] > 0 and level[to[e]] == next_level:
+                    break
+                p += 1
+            it[u] = p
+
+            if p < len(arcs):
+                # 沿可行弧前进
+                path.append(arcs[p])
+                u = to[arcs[p]]
+            else:
+                # 死路：从分层图中删除u，退回上一个顶点并跳过这条弧
+                if u == si:
+                    break
+                level[u] = -1
+                e = path.pop()
+                u = to[e ^ 1]
+                it[u] += 1
+
+    return max_flow
+
+
+def Dinic(G, s, t):
+    """
+    Dinic算法：分层图 + 阻塞流求最大流，复杂度 O(V²E)，
+    在单位容量网络（如二分图匹配）上为 O(E√V)
+
+    参数:
+        G: 网络的邻接表表示，格式为 {起点: {终点: 容量}}
+        s: 源点
+        t: 汇点
+
+    返回:
+        tuple: (max_flow, flow_dict)
+               max_flow: 最大流值
+               flow_dict: 字典，键为(起点, 终点)，值为当前流量（与Ford_Fulkerson相同，可直接用于min_cut）
+    """
+    vertices, vertex_to_index, to, cap, adj = build_residual(G)
+    if s not in vertex_to_index or t not in vertex_to_index or s == t:
+        return 0, defaultdict(int)
+    max_flow = Dinic_Augment(to, cap, adj, vertex_to_index[s], vertex_to_index[t])
+    return max_flow, residual_to_flow(G, vertex_to_index, cap)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from Ford_Fulkerson import Ford_Fulkerson, min_cut
+
+    # 示例网络（与Ford_Fulkerson.py相同）
+    G = {
+        "s": {"v1": 12, "v2": 14},
+        "v1": {"v3": 10},
+        "v2": {"v1": 5, "v3": 11, "v4": 6},
+        "v3": {"v4": 5, "t": 14},
+        "v4": {"t": 11},
+        "t": {}
+    }
+
+    max_flow, flow_dict = Dinic(G, "s", "t")
+    print(f"Dinic最大流值: {max_flow}")
+    print(f"Ford-Fulkerson最大流值: {Ford_Fulkerson(G, 's', 't')[0]}")
+
+    source_side = min_cut(G, flow_dict, "s")
+    cut_capacity = sum(G[u][v] for u in source_side for v in G.get(u, {}) if v not in source_side)
+    print(f"最小割源点侧: {sorted(source_side)}，割的容量: {cut_capacity}")
+
+    # 二分图分配网络：s -> 工人 -> 任务 -> t，单位容量
+    random.seed(0)
+    n_workers = 300
+    B = {"s": {("L", i): 1 for i in range(n_workers)}}
+    for i in range(n_workers):
+        B[("L", i)] = {("R", j): 1 for j in random.sample(range(n_workers), 5)}
+    for j in range(n_workers):
+        B[("R", j)] = {"t": 1}
+    B["t"] = {}
+
+    start = time.perf_counter()
+    dinic_flow, _ = Dinic(B, "s", "t")
+    dinic_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ff_flow, _ = Ford_Fulkerson(B, "s", "t")
+    ff_time = time.perf_counter() - start
+
+    print(f"\n二分图分配网络（{n_workers}个工人，{n_workers}个任务）:")
+    print(f"  Dinic:          最大流={dinic_flow}，用时 {dinic_time:.3f}s")
+    print(f"  Ford-Fulkerson: 最大流={ff_flow}，用时 {ff_time:.3f}s")
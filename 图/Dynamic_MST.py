@@ -0,0 +1,347 @@
+from MST_Kruskal import MST_Kruskal
+
+
+class LinkCutTree:
+    """
+    Link-Cut树：维护一片有根森林，支持连边、删边和路径最大值查询，均摊 O(log n)
+
+    每个节点带一个权值，query_max(u, v) 返回u到v路径上权值最大的节点。
+    节点用整数编号，左右孩子、父节点、翻转标记和子树最大值都存放在列表中，
+    所有操作都是迭代实现
+    """
+    def __init__(self):
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []     # 懒标记：该splay子树需要左右翻转
+        self.value = []
+        self.best = []     # best[x]: x所在splay子树中权值最大的节点
+
+    def add_node(self, value):
+        """新增一个孤立节点，返回其编号"""
+        x = len(self.value)
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(x)
+        return x
+
+    def set_value(self, x, value):
+        """修改节点x的权值"""
+        self._splay_to_top(x)
+        self.value[x] = value
+        self._update(x)
+
+    def connected(self, u, v):
+        return u == v or self.find_root(u) == self.find_root(v)
+
+    def find_root(self, x):
+        """返回x所在树的根"""
+        self._access(x)
+        self._splay(x)
+        left = self.left
+        while True:
+            self._push(x)
+            if left[x] == -1:
+                break
+            x = left[x]
+        self._splay(x)
+        return x
+
+    def link(self, u, v):
+        """连接u和v（两者必须在不同的树中）"""
+        self._make_root(u)
+        self.parent[u] = v
+
+    def cut(self, u, v):
+        """删除树边(u, v)"""
+        self._make_root(u)
+        self._access(v)
+        self._splay(v)
+        # 此时u是v在splay中的左孩子，且u没有右孩子
+        self.left[v] = -1
+        self.parent[u] = -1
+        self._update(v)
+
+    def query_max(self, u, v):
+        """返回u到v路径上权值最大的节点（u和v必须连通）"""
+        self._make_root(u)
+        self._access(v)
+        self._splay(v)
+        return self.best[v]
+
+    # ---------- 内部操作 ----------
+
+    def _is_splay_root(self, x):
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _update(self, x):
+        best, value = self.best, self.value
+        b = x
+        for c in (self.left[x], self.right[x]):
+            if c != -1 and value[best[c]] > value[b]:
+                b = best[c]
+        best[x] = b
+
+    def _push(self, x):
+        if self.flip[x]:
+            left, right, flip = self.left, self.right, self.flip
+            for c in (left[x], right[x]):
+                if c != -1:
+                    left[c], right[c] = right[c], left[c]
+                    flip[c] = not flip[c]
+            flip[x] = False
+
+    def _rotate(self, x):
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+        if not self._is_splay_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] != -1:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] != -1:
+                parent[left[x]] = p
+            left[x] = p
+        parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+        # 先从splay根向下下放翻转标记
+        path = [x]
+        y = x
+        while not self._is_splay_root(y):
+            y = self.parent[y]
+            path.append(y)
+        for y in reversed(path):
+            self._push(y)
+
+        parent = self.parent
+        while not self._is_splay_root(x):
+            p = parent[x]
+            if not self._is_splay_root(p):
+                g = parent[p]
+                # 同侧先转父节点（zig-zig），异侧先转自己（zig-zag）
+                if (self.left[g] == p) == (self.left[p] == x):
+                    self._rotate(p)
+                else:
+                    self._rotate(x)
+            self._rotate(x)
+
+    def _splay_to_top(self, x):
+        self._access(x)
+        self._splay(x)
+
+    def _access(self, x):
+        """把根到x的路径变成一条偏好路径"""
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        """把x变成所在树的根：打通路径后整体翻转"""
+        self._access(x)
+        self.left[x], self.right[x] = self.right[x], self.left[x]
+        self.flip[x] = not self.flip[x]
+
+
+class DynamicMST:
+    """
+    支持加边和降低边权的动态最小生成树（森林）
+
+    树中的每条边也作为Link-Cut树中的一个节点，权值为边权，顶点节点权值为-inf，
+    因此路径最大值查询直接给出路径上最重的树边。加入边(u, v, w)时：
+    u和v不连通则直接连上；否则找到u-v树路径上最重的边，若比w重就用新边替换它。
+    只有加边和降权时，不在树中的边以后也不会重新进入树，不需要保存，
+    每次更新均摊 O(log n)
+    """
+    def __init__(self, G=None):
+        """
+        参数:
+            G: 可选，初始无向带权图，格式为 {顶点: {邻居: 权重}}；
+               先用MST_Kruskal求出初始最小生成树
+        """
+        self.lct = LinkCutTree()
+        self.node = {}          # 顶点 -> Link-Cut树节点编号
+        self.tree_edge = {}     # (u, v) 规范化的顶点对 -> 边节点编号
+        self.edge_of = {}       # 边节点编号 -> (u, v, w)
+        self.free_nodes = []    # 被替换下来、可以复用的边节点
+        self.total_weight = 0
+
+        if G:
+            for u in G:
+                self._vertex(u)
+                for v in G[u]:
+                    self._vertex(v)
+            mst_edges, _ = MST_Kruskal(G)
+            for u, v, w in mst_edges:
+                self._link(u, v, w)
+
+    def insert_edge(self, u, v, w):
+        """
+        加入边(u, v, w)，顶点不存在时自动加入
+
+        返回:
+            bool: 最小生成树是否发生了变化
+        """
+        if u == v:
+            return False
+        a, b = self._vertex(u), self._vertex(v)
+        key = self._key(u, v)
+        if key in self.tree_edge:
+            # 已经是树边：只有更轻时才更新
+            return self._lower(key, w)
+
+        lct = self.lct
+        if not lct.connected(a, b):
+            self._link(u, v, w)
+            return True
+        heaviest = lct.query_max(a, b)
+        x, y, hw = self.edge_of[heaviest]
+        if hw <= w:
+            return False
+        self._cut(x, y)
+        self._link(u, v, w)
+        return True
+
+    def decrease_weight(self, u, v, w):
+        """
+        把边(u, v)的权重降低为w
+
+        树边降权后树仍然是最小的，只需修改权值；
+        非树边降权等价于以新权重加入这条边
+
+        返回:
+            bool: 最小生成树是否发生了变化
+        """
+        return self.insert_edge(u, v, w)
+
+    def edges(self):
+        """返回当前最小生成树的边列表，格式为 (起点, 终点, 权重)"""
+        return list(self.edge_of.values())
+
+    def _vertex(self, v):
+        if v not in self.node:
+            self.node[v] = self.lct.add_node(float("-inf"))
+        return self.node[v]
+
+    def _key(self, u, v):
+        a, b = self.node[u], self.node[v]
+        return (u, v) if a < b else (v, u)
+
+    def _lower(self, key, w):
+        e = self.tree_edge[key]
+        u, v, old = self.edge_of[e]
+        if w >= old:
+            return False
+        self.lct.set_value(e, w)
+        self.edge_of[e] = (u, v, w)
+        self.total_weight += w - old
+        return True
+
+    def _link(self, u, v, w):
+        lct = self.lct
+        if self.free_nodes:
+            e = self.free_nodes.pop()
+            lct.set_value(e, w)
+        else:
+            e = lct.add_node(w)
+        lct.link(e, self.node[u])
+        lct.link(e, self.node[v])
+        self.tree_edge[self._key(u, v)] = e
+        self.edge_of[e] = (u, v, w)
+        self.total_weight += w
+
+    def _cut(self, u, v):
+        e = self.tree_edge.pop(self._key(u, v))
+        _, _, w = self.edge_of.pop(e)
+        self.lct.cut(e, self.node[u])
+        self.lct.cut(e, self.node[v])
+        self.free_nodes.append(e)
+        self.total_weight -= w
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # 与MST_Kruskal.py相同的测试图
+    G = {
+        "a": {"b": 4, "h": 8},
+        "b": {"a": 4, "h": 1, "c": 8},
+        "c": {"b": 8, "i": 2, "h": 4, "d": 7},
+        "d": {"c": 7, "f": 14, "z": 9},
+        "f": {"g": 2, "c": 4, "d": 14, "z": 10},
+        "g": {"h": 1, "i": 4, "f": 2},
+        "h": {"a": 8, "b": 1, "i": 7, "g": 1},
+        "i": {"c": 2, "h": 7, "g": 4},
+        "z": {"d": 9, "f": 10}
+    }
+    mst = DynamicMST(G)
+    print(f"初始最小生成树总权重: {mst.total_weight}")
+    mst.insert_edge("a", "z", 3)
+    print(f"加入边 a-z(3) 后: {mst.total_weight}")
+    mst.decrease_weight("d", "f", 1)
+    print(f"边 d-f 降权为1后: {mst.total_weight}")
+    G["a"]["z"] = G["z"]["a"] = 3
+    G["d"]["f"] = G["f"]["d"] = 1
+    print(f"重新运行MST_Kruskal: {MST_Kruskal(G)[1]}")
+
+    # 随机加边/降权序列：每一步后与重新运行MST_Kruskal的结果对比
+    random.seed(0)
+    n = 300
+    H = {v: {} for v in range(n)}
+    mst = DynamicMST()
+    consistent = True
+    for step in range(3000):
+        u, v = random.sample(range(n), 2)
+        if v in H[u] and random.random() < 0.5:
+            w = H[u][v] - random.randint(1, 10)
+            mst.decrease_weight(u, v, w)
+        else:
+            w = random.randint(1, 1000)
+            mst.insert_edge(u, v, w)
+        w = min(w, H[u].get(v, w))
+        H[u][v] = H[v][u] = w
+        if step % 100 == 99:
+            consistent &= mst.total_weight == MST_Kruskal(H)[1]
+    print(f"\n3000次随机更新后总权重: {mst.total_weight}，与MST_Kruskal一致: {consistent}")
+
+    # 增量更新与每次重新计算的耗时对比
+    n = 20000
+    H = {v: {} for v in range(n)}
+    for v in range(1, n):
+        u = random.randrange(v)
+        H[u][v] = H[v][u] = random.randint(1, 1000)
+    mst = DynamicMST(H)
+    updates = [(*random.sample(range(n), 2), random.randint(1, 1000)) for _ in range(2000)]
+    start = time.perf_counter()
+    for u, v, w in updates:
+        mst.insert_edge(u, v, w)
+    print(f"{n}个顶点上2000次加边: 动态MST用时 {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    for u, v, w in updates[:20]:
+        w = min(w, H[u].get(v, w))
+        H[u][v] = H[v][u] = w
+        MST_Kruskal(H)
+    elapsed = time.perf_counter() - start
+    print(f"每次重新运行MST_Kruskal: 20次用时 {elapsed:.3f}s（估计2000次 {elapsed * 100:.1f}s）")
@@ -0,0 +1,291 @@
+import numpy as np
+
+from Union_Find import UnionFind
+
+
+class PointGrid:
+    """
+    均匀网格分桶：把2维/3维点放进边长为h的格子里，平均每个格子约k个点
+
+    点按格子编号排序，每个非空格子的点在order中占一段连续区间，
+    用searchsorted就能找到任意格子，只需要 O(n) 的额外内存
+    """
+    def __init__(self, P, k):
+        """
+        参数:
+            P: 点坐标数组，形状为 (n, d)
+            k: 期望的每个格子平均点数
+        """
+        n, d = P.shape
+        lo = P.min(axis=0)
+        span = P.max(axis=0) - lo
+        spread = span > 0
+        if spread.any():
+            h = (np.prod(span[spread]) * k / n) ** (1 / spread.sum())
+            # 限制每一维的格子数，保证格子编号不超出int64
+            h = max(h, span.max() / min(n, 2 ** (62 // d)))
+        else:
+            h = 1.0  # 所有点重合
+
+        self.P = P
+        self.h = h
+        self.cell = np.floor((P - lo) / h).astype(np.int64)  # 每个点所在格子的坐标
+        self.dims = self.cell.max(axis=0) + 1
+        key = np.ravel_multi_index(self.cell.T, self.dims)
+        self.order = np.argsort(key, kind="stable")
+        self.keys, self.starts = np.unique(key[self.order], return_index=True)
+        self.ends = np.append(self.starts[1:], n)
+        self.max_ring = int(self.dims.max())  # 扩展到这一圈时已经覆盖整个网格
+        self._offsets = {}
+
+    def cells(self):
+        """依次返回每个非空格子中的点（编号数组）"""
+        for s, e in zip(self.starts.tolist(), self.ends.tolist()):
+            yield self.order[s:e]
+
+    def ring(self, c, r):
+        """
+        返回与格子c的切比雪夫距离恰好为r的所有非空格子中的点
+
+        扫描完第0..r圈后，与格子c中任一点距离不超过 r*h 的点都已经找到
+        """
+        nb = c + self._ring_offsets(r, len(c))
+        nb = nb[((nb >= 0) & (nb < self.dims)).all(axis=1)]
+        if len(nb) == 0:
+            return self.order[:0]
+        keys = np.ravel_multi_index(nb.T, self.dims)
+        pos = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        pos = pos[self.keys[pos] == keys]
+        return np.concatenate([self.order[s:e] for s, e in
+                               zip(self.starts[pos].tolist(), self.ends[pos].tolist())] or [self.order[:0]])
+
+    def _ring_offsets(self, r, d):
+        if r not in self._offsets:
+            cube = np.indices((2 * r + 1,) * d).reshape(d, -1).T - r
+            self._offsets[r] = cube[np.abs(cube).max(axis=1) == r]
+        return self._offsets[r]
+
+
+def squared_distances(P, A, C):
+    """点集A中每个点到点集C中每个点的距离平方矩阵（逐维累加，避免生成三维的中间数组）"""
+    D = np.zeros((len(A), len(C)))
+    for x in P.T:
+        diff = x[A][:, None] - x[C][None, :]
+        D += diff * diff
+    return D
+
+def knn_graph(P, k, grid=None, chunk=4_000_000):
+    """
+    用网格分桶求每个点的k个最近邻，得到候选边
+
+    对每个格子从第1圈开始向外扩展，直到格子中每个点的第k近邻距离都不超过
+    已扫描范围的半径 r*h，此时结果是精确的k近邻
+
+    参数:
+        P: 点坐标数组，形状为 (n, d)
+        k: 近邻个数
+        grid: 可选，已经建好的PointGrid
+        chunk: 一次计算的距离矩阵最多包含的元素个数
+
+    返回:
+        tuple: (us, vs, ws)，第i个点的k条候选边为 us[i*k:(i+1)*k] 等，ws为欧氏距离
+    """
+    P = np.asarray(P, dtype=float)
+    n = len(P)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+    grid = grid or PointGrid(P, 2 * k)
+
+    vs = np.empty((n, k), dtype=np.int64)
+    ws = np.empty((n, k))
+    for cell in grid.cells():
+        c = grid.cell[cell[0]]
+        rows = max(1, chunk // (len(cell) * 3 ** P.shape[1]))
+        for i in range(0, len(cell), rows):
+            A = cell[i:i + rows]
+            # 第0圈就是当前格子本身，A中的点在其中的位置为 i..i+len(A)-1
+            cand = [grid.ring(c, 0), grid.ring(c, 1)]
+            r = 1
+            while True:
+                C = np.concatenate(cand)
+                D = squared_distances(P, A, C)
+                D[np.arange(len(A)), np.arange(i, i + len(A))] = np.inf  # 排除自身
+                if len(C) > k:
+                    kth = np.partition(D, k - 1, axis=1)[:, k - 1]
+                    if r >= grid.max_ring or (kth <= (r * grid.h) ** 2).all():
+                        break
+                elif r >= grid.max_ring:
+                    break
+                r += 1
+                cand.append(grid.ring(c, r))
+            nearest = np.argpartition(D, k - 1, axis=1)[:, :k]
+            vs[A] = C[nearest]
+            ws[A] = np.sqrt(np.take_along_axis(D, nearest, axis=1))
+
+    return np.repeat(np.arange(n), k), vs.ravel(), ws.ravel()
+
+def nearest_foreign_edges(grid, comp, best=None, active=None, chunk=4_000_000):
+    """
+    Borůvka的一步：为每个连通分量找出到其他分量最近的点对（精确结果）
+
+    每个格子按圈向外扫描，只比较属于其他分量的点；当扫描半径 r*h
+    已经超过该点（或其所在分量）目前找到的最短距离时停止
+
+    参数:
+        grid: PointGrid
+        comp: 每个点所在分量的编号（如并查集的根）
+        best: 可选，(best_w, best_u, best_v) 各分量已知的出边（best_w为长度平方），在此基础上继续改进
+        active: 可选，布尔数组，只为这些点搜索（其他点的最近外部点已经包含在best中）
+
+    返回:
+        tuple: (us, vs, ws)，每个分量一条最短出边
+    """
+    P = grid.P
+    n = len(P)
+    if best is None:
+        best_w = np.full(n, np.inf)          # best_w[c]: 分量c目前最短出边的长度平方
+        best_u = np.full(n, -1, dtype=np.int64)
+        best_v = np.full(n, -1, dtype=np.int64)
+    else:
+        best_w, best_u, best_v = best
+
+    for cell in grid.cells():
+        if active is not None:
+            cell = cell[active[cell]]
+            if len(cell) == 0:
+                continue
+        c = grid.cell[cell[0]]
+        rows = max(1, chunk // (len(cell) * 3 ** P.shape[1]))
+        for i in range(0, len(cell), rows):
+            A = cell[i:i + rows]
+            ca = comp[A]
+            same = ca.min() == ca.max()
+            point_w = np.full(len(A), np.inf)
+            point_v = np.full(len(A), -1, dtype=np.int64)
+            r = 0
+            while True:
+                C = grid.ring(c, r)
+                if same:
+                    C = C[comp[C] != ca[0]]  # 整块点都属于同一分量：先去掉同一分量的点
+                if len(C):
+                    D = squared_distances(P, A, C)
+                    if not same:
+                        D[ca[:, None] == comp[C][None, :]] = np.inf
+                    j = np.argmin(D, axis=1)
+                    d = D[np.arange(len(A)), j]
+                    better = d < point_w
+                    point_w[better] = d[better]
+                    point_v[better] = C[j[better]]
+                if r >= grid.max_ring or (np.minimum(point_w, best_w[ca]) <= (r * grid.h) ** 2).all():
+                    break
+                r += 1
+
+            # 用这些点的结果更新各自分量的最短出边
+            for a, cc, w, v in zip(A.tolist(), ca.tolist(), point_w.tolist(), point_v.tolist()):
+                if w < best_w[cc]:
+                    best_w[cc], best_u[cc], best_v[cc] = w, a, v
+
+    found = best_u >= 0
+    return best_u[found], best_v[found], np.sqrt(best_w[found])
+
+def Euclidean_MST(P, k=10):
+    """
+    欧氏最小生成树（精确）：Borůvka算法，用k近邻表加速"每个分量的最近外部点"，不生成完全图
+
+    1. 网格分桶求每个点的k个最近邻
+    2. 每一轮Borůvka为每个分量找到最短出边：
+       - 近邻表中有其他分量的点时，其中最近的一个就是该点的最近外部点（更远的点不会更近）
+       - 近邻表全在本分量内的点，最近外部点至少与第k近邻一样远，只有这个距离
+         小于分量目前找到的最短出边时才需要在网格上按圈精确搜索
+    3. 按长度顺序把各分量的最短出边交给并查集合并（成环的边被跳过），直到只剩一个分量
+
+    每条加入的边都是某个分量的最短出边，由切分性质结果是精确的欧氏MST
+    （长度相同的边任取一条，成环的等长边由并查集去掉，不影响最优性）。
+    k只影响速度：k越大，需要网格搜索的点越少。内存为 O(nk)
+
+    参数:
+        P: 点坐标数组，形状为 (n, d)，通常 d 为2或3
+        k: 每个点的近邻个数
+
+    返回:
+        tuple: (us, vs, ws)，MST的n-1条边的端点编号和长度，按长度升序
+    """
+    P = np.asarray(P, dtype=float)
+    n = len(P)
+    if n <= 1:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    # 每个格子约2k个点：格子太小时Python层面的循环次数过多，太大时距离矩阵过大
+    grid = PointGrid(P, 2 * min(k, n - 1))
+    _, nbrs, dists = knn_graph(P, k, grid)
+    nbrs = nbrs.reshape(n, -1)
+    dists = dists.reshape(n, -1) ** 2        # 与nearest_foreign_edges一致，使用长度平方
+    kth = dists.max(axis=1)
+    rows = np.arange(n)
+
+    uf = UnionFind(n)
+    us, vs, ws = [], [], []
+    while uf.count > 1:
+        comp = uf.components()
+        # 每个点在近邻表中的最近外部点
+        d = np.where(comp[nbrs] != comp[:, None], dists, np.inf)
+        j = np.argmin(d, axis=1)
+        point_w = d[rows, j]
+        point_v = nbrs[rows, j]
+
+        # 各分量目前的最短出边
+        best_w = np.full(n, np.inf)
+        best_u = np.full(n, -1, dtype=np.int64)
+        best_v = np.full(n, -1, dtype=np.int64)
+        found = np.isfinite(point_w)
+        order = np.lexsort((point_w[found], comp[found]))
+        points = np.flatnonzero(found)[order]
+        first = np.ones(len(points), dtype=bool)
+        first[1:] = comp[points[1:]] != comp[points[:-1]]
+        points = points[first]
+        best_w[comp[points]] = point_w[points]
+        best_u[comp[points]] = points
+        best_v[comp[points]] = point_v[points]
+
+        # 近邻表不够用、又可能比分量当前结果更近的点：在网格上精确搜索
+        active = ~found & (kth < best_w[comp])
+        if active.any():
+            bu, bv, bw = nearest_foreign_edges(grid, comp, (best_w, best_u, best_v), active)
+        else:
+            keep = best_u >= 0
+            bu, bv, bw = best_u[keep], best_v[keep], np.sqrt(best_w[keep])
+
+        order = np.argsort(bw, kind="stable")
+        bu, bv, bw = bu[order], bv[order], bw[order]
+        merged = uf.union_many(bu, bv)
+        us.append(bu[merged])
+        vs.append(bv[merged])
+        ws.append(bw[merged])
+
+    us, vs, ws = np.concatenate(us), np.concatenate(vs), np.concatenate(ws)
+    order = np.argsort(ws, kind="stable")
+    return us[order], vs[order], ws[order]
+
+if __name__ == "__main__":
+    import time
+    from MST_Prim import MST_Prim_Dense
+
+    rng = np.random.default_rng(0)
+
+    # 与稠密Prim的精确结果对比：均匀分布的点和几个相隔很远的簇
+    uniform = rng.random((3000, 2))
+    clusters = np.concatenate([rng.normal(center, 0.01, (500, 3))
+                               for center in ([0, 0, 0], [1, 0, 0], [0, 2, 0], [5, 5, 5])])
+    lattice = rng.integers(0, 12, (2000, 2)).astype(float)  # 整数格点，大量重合点和等长边
+    for name, P in (("均匀分布2维", uniform), ("4个簇3维", clusters), ("格点2维", lattice)):
+        us, vs, ws = Euclidean_MST(P, k=10)
+        _, exact = MST_Prim_Dense(lambda i, js: np.sqrt(((P[js] - P[i]) ** 2).sum(axis=1)), n=len(P))
+        print(f"{name}: {len(P)}个点，树边 {len(ws)}，总长度 {ws.sum():.6f}，稠密Prim {exact:.6f}")
+
+    # 大规模点集
+    for n, d in ((1000000, 2), (200000, 3)):
+        P = rng.random((n, d))
+        start = time.perf_counter()
+        us, vs, ws = Euclidean_MST(P, k=10)
+        print(f"{n}个{d}维随机点: 树边 {len(ws)}，总长度 {ws.sum():.3f}，用时 {time.perf_counter() - start:.3f}s")
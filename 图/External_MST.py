@@ -0,0 +1,169 @@
+import os
+import shutil
+import tempfile
+from itertools import islice
+
+import numpy as np
+
+from Union_Find import UnionFind
+
+# 磁盘上的边记录：两个端点编号和权重，每条边24字节
+EDGE_DTYPE = np.dtype([("u", np.int64), ("v", np.int64), ("w", np.float64)])
+
+
+def read_edge_chunks(path, chunk_edges):
+    """
+    分块读取文本边文件，每行格式为 "u v w"（u、v为非负整数编号）
+
+    参数:
+        path: 边文件路径
+        chunk_edges: 每块最多包含的边数
+
+    返回:
+        生成器，每次产生一个EDGE_DTYPE结构化数组
+    """
+    with open(path) as f:
+        while True:
+            lines = list(islice(f, chunk_edges))
+            if not lines:
+                break
+            raw = np.loadtxt(lines, ndmin=2)
+            chunk = np.empty(len(raw), dtype=EDGE_DTYPE)
+            chunk["u"] = raw[:, 0]
+            chunk["v"] = raw[:, 1]
+            chunk["w"] = raw[:, 2]
+            yield chunk
+
+def merge_runs(run_paths, buffer_edges):
+    """
+    多路归并已按权重排好序的磁盘文件，按块产生全局有序的边
+
+    每路只在内存中保留一个缓冲块。每一步取所有缓冲块最后一个权重的最小值作为界，
+    所有不超过界的边一定已经全部在缓冲区中，把它们一起排序后输出
+
+    参数:
+        run_paths: 各个有序段的.npy文件路径
+        buffer_edges: 每一路缓冲块的边数
+
+    返回:
+        生成器，每次产生一个按权重升序的EDGE_DTYPE数组
+    """
+    runs = [np.load(path, mmap_mode="r") for path in run_paths]
+    pos = [0] * len(runs)
+    buffers = [None] * len(runs)
+
+    def refill(i):
+        buffers[i] = np.array(runs[i][pos[i]:pos[i] + buffer_edges])
+        pos[i] += len(buffers[i])
+
+    for i in range(len(runs)):
+        refill(i)
+    while True:
+        live = [i for i in range(len(runs)) if len(buffers[i])]
+        if not live:
+            break
+        # 还有未读入部分的路中，缓冲区最后一个权重的最小值
+        bounds = [buffers[i]["w"][-1] for i in live if pos[i] < len(runs[i])]
+        bound = min(bounds) if bounds else np.inf
+        parts = []
+        for i in live:
+            cut = np.searchsorted(buffers[i]["w"], bound, side="right")
+            parts.append(buffers[i][:cut])
+            buffers[i] = buffers[i][cut:]
+            if len(buffers[i]) == 0 and pos[i] < len(runs[i]):
+                refill(i)
+        block = np.concatenate(parts)
+        if len(block):
+            yield block[np.argsort(block["w"], kind="stable")]
+
+def Streaming_MST(path, memory=256 * 2 ** 20, tmpdir=None, progress=None):
+    """
+    外存Kruskal算法：边文件大于内存时求最小生成树（森林）
+
+    1. 分块读入边文件，每块在内存中按权重排序后写成一个磁盘上的有序段
+    2. 多路归并所有有序段，按权重从小到大把边依次交给数组并查集
+    内存中常驻的只有并查集（O(V)）和读写缓冲区，缓冲区大小由memory控制。
+    所有顶点连通后提前结束归并
+
+    参数:
+        path: 文本边文件，每行 "u v w"，顶点编号为 0..n-1 的整数
+        memory: 缓冲区的内存预算（字节）
+        tmpdir: 存放有序段的临时目录，默认使用系统临时目录
+        progress: 可选，进度回调函数 progress(阶段, 已处理边数)，
+                  阶段为 "sort"（生成有序段）或 "merge"（归并并运行Kruskal）
+
+    返回:
+        tuple: (mst_edges, total_weight)
+               mst_edges: EDGE_DTYPE数组，最小生成树的边，按权重升序
+               total_weight: 最小生成树的总权重
+    """
+    chunk_edges = max(1, memory // EDGE_DTYPE.itemsize // 4)  # loadtxt的临时数组约占数倍空间
+    workdir = tempfile.mkdtemp(dir=tmpdir)
+    try:
+        # 第一步：生成有序段，同时统计顶点数
+        run_paths = []
+        n = 0
+        done = 0
+        for chunk in read_edge_chunks(path, chunk_edges):
+            chunk = chunk[chunk["u"] != chunk["v"]]
+            chunk.sort(order="w", kind="stable")
+            if len(chunk):
+                n = max(n, int(chunk["u"].max()) + 1, int(chunk["v"].max()) + 1)
+            run_path = os.path.join(workdir, f"run{len(run_paths)}.npy")
+            np.save(run_path, chunk)
+            run_paths.append(run_path)
+            done += len(chunk)
+            if progress:
+                progress("sort", done)
+
+        # 第二步：多路归并，按权重顺序运行Kruskal
+        uf = UnionFind(n)
+        buffer_edges = max(1, memory // EDGE_DTYPE.itemsize // (len(run_paths) + 1))
+        tree = []
+        done = 0
+        for block in merge_runs(run_paths, buffer_edges):
+            merged = uf.union_many(block["u"], block["v"])
+            tree.append(block[merged])
+            done += len(block)
+            if progress:
+                progress("merge", done)
+            if uf.count == 1:
+                break
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    mst_edges = np.concatenate(tree) if tree else np.zeros(0, dtype=EDGE_DTYPE)
+    return mst_edges, mst_edges["w"].sum().item()
+
+
+if __name__ == "__main__":
+    import time
+    from MST_Kruskal import MST_Kruskal_Arrays
+
+    # 生成一个随机边文件：20万个顶点，200万条边
+    rng = np.random.default_rng(0)
+    n, m = 200000, 2000000
+    us = rng.integers(0, n, m)
+    vs = rng.integers(0, n, m)
+    ws = rng.integers(1, 10 ** 6, m)
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, "edges.txt")
+    np.savetxt(path, np.column_stack([us, vs, ws]), fmt="%d")
+    print(f"边文件: {os.path.getsize(path) / 2 ** 20:.1f} MB，{m}条边")
+
+    reported = {}
+
+    def report(stage, count):
+        # 每个阶段每处理约50万条边输出一次
+        if count // 500000 > reported.get(stage, -1):
+            reported[stage] = count // 500000
+            print(f"  [{stage}] 已处理 {count} 条边")
+
+    # 内存预算只有16MB：边文件被分成多个有序段再归并
+    start = time.perf_counter()
+    mst_edges, total_weight = Streaming_MST(path, memory=16 * 2 ** 20, progress=report)
+    print(f"外存Kruskal: 树边 {len(mst_edges)}，总权重 {total_weight:.0f}，用时 {time.perf_counter() - start:.3f}s")
+
+    chosen = MST_Kruskal_Arrays(n, us, vs, ws)
+    print(f"内存中的Kruskal: 树边 {len(chosen)}，总权重 {ws[chosen].sum()}")
+    shutil.rmtree(workdir)
@@ -0,0 +1,149 @@
+from collections import defaultdict
+
+from Dinic import build_residual, Dinic_Augment
+
+
+class FlowNetwork:
+    """
+    可以热启动的最大流网络：保留残差图和当前流，修改容量后从已有流量继续增广，
+    重新求解的代价只与流量的变化量有关，而不必像Ford_Fulkerson那样从零流开始
+    """
+    def __init__(self, G, s, t):
+        """
+        参数:
+            G: 网络的邻接表表示，格式为 {起点: {终点: 容量}}
+            s: 源点
+            t: 汇点
+        """
+        self.G = {u: dict(neighbors) for u, neighbors in G.items()}
+        self.vertices, self.vertex_to_index, self.to, self.cap, self.adj = build_residual(G)
+        self.s = s
+        self.t = t
+        self.value = 0  # 当前流值
+
+        # (起点, 终点) -> 正向边编号，用于修改容量时直接定位残差边
+        self.edge_index = {}
+        e = 0
+        for u, neighbors in G.items():
+            for v in neighbors:
+                self.edge_index[(u, v)] = e
+                e += 2
+
+        self._index(s)
+        self._index(t)
+
+    def _index(self, v):
+        """返回顶点v的索引，新顶点追加到残差图中"""
+        if v not in self.vertex_to_index:
+            self.vertex_to_index[v] = len(self.vertices)
+            self.vertices.append(v)
+            self.adj.append([])
+        return self.vertex_to_index[v]
+
+    def max_flow(self):
+        """
+        从当前流出发继续增广到最大流
+
+        返回:
+            int: 最大流值
+        """
+        si = self.vertex_to_index[self.s]
+        ti = self.vertex_to_index[self.t]
+        if si != ti:
+            self.value += Dinic_Augment(self.to, self.cap, self.adj, si, ti)
+        return self.value
+
+    def set_capacity(self, u, v, c):
+        """
+        修改边(u, v)的容量为c（边不存在时新建）
+
+        容量不低于当前流量时只需更新残差；否则把超出的流量先尝试从u绕路送到v，
+        绕不过去的部分沿残差图退回s（u一侧）和从t撤回（v一侧），保证流始终合法。
+        之后调用max_flow()即可从修复后的流继续增广
+
+        参数:
+            u: 起点
+            v: 终点
+            c: 新容量（非负）
+        """
+        i = self._index(u)
+        j = self._index(v)
+        if (u, v) not in self.edge_index:
+            e = len(self.to)
+            self.edge_index[(u, v)] = e
+            self.adj[i].append(e)
+            self.to.append(j)
+            self.cap.append(0)
+            self.adj[j].append(e + 1)
+            self.to.append(i)
+            self.cap.append(0)
+        self.G.setdefault(u, {})[v] = c
+        self.G.setdefault(v, {})
+
+        e = self.edge_index[(u, v)]
+        f = self.cap[e ^ 1]  # 当前流量
+        if c >= f:
+            self.cap[e] = c - f
+            return
+
+        # 流量降为c：u多出 f-c 的流入，v缺少 f-c 的流入
+        self.cap[e] = 0
+        self.cap[e ^ 1] = c
+        over = f - c
+
+        # 第一步：在残差图中把多余流量从u绕路送到v，流值不变
+        over -= Dinic_Augment(self.to, self.cap, self.adj, i, j, over)
+        if over == 0:
+            return
+
+        # 第二步：剩余部分沿残差图从u退回s，并从t撤回到v，流值减少
+        si = self.vertex_to_index[self.s]
+        ti = self.vertex_to_index[self.t]
+        if i != si:
+            Dinic_Augment(self.to, self.cap, self.adj, i, si, over)
+        if j != ti:
+            Dinic_Augment(self.to, self.cap, self.adj, ti, j, over)
+        self.value -= over
+
+    def flow_dict(self):
+        """
+        返回与Ford_Fulkerson相同格式的流量字典
+
+        返回:
+            defaultdict: 键为(起点, 终点)，值为净流量
+        """
+        flow = defaultdict(int)
+        for (u, v), e in self.edge_index.items():
+            f = self.cap[e ^ 1]
+            flow[(u, v)] += f
+            flow[(v, u)] -= f
+        return flow
+
+
+if __name__ == "__main__":
+    from Dinic import Dinic
+    from Ford_Fulkerson import min_cut
+
+    # 示例网络（与Ford_Fulkerson.py相同）
+    G = {
+        "s": {"v1": 12, "v2": 14},
+        "v1": {"v3": 10},
+        "v2": {"v1": 5, "v3": 11, "v4": 6},
+        "v3": {"v4": 5, "t": 14},
+        "v4": {"t": 11},
+        "t": {}
+    }
+
+    net = FlowNetwork(G, "s", "t")
+    print(f"初始最大流: {net.max_flow()}")
+
+    # 一系列容量修改，每次修改后热启动重新求解，并与从零开始的Dinic对比
+    updates = [("v3", "t", 4), ("v4", "t", 20), ("v1", "v3", 3), ("v2", "t", 7), ("s", "v2", 30)]
+    for u, v, c in updates:
+        net.set_capacity(u, v, c)
+        G.setdefault(u, {})[v] = c
+        value = net.max_flow()
+        expected, _ = Dinic(G, "s", "t")
+        source_side = min_cut(net.G, net.flow_dict(), "s")
+        cut = sum(net.G[a][b] for a in source_side for b in net.G[a] if b not in source_side)
+        print(f"容量 {u}->{v} 改为 {c}: 最大流={value}，重新计算={expected}，最小割容量={cut}")
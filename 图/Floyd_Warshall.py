@@ -1,18 +1,21 @@
 import numpy as np
 from collections import defaultdict
 
-def Floyd_Warshall(G):
+def Floyd_Warshall(G, successor=False):
     """
     Floyd-Warshall算法：计算所有顶点对之间的最短路径
     
     参数:
         G: 带权有向图的邻接表表示，格式为 {顶点: {邻居: 权重}}
+        successor: 是否同时维护后继（下一跳）矩阵Next，
+                   为True时返回APSP对象，可直接用path/paths迭代重构路径
     
     返回:
         tuple: (D, Rec, index_to_vertex)
                D: 最短距离矩阵
                Rec: 路径重构矩阵
                index_to_vertex: 索引到顶点的映射
+        successor=True时返回APSP对象（同样可以解包为上面的三元组）
     """
     # 获取所有顶点并排序
     vertices = sorted(set(G.keys()) | {v for neighbors in G.values() for v in neighbors})
@@ -26,12 +29,19 @@ def Floyd_Warshall(G):
     D = np.full((n, n), np.inf)  # 初始化为无穷大
     Rec = np.zeros((n, n), dtype=int)  # 记录中间顶点
     
+    # Next[i][j]: 从i到j的最短路径上i之后的第一个顶点，-1表示不可达
+    Next = np.full((n, n), -1, dtype=int) if successor else None
+    
     # 初始化：设置直接边的距离
     for i, u in enumerate(vertices):
         D[i][i] = 0  # 顶点到自身距离为0
         for v, weight in G.get(u, {}).items():
             j = vertex_to_index[v]
             D[i][j] = weight
+            if successor:
+                Next[i][j] = j
+        if successor:
+            Next[i][i] = i
     
     # Floyd-Warshall核心算法
     # k为中间顶点
@@ -42,15 +52,169 @@ def Floyd_Warshall(G):
                 if D[i][k] + D[k][j] < D[i][j]:
                     D[i][j] = D[i][k] + D[k][j]
                     Rec[i][j] = k + 1  # 记录中间顶点（1-indexed便于阅读）
+                    if successor:
+                        Next[i][j] = Next[i][k]  # 先走向k
     
     # 检查负环：如果对角线有负值，说明存在负权环
     for i in range(n):
         if D[i][i] < 0:
             print(f"警告：图中存在负权环，顶点{index_to_vertex[i]}在一个负环中")
     
+    if successor:
+        return APSP(D, Rec, Next, index_to_vertex)
     return D, Rec, index_to_vertex
 
 
+class APSP:
+    """
+    Floyd-Warshall的结果对象：保存距离矩阵、路径重构矩阵和后继矩阵，
+    提供迭代的单条路径重构和批量路径重构
+    """
+    def __init__(self, D, Rec, Next, index_to_vertex):
+        self.D = D
+        self.Rec = Rec
+        self.Next = Next
+        self.index_to_vertex = index_to_vertex
+        self.vertex_to_index = {v: i for i, v in index_to_vertex.items()}
+        # 索引 -> 顶点的数组形式，便于用整数数组一次性取出顶点
+        self.vertices = np.empty(len(index_to_vertex), dtype=object)
+        for i, v in index_to_vertex.items():
+            self.vertices[i] = v
+    
+    def __iter__(self):
+        """兼容旧接口：D, Rec, index_to_vertex = Floyd_Warshall(G, successor=True)"""
+        return iter((self.D, self.Rec, self.index_to_vertex))
+    
+    def path(self, u, v):
+        """
+        沿后继矩阵迭代重构从u到v的最短路径
+        
+        参数:
+            u: 起点
+            v: 终点
+        
+        返回:
+            list: 路径上的顶点列表（含u和v），不可达时返回空列表
+        """
+        i = self.vertex_to_index[u]
+        j = self.vertex_to_index[v]
+        if self.Next[i][j] == -1:
+            return []
+        
+        path = [u]
+        # 最短路径至多n-1跳，限制步数防止负环导致死循环
+        for _ in range(len(self.vertices)):
+            if i == j:
+                return path
+            i = self.Next[i][j]
+            path.append(self.index_to_vertex[i])
+        raise ValueError(f"从{u}到{v}的路径经过负权环，无法重构")
+    
+    def paths(self, pairs):
+        """
+        批量重构多条最短路径：所有路径同时沿后继矩阵前进一跳，
+        每一跳是一次整数数组索引，不需要递归，也不逐跳打印
+        
+        参数:
+            pairs: (起点, 终点) 的列表
+        
+        返回:
+            list: 与pairs一一对应的路径列表，不可达的路径为空列表
+        """
+        if len(pairs) == 0:
+            return []
+        src = np.array([self.vertex_to_index[u] for u, _ in pairs], dtype=int)
+        dst = np.array([self.vertex_to_index[v] for _, v in pairs], dtype=int)
+        reachable = self.Next[src, dst] != -1
+        
+        # hops[t][r]: 第r条路径的第t个顶点
+        hops = [src]
+        cur = src.copy()
+        active = reachable & (cur != dst)
+        for _ in range(len(self.vertices)):
+            if not active.any():
+                break
+            cur = np.where(active, self.Next[cur, dst], cur)
+            hops.append(cur)
+            active &= cur != dst
+        else:
+            if active.any():
+                raise ValueError("部分路径经过负权环，无法重构")
+        
+        # 每条路径的长度 = 到达终点所需的跳数 + 1
+        hops = np.stack(hops)
+        lengths = np.argmax(hops == dst, axis=0) + 1
+        
+        result = []
+        for r in range(len(pairs)):
+            if reachable[r]:
+                result.append(self.vertices[hops[:lengths[r], r]].tolist())
+            else:
+                result.append([])
+        return result
+    
+    def decrease_edge(self, u, v, w):
+        """
+        边(u, v)的权重降低为w后，以 O(n²) 增量更新所有顶点对的最短路径，
+        不必重新运行 O(n³) 的Floyd-Warshall
+        
+        新的最短路径要么不变，要么经过新边：D' = min(D, D[:, u] + w + D[v, :])
+        
+        参数:
+            u: 边的起点（必须是已有顶点）
+            v: 边的终点（必须是已有顶点）
+            w: 新的边权重（不能大于原权重）
+        
+        返回:
+            int: 最短距离变短的顶点对数量
+            如果新权重形成负权环，抛出ValueError（此时D、Rec、Next不被修改）
+        """
+        i = self.vertex_to_index[u]
+        j = self.vertex_to_index[v]
+        if w + self.D[j][i] < 0:
+            raise ValueError(f"边{u}->{v}的权重降为{w}后形成负权环")
+        
+        # 经过新边的候选距离：a -> u -> v -> b
+        # 没有负环时，D[:, u]和D[v, :]本身不会因为这条边而变化
+        col = self.D[:, i].copy()
+        row = self.D[j, :].copy()
+        cand = col[:, None] + w + row[None, :]
+        mask = cand < self.D
+        count = int(mask.sum())
+        if count == 0:
+            return 0
+        self.D[mask] = cand[mask]
+        
+        # Rec: a -> b 的中间顶点取u（a = u时取v，u -> v为直接边记0）
+        rec_col = np.full(len(col), i + 1, dtype=self.Rec.dtype)
+        rec_col[i] = j + 1
+        rec = np.broadcast_to(rec_col[:, None], mask.shape)
+        self.Rec[mask] = rec[mask]
+        if mask[i][j]:
+            self.Rec[i][j] = 0
+        
+        # Next: a -> b 的下一跳与 a -> u 相同（a = u时下一跳就是v）
+        if self.Next is not None:
+            next_col = self.Next[:, i].copy()
+            next_col[i] = j
+            nxt = np.broadcast_to(next_col[:, None], mask.shape)
+            self.Next[mask] = nxt[mask]
+        
+        return count
+        
+    def decrease_edges(self, edges):
+        """
+        批量增量更新：依次处理多条降低权重的边
+        
+        参数:
+            edges: (起点, 终点, 新权重) 的列表
+        
+        返回:
+            int: 所有更新中最短距离变短的顶点对数量之和
+        """
+        return sum(self.decrease_edge(u, v, w) for u, v, w in edges)
+
+
 def Find_Path(Rec, index_to_vertex, u_idx, v_idx):
     """
     递归查找并打印从u到v的路径
@@ -78,8 +242,9 @@ def print_shortest_paths(G):
     """
     计算并打印所有顶点对之间的最短路径和距离
     """
-    D, Rec, idx_to_v = Floyd_Warshall(G)
-    vertices = sorted(set(G.keys()) | {v for neighbors in G.values() for v in neighbors})
+    apsp = Floyd_Warshall(G, successor=True)
+    D = apsp.D
+    vertices = [apsp.index_to_vertex[i] for i in range(len(apsp.index_to_vertex))]
     n = len(vertices)
     
     print("=" * 60)
@@ -112,27 +277,33 @@ def print_shortest_paths(G):
         end = vertices[3]
         
         print(f"\n从{start}到{end}的最短路径:")
-        print(f"{start}", end="")
-        Find_Path(Rec, idx_to_v, 0, 3)
-        print(f"\n总距离: {D[0][3]:.1f}")
+        print(" -> ".join(str(x) for x in apsp.path(start, end)))
+        print(f"总距离: {D[0][3]:.1f}")
     
-    # 打印从源点到所有其他点的路径
+    # 批量重构从源点到所有其他点的路径
     print(f"\n从{vertices[0]}到所有其他顶点的路径:")
-    for j, v in enumerate(vertices[1:], 1):
-        print(f"\n到 {v}:", end="")
-        print(f" {vertices[0]}", end="")
-        Find_Path(Rec, idx_to_v, 0, j)
-        print(f" (距离: {D[0][j]:.1f})")
+    routes = apsp.paths([(vertices[0], v) for v in vertices[1:]])
+    for j, (v, route) in enumerate(zip(vertices[1:], routes), 1):
+        print(f"到 {v}: {' -> '.join(str(x) for x in route)} (距离: {D[0][j]:.1f})")
+
 
+if __name__ == "__main__":
+    # 测试图（带权有向图）
+    G = {
+        1: {2: 200, 3: 100, 4: 500, 5: 500},
+        2: {1: 200, 3: 200, 4: 1200, 5: 1000},
+        3: {1: 100, 2: 200, 4: 200, 5: 600},
+        4: {1: 500, 2: 1200, 3: 200, 5: 100},
+        5: {1: 500, 2: 1000, 3: 600, 4: 100},
+    }
 
-# 测试图（带权有向图）
-G = {
-    1: {2: 200, 3: 100, 4: 500, 5: 500},
-    2: {1: 200, 3: 200, 4: 1200, 5: 1000},
-    3: {1: 100, 2: 200, 4: 200, 5: 600},
-    4: {1: 500, 2: 1200, 3: 200, 5: 100},
-    5: {1: 500, 2: 1000, 3: 600, 4: 100},
-}
+    # 计算并打印所有最短路径
+    print_shortest_paths(G)
 
-# 计算并打印所有最短路径
-print_shortest_paths(G)
\ No newline at end of file
+    # 增量更新：边2->5的权重从1000降为50
+    apsp = Floyd_Warshall(G, successor=True)
+    changed = apsp.decrease_edge(2, 5, 50)
+    G[2][5] = 50
+    print(f"\n边2->5降为50后，{changed}个顶点对的最短距离变短")
+    print(f"从1到5的最短路径: {' -> '.join(str(x) for x in apsp.path(1, 5))} (距离: {apsp.D[0][4]:.1f})")
+    print("与重新计算的结果一致:", np.array_equal(apsp.D, Floyd_Warshall(G)[0]))
\ No newline at end of file
@@ -20,6 +20,9 @@ def Ford_Fulkerson(G, s, t):
     for neighbors in G.values():
         vertices.update(neighbors.keys())
     
+    # 残差图中u的邻居：既包括原图的边u->v，也包括反向边（原图中的v->u）
+    residual_adj = residual_neighbors(G)
+    
     # 初始化流量字典：每条边的流量初始为0
     # flow[(u, v)] 表示边u->v的当前流量
     flow = defaultdict(int)
@@ -37,9 +40,10 @@ def Ford_Fulkerson(G, s, t):
             u = queue.popleft()
             
             # 遍历u的所有邻居v
-            for v in G.get(u, {}):
+            for v in residual_adj[u]:
                 # 计算残差容量 = 容量 - 当前流量
-                residual_capacity = G[u][v] - flow[(u, v)]
+                # 反向边容量为0，流量为负，残差容量即为可以退回的流量
+                residual_capacity = G.get(u, {}).get(v, 0) - flow[(u, v)]
                 
                 # 如果残差容量>0且v未被访问
                 if residual_capacity > 0 and v not in visited:
@@ -83,6 +87,24 @@ def Ford_Fulkerson(G, s, t):
     return max_flow, flow
 
 
+def residual_neighbors(G):
+    """
+    计算残差图中每个顶点的邻居（正向边和反向边的终点）
+    
+    参数:
+        G: 网络结构
+    
+    返回:
+        dict: 顶点 -> 邻居字典（只用键，字典保证遍历顺序确定）
+    """
+    adj = defaultdict(dict)
+    for u, neighbors in G.items():
+        for v in neighbors:
+            adj[u][v] = None
+            adj[v][u] = None
+    return adj
+
+
 def print_network(G, flow_dict=None):
     """
     可视化网络状态
@@ -111,50 +133,6 @@ def print_network(G, flow_dict=None):
                 print(f"{u} -> {v:<4} {cap:<8}")
 
 
-# ==================== 示例：构建网络 G=<V,E,C> ====================
-
-# 网络V：顶点集合
-# 网络E：边集合
-# 网络C：容量函数
-
-# 示例网络（教材经典例子）
-G = {
-    "s": {"v1": 12, "v2": 14},  # 源点到v1容量12，到v2容量14
-    "v1": {"v3": 10},            # v1到v3容量10
-    "v2": {"v1": 5, "v3": 11, "v4": 6},
-    "v3": {"v4": 5, "t": 14},
-    "v4": {"t": 11},
-    "t": {}                      # 汇点没有出边
-}
-
-# 打印初始网络
-print_network(G)
-
-# 执行最大流算法
-max_flow, flow_dict = Ford_Fulkerson(G, "s", "t")
-
-print("\n" + "=" * 60)
-print("最大流计算结果")
-print("=" * 60)
-print(f"最大流值: {max_flow}")
-print("\n最终流量分布:")
-print_network(G, flow_dict)
-
-# 验证最大流
-print("\n" + "=" * 60)
-print("流量守恒验证（除s和t）：")
-print("=" * 60)
-for vertex in G:
-    if vertex not in ["s", "t"]:
-        # 计算流入流量
-        in_flow = sum(flow_dict.get((u, vertex), 0) 
-                     for u in G if vertex in G.get(u, {}))
-        # 计算流出流量
-        out_flow = sum(flow_dict.get((vertex, v), 0) 
-                      for v in G.get(vertex, {}))
-        print(f"{vertex}: 流入={in_flow}, 流出={out_flow}, 守恒={in_flow==out_flow}")
-
-# 找到最小割
 def min_cut(G, flow_dict, s):
     """
     根据最大流后的残差图，找到最小割
@@ -167,38 +145,84 @@ def min_cut(G, flow_dict, s):
     返回:
         list: 源点所在割集的顶点
     """
-    # BFS在残差图中寻找从s可达的顶点
+    # BFS在残差图中寻找从s可达的顶点（包括沿反向边退回流量）
+    residual_adj = residual_neighbors(G)
     visited = set([s])
     queue = deque([s])
     
     while queue:
         u = queue.popleft()
-        for v in G.get(u, {}):
+        for v in residual_adj[u]:
             # 残差容量 > 0
-            residual = G[u][v] - flow_dict.get((u, v), 0)
+            residual = G.get(u, {}).get(v, 0) - flow_dict.get((u, v), 0)
             if residual > 0 and v not in visited:
                 visited.add(v)
                 queue.append(v)
     
     return visited
 
-source_side = min_cut(G, flow_dict, "s")
-sink_side = set(G.keys()) - source_side
-
-print("\n" + "=" * 60)
-print("最小割（Max-Flow Min-Cut定理）：")
-print("=" * 60)
-print(f"源点侧S: {sorted(source_side)}")
-print(f"汇点侧T: {sorted(sink_side)}")
-print(f"割边（从S到T的边）：")
-cut_edges = []
-for u in source_side:
-    for v in G.get(u, {}):
-        if v in sink_side:
-            capacity = G[u][v]
-            flow = flow_dict.get((u, v), 0)
-            cut_edges.append((u, v, capacity, flow))
-            print(f"  {u} -> {v}: 容量={capacity}, 流量={flow}")
-cut_capacity = sum(cap for _, _, cap, _ in cut_edges)
-print(f"割的容量: {cut_capacity}")
-print(f"最大流 = 最小割 = {cut_capacity}")
\ No newline at end of file
+
+if __name__ == "__main__":
+    # ==================== 示例：构建网络 G=<V,E,C> ====================
+
+    # 网络V：顶点集合
+    # 网络E：边集合
+    # 网络C：容量函数
+
+    # 示例网络（教材经典例子）
+    G = {
+        "s": {"v1": 12, "v2": 14},  # 源点到v1容量12，到v2容量14
+        "v1": {"v3": 10},            # v1到v3容量10
+        "v2": {"v1": 5, "v3": 11, "v4": 6},
+        "v3": {"v4": 5, "t": 14},
+        "v4": {"t": 11},
+        "t": {}                      # 汇点没有出边
+    }
+
+    # 打印初始网络
+    print_network(G)
+
+    # 执行最大流算法
+    max_flow, flow_dict = Ford_Fulkerson(G, "s", "t")
+
+    print("\n" + "=" * 60)
+    print("最大流计算结果")
+    print("=" * 60)
+    print(f"最大流值: {max_flow}")
+    print("\n最终流量分布:")
+    print_network(G, flow_dict)
+
+    # 验证最大流
+    print("\n" + "=" * 60)
+    print("流量守恒验证（除s和t）：")
+    print("=" * 60)
+    for vertex in G:
+        if vertex not in ["s", "t"]:
+            # 计算流入流量
+            in_flow = sum(flow_dict.get((u, vertex), 0) 
+                         for u in G if vertex in G.get(u, {}))
+            # 计算流出流量
+            out_flow = sum(flow_dict.get((vertex, v), 0) 
+                          for v in G.get(vertex, {}))
+            print(f"{vertex}: 流入={in_flow}, 流出={out_flow}, 守恒={in_flow==out_flow}")
+
+    source_side = min_cut(G, flow_dict, "s")
+    sink_side = set(G.keys()) - source_side
+
+    print("\n" + "=" * 60)
+    print("最小割（Max-Flow Min-Cut定理）：")
+    print("=" * 60)
+    print(f"源点侧S: {sorted(source_side)}")
+    print(f"汇点侧T: {sorted(sink_side)}")
+    print(f"割边（从S到T的边）：")
+    cut_edges = []
+    for u in source_side:
+        for v in G.get(u, {}):
+            if v in sink_side:
+                capacity = G[u][v]
+                flow = flow_dict.get((u, v), 0)
+                cut_edges.append((u, v, capacity, flow))
+                print(f"  {u} -> {v}: 容量={capacity}, 流量={flow}")
+    cut_capacity = sum(cap for _, _, cap, _ in cut_edges)
+    print(f"割的容量: {cut_capacity}")
+    print(f"最大流 = 最小割 = {cut_capacity}")
\ No newline at end of file
@@ -0,0 +1,155 @@
+from collections import deque
+
+from Dinic import build_residual, Dinic_Augment
+
+
+class GomoryHuTree:
+    """
+    Gomory-Hu树（Gusfield算法）：只需 n-1 次最大流，就能回答无向图任意两点间的最小割
+
+    树上u到v路径中权重最小的边就是u与v之间的最小割值，
+    删掉这条边后u所在的连通块就是最小割中u的一侧
+    """
+    def __init__(self, G):
+        """
+        参数:
+            G: 无向带权图的邻接表表示，格式为 {顶点: {邻居: 容量}}，每条边在两个方向上都要列出
+        """
+        self.vertices, self.vertex_to_index, to, cap, adj = build_residual(G)
+        n = len(self.vertices)
+
+        # parent[i]: 树上i的父节点，weight[i]: 边(i, parent[i])的权重（即最小割值）
+        parent = [0] * n
+        weight = [0] * n
+
+        for s in range(1, n):
+            t = parent[s]
+
+            # 在原图上求s与t之间的最大流，每次都从零流开始
+            c = list(cap)
+            weight[s] = Dinic_Augment(to, c, adj, s, t)
+
+            # s一侧：残差图中从s可达的顶点
+            side = [False] * n
+            side[s] = True
+            queue = deque([s])
+            while queue:
+                u = queue.popleft()
+                for e in adj[u]:
+                    if c[e] > 0 and not side[to[e]]:
+                        side[to[e]] = True
+                        queue.append(to[e])
+
+            # 原来挂在t上、且落在s一侧的顶点改挂到s上
+            for i in range(n):
+                if i != s and side[i] and parent[i] == t:
+                    parent[i] = s
+            # 若t的父节点也在s一侧，交换s与t在树中的位置
+            if side[parent[t]]:
+                parent[s] = parent[t]
+                parent[t] = s
+                weight[s], weight[t] = weight[t], weight[s]
+
+        self.parent = parent
+        self.weight = weight
+
+        # 树的深度和孩子列表，用于路径查询和求割集
+        self.children = [[] for _ in range(n)]
+        for i in range(1, n):
+            self.children[parent[i]].append(i)
+        self.depth = [0] * n
+        stack = [0] if n else []
+        while stack:
+            u = stack.pop()
+            for w in self.children[u]:
+                self.depth[w] = self.depth[u] + 1
+                stack.append(w)
+
+    def _min_edge(self, i, j):
+        """返回树上i到j路径中权重最小的边（用边的下端顶点表示）"""
+        best = None
+        while i != j:
+            if self.depth[i] < self.depth[j]:
+                i, j = j, i
+            if best is None or self.weight[i] < self.weight[best]:
+                best = i
+            i = self.parent[i]
+        return best
+
+    def min_cut_value(self, u, v):
+        """
+        查询u与v之间的最小割值，O(n)
+
+        参数:
+            u, v: 两个不同的顶点
+
+        返回:
+            最小割的容量
+        """
+        e = self._min_edge(self.vertex_to_index[u], self.vertex_to_index[v])
+        return self.weight[e]
+
+    def min_cut(self, u, v):
+        """
+        查询u与v之间的最小割，O(n)
+
+        参数:
+            u, v: 两个不同的顶点
+
+        返回:
+            tuple: (cut_value, side)
+                   cut_value: 最小割的容量
+                   side: 最小割中u所在一侧的顶点集合
+        """
+        i = self.vertex_to_index[u]
+        e = self._min_edge(i, self.vertex_to_index[v])
+
+        # 删除树边(e, parent[e])后，e的子树是一侧，其余顶点是另一侧
+        subtree = set()
+        stack = [e]
+        while stack:
+            w = stack.pop()
+            subtree.add(w)
+            stack.extend(self.children[w])
+
+        if i in subtree:
+            side = {self.vertices[w] for w in subtree}
+        else:
+            side = {self.vertices[w] for w in range(len(self.vertices)) if w not in subtree}
+        return self.weight[e], side
+
+
+if __name__ == "__main__":
+    from Ford_Fulkerson import Ford_Fulkerson, min_cut
+
+    # 无向带权图（每条边双向列出）
+    G = {
+        "a": {"b": 10, "f": 8},
+        "b": {"a": 10, "c": 4, "e": 2, "f": 3},
+        "c": {"b": 4, "d": 5, "e": 4, "f": 2},
+        "d": {"c": 5, "e": 7, "f": 2},
+        "e": {"b": 2, "c": 4, "d": 7, "f": 3},
+        "f": {"a": 8, "b": 3, "c": 2, "d": 2, "e": 3},
+    }
+
+    tree = GomoryHuTree(G)
+    print("Gomory-Hu树的边:")
+    for i in range(1, len(tree.vertices)):
+        print(f"  {tree.vertices[i]} - {tree.vertices[tree.parent[i]]} : {tree.weight[i]}")
+
+    value, side = tree.min_cut("a", "d")
+    print(f"\na与d之间的最小割: {value}，a一侧: {sorted(side)}")
+
+    # 与逐对运行Ford_Fulkerson + min_cut的结果对比
+    vertices = sorted(G)
+    consistent = True
+    for u in vertices:
+        for v in vertices:
+            if u < v:
+                flow_value, flow_dict = Ford_Fulkerson(G, u, v)
+                ff_side = min_cut(G, flow_dict, u)
+                ff_cut = sum(G[x][y] for x in ff_side for y in G[x] if y not in ff_side)
+                cut_value, cut_side = tree.min_cut(u, v)
+                cut = sum(G[x][y] for x in cut_side for y in G[x] if y not in cut_side)
+                consistent &= flow_value == ff_cut == cut_value == cut and v not in cut_side
+    print(f"所有顶点对的最小割与Ford_Fulkerson一致: {consistent}")
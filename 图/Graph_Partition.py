@@ -0,0 +1,339 @@
+from collections import deque
+from multiprocessing import Pipe, Process
+
+import numpy as np
+
+from Vertex_Reordering import csr_arrays
+
+
+def partition_bfs(indptr, indices, k):
+    """
+    BFS生长划分：依次从未分配的顶点出发BFS，每块长到 ceil(n/k) 个顶点为止
+
+    同一块内的顶点在BFS中相邻，因此割边较少；除最后一块外各块大小相同
+
+    返回:
+        ndarray: 每个顶点所在的块编号（0..k-1）
+    """
+    n = len(indptr) - 1
+    capacity = -(-n // k)
+    ptr = indptr.tolist()
+    nbrs = indices.tolist()
+    part = [-1] * n
+    p = size = 0
+    next_start = 0
+    queue = deque()
+    while True:
+        if not queue:
+            # 当前连通区域已经用完：从下一个未分配的顶点重新开始
+            while next_start < n and part[next_start] != -1:
+                next_start += 1
+            if next_start == n:
+                break
+            part[next_start] = p
+            size += 1
+            queue.append(next_start)
+        u = queue.popleft()
+        for v in nbrs[ptr[u]:ptr[u + 1]]:
+            if part[v] == -1 and size < capacity:
+                part[v] = p
+                size += 1
+                queue.append(v)
+        if size == capacity and p < k - 1:
+            p += 1
+            size = 0
+            queue.clear()
+    return np.array(part, dtype=np.int64)
+
+def refine_label_propagation(indptr, indices, part, k, rounds=10, imbalance=1.05, seed=0):
+    """
+    标签传播改进划分：每个顶点倾向于移动到邻居最多的块，同时保持各块大小不超过上限
+
+    每一轮对所有顶点向量化地统计各块中的邻居数，只移动严格减少割边的顶点；
+    为避免相邻顶点同时来回移动，每轮随机只移动一半候选顶点
+
+    参数:
+        part: 初始划分
+        imbalance: 每块大小上限为 imbalance * n / k
+
+    返回:
+        ndarray: 改进后的划分
+    """
+    n = len(indptr) - 1
+    part = part.copy()
+    limit = int(imbalance * n / k) + 1
+    rng = np.random.default_rng(seed)
+    src = np.repeat(np.arange(n), np.diff(indptr))
+    for _ in range(rounds):
+        # 统计 (顶点, 邻居所在块) 出现的次数
+        keys, counts = np.unique(src * k + part[indices], return_counts=True)
+        vertex, label = keys // k, keys % k
+        current = np.zeros(n, dtype=np.int64)
+        own = label == part[vertex]
+        current[vertex[own]] = counts[own]
+        # 每个顶点邻居最多的块
+        order = np.lexsort((-counts, vertex))
+        first = np.concatenate(([True], vertex[order][1:] != vertex[order][:-1]))
+        best = order[first]
+        gain = counts[best] - current[vertex[best]]
+        move = (gain > 0) & (rng.random(len(best)) < 0.5)
+        movers, targets, gain = vertex[best][move], label[best][move], gain[move]
+        if len(movers) == 0:
+            break
+
+        # 按收益从大到小接受移动，不超过目标块的大小上限
+        order = np.lexsort((-gain, targets))
+        movers, targets = movers[order], targets[order]
+        sizes = np.bincount(part, minlength=k)
+        start = np.searchsorted(targets, np.arange(k))
+        rank = np.arange(len(targets)) - start[targets]
+        accept = rank < np.maximum(limit - sizes[targets], 0)
+        if not accept.any():
+            break
+        part[movers[accept]] = targets[accept]
+    return part
+
+def cut_edges(indptr, indices, part):
+    """两端在不同块中的边数"""
+    src = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return int((part[src] != part[indices]).sum())
+
+
+def _min_by_target(targets, values):
+    """同一目标的多条消息只保留最小值"""
+    if len(targets) == 0:
+        return targets, values
+    order = np.lexsort((values, targets))
+    targets, values = targets[order], values[order]
+    first = np.concatenate(([True], targets[1:] != targets[:-1]))
+    return targets[first], values[first]
+
+def _group_by_owner(targets, values, owner, k):
+    """把消息按接收方所在块分组，同一目标只保留最小值"""
+    targets, values = _min_by_target(targets, values)
+    dest = owner[targets]
+    order = np.argsort(dest, kind="stable")
+    cut = np.searchsorted(dest[order], np.arange(1, k))
+    return list(zip(np.split(targets[order], cut), np.split(values[order], cut)))
+
+def _shard_worker(conn, owned, indptr, indices, weights, owner, k):
+    """
+    一个分片的工作进程：只保存本块顶点的出边（目标用全局编号，其他块的目标即幽灵顶点）
+
+    "bfs"：每个超步接收发给本块顶点的 (目标, 候选距离)，更新距离后沿出边扩展；
+    "sssp"：Δ-stepping，距离变小的顶点先记为待扩展，只扩展距离小于当前桶上界的顶点，
+    回复时附带剩余待扩展顶点的最小距离，协调进程据此决定下一个桶。
+    新的消息按接收方分组发回协调进程
+    """
+    dist = np.full(len(owned), np.inf)
+    pending = np.zeros(0, dtype=np.int64)  # 距离变小、还没有扩展的顶点（局部编号）
+
+    def expand(local, values, step):
+        # 沿这些顶点的出边扩展，BFS每条边长度为1，单源最短路径使用边权
+        degree = indptr[local + 1] - indptr[local]
+        offset = np.repeat(indptr[local] - np.concatenate(([0], np.cumsum(degree)[:-1])), degree)
+        edge = np.arange(degree.sum()) + offset
+        candidates = np.repeat(values, degree) + (step if step is not None else weights[edge])
+        return _group_by_owner(indices[edge], candidates, owner, k)
+
+    while True:
+        command, targets, values, limit = conn.recv()
+        if command == "reset":
+            dist[:] = np.inf
+            pending = np.zeros(0, dtype=np.int64)
+            conn.send(None)
+        elif command in ("bfs", "sssp"):
+            # 不同分片可能发来同一目标的消息，先取最小值
+            targets, values = _min_by_target(targets, values)
+            local = np.searchsorted(owned, targets)
+            improved = values < dist[local]
+            local, values = local[improved], values[improved]
+            dist[local] = values
+            if command == "bfs":
+                conn.send(expand(local, values, 1.0))
+                continue
+            # 只扩展当前桶中的顶点，其余的留待之后的桶（扩展时距离已经确定或接近确定，减少重复松弛）
+            pending = np.union1d(pending, local)
+            ready = dist[pending] < limit
+            frontier = pending[ready]
+            pending = pending[~ready]
+            rest = dist[pending].min() if len(pending) else np.inf
+            conn.send((expand(frontier, dist[frontier], None), rest))
+        elif command == "result":
+            conn.send(dist)
+        else:
+            conn.close()
+            return
+
+class ShardedGraph:
+    """
+    把图划分为k个分片，每个分片由一个工作进程持有，按整体同步（BSP）方式做BFS和单源最短路径
+
+    协调进程在每个超步把消息转发给目标顶点所在的分片，没有消息时结束。
+    可以用with语句保证工作进程被关闭
+    """
+    def __init__(self, G, k, method="label"):
+        """
+        参数:
+            G: Graph或邻接表，格式为 {顶点: {邻居: 权重}} 或 {顶点: 邻居列表}
+            k: 分片数（工作进程数）
+            method: "bfs"（BFS生长）或 "label"（BFS生长后再做标签传播改进）
+        """
+        indptr, indices, weights, self.vertices = csr_arrays(G)
+        self.vertex_to_index = {v: i for i, v in enumerate(self.vertices)}
+        self.k = k
+        self.part = partition_bfs(indptr, indices, k)
+        if method == "label":
+            self.part = refine_label_propagation(indptr, indices, self.part, k)
+        elif method != "bfs":
+            raise ValueError(f"未知的划分方法: {method}")
+        self.mean_weight = float(weights.mean()) if len(weights) else 1.0
+        self.sizes = np.bincount(self.part, minlength=k)
+        self.cut = cut_edges(indptr, indices, self.part)
+
+        # 每个分片：本块顶点（全局编号，升序）及其出边的局部CSR
+        self.owned = []
+        self.conns = []
+        self.workers = []
+        for p in range(k):
+            owned = np.flatnonzero(self.part == p)
+            degree = np.diff(indptr)[owned]
+            local_indptr = np.zeros(len(owned) + 1, dtype=np.int64)
+            np.cumsum(degree, out=local_indptr[1:])
+            edge = np.repeat(indptr[owned] - local_indptr[:-1], degree) + np.arange(local_indptr[-1])
+            parent, child = Pipe()
+            worker = Process(target=_shard_worker, daemon=True,
+                             args=(child, owned, local_indptr, indices[edge], weights[edge], self.part, k))
+            worker.start()
+            self.owned.append(owned)
+            self.conns.append(parent)
+            self.workers.append(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """关闭所有工作进程"""
+        for conn in self.conns:
+            conn.send(("stop", None, None, None))
+        for worker in self.workers:
+            worker.join()
+        self.conns = []
+
+    def _run(self, source, command, delta=None):
+        """
+        从source开始运行超步（"bfs"或"sssp"）直到没有消息，返回各顶点的距离（按全局编号）
+
+        "sssp"按Δ-stepping分桶：第b个桶包含距离在 [b*delta, (b+1)*delta) 中的顶点。
+        每个超步各分片只扩展当前桶中的顶点；当前桶没有新消息、也没有待扩展的顶点时，
+        直接跳到剩余待扩展顶点中最小距离所在的桶
+        """
+        for conn in self.conns:
+            conn.send(("reset", None, None, None))
+            conn.recv()
+        s = self.vertex_to_index[source]
+        inbox = [[] for _ in range(self.k)]
+        inbox[self.part[s]].append((np.array([s]), np.array([0.0])))
+        pending = np.full(self.k, np.inf)  # 各分片待扩展顶点的最小距离
+        limit = delta
+        while any(inbox) or np.isfinite(pending).any():
+            if command == "sssp" and not any(inbox) and pending.min() >= limit:
+                limit = (np.floor(pending.min() / delta) + 1) * delta  # 跳到下一个非空桶
+            active = [p for p in range(self.k) if inbox[p] or pending[p] < (limit or np.inf)]
+            for p in active:
+                targets = np.concatenate([t for t, _ in inbox[p]] or [np.zeros(0, dtype=np.int64)])
+                values = np.concatenate([v for _, v in inbox[p]] or [np.zeros(0)])
+                self.conns[p].send((command, targets, values, limit))
+            inbox = [[] for _ in range(self.k)]
+            for p in active:
+                reply = self.conns[p].recv()
+                if command == "sssp":
+                    reply, pending[p] = reply
+                for q, (targets, values) in enumerate(reply):
+                    if len(targets):
+                        inbox[q].append((targets, values))
+
+        dist = np.empty(len(self.vertices))
+        for p, conn in enumerate(self.conns):
+            conn.send(("result", None, None, None))
+            dist[self.owned[p]] = conn.recv()
+        return dist
+
+    def bfs(self, source):
+        """
+        分片BFS：每条边长度为1，同一超步中的消息都属于同一层，每个超步扩展一层
+
+        返回:
+            dict: 各顶点到source的边数，不可达为np.inf（与BFS的dist一致）
+        """
+        return dict(zip(self.vertices, self._run(source, "bfs").tolist()))
+
+    def sssp(self, source, delta=None):
+        """
+        分片单源最短路径（非负权重），Δ-stepping：按距离分桶，每个超步只扩展当前桶中的顶点，
+        消息在发送前按目标取最小值。顶点在所在的桶处理时距离基本已经确定，
+        与不分桶的标签修正相比大大减少了重复松弛和重复发送
+
+        参数:
+            delta: 桶宽，默认为平均边权；越小越接近Dijkstra（超步多），越大越接近Bellman-Ford（重复松弛多）
+
+        返回:
+            dict: 各顶点到source的最短距离，不可达为np.inf（与Dijkstra_PriQueue的dist一致）
+        """
+        if delta is None:
+            delta = self.mean_weight if self.mean_weight > 0 else 1.0
+        return dict(zip(self.vertices, self._run(source, "sssp", delta).tolist()))
+
+if __name__ == "__main__":
+    import random
+    import time
+    from BFS import BFS
+    from Dijkstra_PriQueue import Dijkstra_PriQueue
+
+    # 随机几何图：顶点在单位正方形中，与附近的顶点相连（随机编号）
+    random.seed(0)
+    n = 20000
+    points = [(random.random(), random.random()) for _ in range(n)]
+    cells = {}
+    for v, (x, y) in enumerate(points):
+        cells.setdefault((int(x * 100), int(y * 100)), []).append(v)
+    G = {v: {} for v in range(n)}
+    for v, (x, y) in enumerate(points):
+        cx, cy = int(x * 100), int(y * 100)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for u in cells.get((cx + dx, cy + dy), []):
+                    if u != v and (points[u][0] - x) ** 2 + (points[u][1] - y) ** 2 < 0.0002:
+                        G[v][u] = G[u][v] = random.randint(1, 20)
+
+    indptr, indices, _, _ = csr_arrays(G)
+    k = 4
+    for method in ("bfs", "label"):
+        part = partition_bfs(indptr, indices, k)
+        if method == "label":
+            part = refine_label_propagation(indptr, indices, part, k)
+        print(f"划分方法 {method}: 各块大小 {np.bincount(part, minlength=k).tolist()}，"
+              f"割边 {cut_edges(indptr, indices, part)} / {len(indices)}")
+
+    with ShardedGraph(G, k) as SG:
+        start = time.perf_counter()
+        bfs_dist = SG.bfs(0)
+        bfs_time = time.perf_counter() - start
+        start = time.perf_counter()
+        sssp_dist = SG.sssp(0)
+        sssp_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, reference, _ = BFS(G, 0)
+    ref_bfs_time = time.perf_counter() - start
+    same_bfs = all(bfs_dist[v] == reference[v] for v in range(n))
+    start = time.perf_counter()
+    dist, _ = Dijkstra_PriQueue(G, 0)
+    ref_sssp_time = time.perf_counter() - start
+    same_sssp = all(sssp_dist[v] == dist[v] for v in range(n))
+    print(f"\n{k}个分片: 分片BFS用时 {bfs_time:.3f}s（BFS {ref_bfs_time:.3f}s），结果一致: {same_bfs}")
+    print(f"{k}个分片: 分片最短路径用时 {sssp_time:.3f}s（Dijkstra_PriQueue {ref_sssp_time:.3f}s），"
+          f"结果一致: {same_sssp}")
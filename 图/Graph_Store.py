@@ -0,0 +1,200 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+
+
+class Graph(Mapping):
+    """
+    可修改的图存储：带版本号，并缓存由邻接表推导出来的数据结构
+
+    内部是邻接表 {顶点: {邻居: 权重}}，本身可以像字典一样直接传给本目录下的各个算法
+    （G[u]、G.get(u, [])、G.items()等），G[u]是只读视图，修改必须通过add_edge等方法。顶点集合、入度、反向图、边列表、CSR数组
+    等推导数据在第一次使用时计算并缓存，记录计算时的版本号；
+    add_edge/remove_edge等修改操作只把版本号加一（O(1)失效），
+    图不变时重复分析可以跳过这些准备工作
+
+    返回的缓存对象与图共享，调用者不应修改；需要修改时先复制
+    """
+    def __init__(self, G=None, directed=True):
+        """
+        参数:
+            G: 可选，初始图，格式为 {顶点: {邻居: 权重}} 或 {顶点: 邻居列表}（权重取1）
+            directed: 是否为有向图；无向图的每条边在两个方向上都存储
+        """
+        self.directed = directed
+        self.version = 0
+        self._adj = {}
+        self._cache = {}  # 名称 -> (计算时的版本号, 值)
+        G = G or {}
+        for u in G:
+            self.add_vertex(u)  # 先按原顺序加入所有顶点，保持与原字典相同的顶点顺序
+        for u, neighbors in G.items():
+            weighted = isinstance(neighbors, Mapping)
+            for v in neighbors:
+                self.add_edge(u, v, neighbors[v] if weighted else 1)
+
+    # ---------- 字典接口 ----------
+
+    def __getitem__(self, u):
+        # 只读视图：G[u][v] = w 之类的直接修改会绕过版本号，使缓存失效不了
+        return MappingProxyType(self._adj[u])
+
+    def __iter__(self):
+        return iter(self._adj)
+
+    def __len__(self):
+        return len(self._adj)
+
+    # ---------- 修改操作 ----------
+
+    def add_vertex(self, u):
+        if u not in self._adj:
+            self._adj[u] = {}
+            self.version += 1
+
+    def add_edge(self, u, v, w=1):
+        """加入边(u, v)，边已存在时更新权重"""
+        self._adj.setdefault(u, {})[v] = w
+        if self.directed:
+            self._adj.setdefault(v, {})
+        else:
+            self._adj.setdefault(v, {})[u] = w
+        self.version += 1
+
+    def remove_edge(self, u, v):
+        """删除边(u, v)，边不存在时抛出KeyError"""
+        del self._adj[u][v]
+        if not self.directed and u != v:
+            del self._adj[v][u]
+        self.version += 1
+
+    def remove_vertex(self, u):
+        """删除顶点u及其所有关联边"""
+        for neighbors in self._adj.values():
+            neighbors.pop(u, None)
+        del self._adj[u]
+        self.version += 1
+
+    # ---------- 缓存的推导数据 ----------
+
+    def cached(self, name, build):
+        """
+        返回名为name的推导数据；当前版本还没有计算过时调用build()计算并缓存
+
+        其他分析也可以用它缓存自己的结果，例如
+        G.cached("topo", lambda: Topological_Sort_BFS(G))
+        """
+        entry = self._cache.get(name)
+        if entry is None or entry[0] != self.version:
+            entry = (self.version, build())
+            self._cache[name] = entry
+        return entry[1]
+
+    def vertices(self):
+        """所有顶点的列表（修改操作保证只作为邻居出现的顶点也在邻接表中）"""
+        return self.cached("vertices", lambda: list(self._adj))
+
+    def vertex_index(self):
+        """顶点 -> 编号（与vertices()的顺序一致）"""
+        return self.cached("vertex_index", lambda: {v: i for i, v in enumerate(self.vertices())})
+
+    def in_degree(self):
+        """顶点 -> 入度"""
+        def build():
+            in_degree = {v: 0 for v in self._adj}
+            for neighbors in self._adj.values():
+                for v in neighbors:
+                    in_degree[v] += 1
+            return in_degree
+        return self.cached("in_degree", build)
+
+    def reverse(self):
+        """反向图 {顶点: {前驱: 权重}}"""
+        def build():
+            reverse = {v: {} for v in self._adj}
+            for u, neighbors in self._adj.items():
+                for v, w in neighbors.items():
+                    reverse[v][u] = w
+            return reverse
+        return self.cached("reverse", build)
+
+    def edges(self):
+        """边列表 [(起点, 终点, 权重), ...]；无向图的每条边出现两次"""
+        return self.cached("edges", lambda: [(u, v, w) for u, neighbors in self._adj.items()
+                                              for v, w in neighbors.items()])
+
+    def csr(self):
+        """
+        压缩稀疏行（CSR）表示，顶点编号与vertices()一致
+
+        返回:
+            tuple: (indptr, indices, weights)，顶点i的邻居为
+                   indices[indptr[i]:indptr[i+1]]，对应的权重在weights中
+        """
+        def build():
+            index = self.vertex_index()
+            degree = [len(self._adj[v]) for v in self.vertices()]
+            indptr = np.zeros(len(degree) + 1, dtype=np.int64)
+            np.cumsum(degree, out=indptr[1:])
+            indices = np.fromiter((index[v] for u in self.vertices() for v in self._adj[u]),
+                                  dtype=np.int64, count=indptr[-1])
+            weights = np.array([w for u in self.vertices() for w in self._adj[u].values()], dtype=float)
+            return indptr, indices, weights
+        return self.cached("csr", build)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from Bellman_Ford import Bellman_Ford
+    from Strongly_Connected_Component import Strongly_Connected_Component
+
+    # 与Strongly_Connected_Component.py相同的示例图
+    G = Graph({
+        1: [10, 3],
+        2: [6],
+        3: [4, 7],
+        4: [1, 6],
+        5: [2],
+        6: [5],
+        7: [7],
+        8: [9, 10],
+        9: [7, 8],
+        10: [1]
+    })
+    print(f"强连通分量: {Strongly_Connected_Component(G)}")
+    G.add_edge(7, 8)
+    print(f"加入边 7->8 后（版本 {G.version}）: {Strongly_Connected_Component(G)}")
+    G.remove_edge(7, 8)
+    print(f"删除边 7->8 后（版本 {G.version}）: {Strongly_Connected_Component(G)}")
+
+    # 大规模图上的准备工作：第一次计算后直接命中缓存，修改后重新计算
+    random.seed(0)
+    n = 100000
+    G = Graph()
+    for v in range(n):
+        G.add_vertex(v)
+    for _ in range(1000000):
+        u, v = sorted(random.sample(range(n), 2))
+        G.add_edge(u, v, random.randint(1, 100))
+
+    def prepare():
+        start = time.perf_counter()
+        G.vertices()
+        G.in_degree()
+        G.reverse()
+        G.edges()
+        G.csr()
+        return time.perf_counter() - start
+
+    print(f"\n{n}个顶点、{sum(map(len, G.values()))}条边:")
+    print(f"  第一次计算顶点/入度/反向图/边列表/CSR: {prepare():.3f}s")
+    print(f"  图未修改，再次获取: {prepare() * 1e6:.1f}µs")
+    G.add_edge(0, n - 1, 1)
+    print(f"  加入一条边后（版本 {G.version}）重新计算: {prepare():.3f}s")
+
+    # 重复分析：Bellman-Ford直接使用缓存的顶点和边列表
+    start = time.perf_counter()
+    dist, _ = Bellman_Ford(G, 0)
+    print(f"  Bellman-Ford（使用缓存）: {time.perf_counter() - start:.3f}s")
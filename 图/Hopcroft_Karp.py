@@ -0,0 +1,144 @@
+from collections import deque
+
+
+def Hopcroft_Karp(G):
+    """
+    Hopcroft-Karp算法：求二分图的最大匹配，复杂度 O(E√V)
+
+    每一轮先从所有未匹配的左部顶点同时BFS，建立交错路径的分层图；
+    再沿分层图用迭代DFS找出一组互不相交的最短增广路径一起增广。
+    顶点全部转换为整数下标，用列表存储匹配和层次，不做递归
+
+    参数:
+        G: 二分图的邻接表表示，格式为 {左部顶点: {右部顶点集合}}（与Hungarian相同）
+
+    返回:
+        dict: 右部顶点到左部顶点的匹配字典
+              格式: {右部顶点: 匹配的左部顶点}
+    """
+    L = list(G.keys())
+    R = []
+    right_index = {}
+    adj = []
+    for u in L:
+        row = []
+        for r in G[u]:
+            if r not in right_index:
+                right_index[r] = len(R)
+                R.append(r)
+            row.append(right_index[r])
+        adj.append(row)
+
+    n_left = len(L)
+    match_l = [-1] * n_left   # match_l[u]: 左部顶点u匹配的右部顶点
+    match_r = [-1] * len(R)   # match_r[r]: 右部顶点r匹配的左部顶点
+
+    # 贪心初始匹配：大多数顶点可以直接匹配，减少后续轮数
+    for u in range(n_left):
+        for r in adj[u]:
+            if match_r[r] == -1:
+                match_l[u] = r
+                match_r[r] = u
+                break
+
+    INF = n_left + 1
+    while True:
+        # 第一步：BFS分层，dist[u]为左部顶点u在交错路径中的层次
+        dist = [INF] * n_left
+        queue = deque()
+        for u in range(n_left):
+            if match_l[u] == -1:
+                dist[u] = 0
+                queue.append(u)
+        limit = INF  # 最短增广路径到达未匹配右部顶点时的层次
+        while queue:
+            u = queue.popleft()
+            if dist[u] >= limit:
+                break
+            for r in adj[u]:
+                w = match_r[r]
+                if w == -1:
+                    limit = dist[u]
+                elif dist[w] == INF:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+
+        if limit == INF:
+            break  # 没有增广路径，当前匹配即为最大匹配
+
+        # 第二步：沿分层图迭代DFS，找一组顶点不相交的最短增广路径
+        it = [0] * n_left  # 当前弧指针
+        for root in range(n_left):
+            if match_l[root] != -1:
+                continue
+            stack = [root]   # 路径上的左部顶点
+            path_r = []      # 路径上的右部顶点，path_r[k]连接stack[k]与stack[k+1]
+            while stack:
+                u = stack[-1]
+                if it[u] < len(adj[u]):
+                    r = adj[u][it[u]]
+                    it[u] += 1
+                    w = match_r[r]
+                    if w == -1:
+                        if dist[u] == limit:
+                            # 找到增广路径：沿路径翻转匹配边与非匹配边
+                            path_r.append(r)
+                            for x, y in zip(stack, path_r):
+                                match_l[x] = y
+                                match_r[y] = x
+                            break
+                    elif dist[w] == dist[u] + 1:
+                        stack.append(w)
+                        path_r.append(r)
+                else:
+                    # u的所有弧都已用完，从分层图中删除u并回退
+                    dist[u] = INF
+                    stack.pop()
+                    if path_r:
+                        path_r.pop()
+
+    return {R[r]: L[u] for r, u in enumerate(match_r) if u != -1}
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from Hungarian import Hungarian
+
+    # 与Hungarian.py相同的二分图
+    G = {
+        "L1": {"R2"},
+        "L2": {"R1", "R3", "R5"},
+        "L3": {"R1", "R4"},
+        "L4": {"R3"},
+        "L5": {"R4"},
+    }
+
+    matching = Hopcroft_Karp(G)
+    print("最大匹配结果:")
+    for right, left in sorted(matching.items(), key=lambda x: x[1]):
+        print(f"  {left} -> {right}")
+    print(f"最大匹配数: {len(matching)}（Hungarian: {len(Hungarian(G))}）")
+
+    # 随机工人-任务图上的性能对比
+    random.seed(0)
+    n = 2000
+    W = {("W", i): {("T", j) for j in random.sample(range(n), 3)} for i in range(n)}
+
+    start = time.perf_counter()
+    hk = Hopcroft_Karp(W)
+    hk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hu = Hungarian(W)
+    hu_time = time.perf_counter() - start
+
+    print(f"\n{n}x{n}随机二分图（每个工人3个候选任务）:")
+    print(f"  Hopcroft-Karp: 匹配数={len(hk)}，用时 {hk_time:.3f}s")
+    print(f"  Hungarian:     匹配数={len(hu)}，用时 {hu_time:.3f}s")
+
+    n = 200000
+    W = {i: {j for j in random.sample(range(n), 3)} for i in range(n)}
+    start = time.perf_counter()
+    hk = Hopcroft_Karp(W)
+    print(f"\n{n}x{n}随机二分图: Hopcroft-Karp匹配数={len(hk)}，用时 {time.perf_counter() - start:.3f}s")
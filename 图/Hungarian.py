@@ -68,59 +68,60 @@ def DFS_Find(G, v, color, matched):
     return False
 
 
-# ==================== 测试示例 ====================
+if __name__ == "__main__":
+    # ==================== 测试示例 ====================
 
-# 二分图 G = <L, R, E>
-# L: 左部顶点（工人）
-# R: 右部顶点（任务）
-G = {
-    "L1": {"R2"},           # L1可以完成R2
-    "L2": {"R1", "R3", "R5"},  # L2可以完成R1,R3,R5
-    "L3": {"R1", "R4"},        # L3可以完成R1,R4
-    "L4": {"R3"},              # L4可以完成R3
-    "L5": {"R4"},              # L5可以完成R4
-}
+    # 二分图 G = <L, R, E>
+    # L: 左部顶点（工人）
+    # R: 右部顶点（任务）
+    G = {
+        "L1": {"R2"},           # L1可以完成R2
+        "L2": {"R1", "R3", "R5"},  # L2可以完成R1,R3,R5
+        "L3": {"R1", "R4"},        # L3可以完成R1,R4
+        "L4": {"R3"},              # L4可以完成R3
+        "L5": {"R4"},              # L5可以完成R4
+    }
 
-print("二分图结构:")
-for left, rights in G.items():
-    print(f"  {left} -> {rights}")
+    print("二分图结构:")
+    for left, rights in G.items():
+        print(f"  {left} -> {rights}")
 
-# 执行匈牙利算法
-matching = Hungarian(G)
+    # 执行匈牙利算法
+    matching = Hungarian(G)
 
-print("\n最大匹配结果:")
-print("左部顶点 -> 右部顶点")
-for right, left in matching.items():
-    print(f"  {left} -> {right}")
+    print("\n最大匹配结果:")
+    print("左部顶点 -> 右部顶点")
+    for right, left in matching.items():
+        print(f"  {left} -> {right}")
 
-print(f"\n最大匹配数: {len(matching)}")
+    print(f"\n最大匹配数: {len(matching)}")
 
-# 验证最大匹配
-expected_matching = 4  # 理论上最多4条匹配边
-print(f"预期最大匹配数: {expected_matching}")
-print(f"结果正确: {len(matching) == expected_matching}")
+    # 验证最大匹配
+    expected_matching = 4  # 理论上最多4条匹配边
+    print(f"预期最大匹配数: {expected_matching}")
+    print(f"结果正确: {len(matching) == expected_matching}")
 
-# 可视化匹配关系
-print("\n匹配可视化:")
-for left in sorted(G.keys()):
-    matched_right = None
-    for right, matched_left in matching.items():
-        if matched_left == left:
-            matched_right = right
-            break
-    if matched_right:
-        print(f"✓ {left} 匹配 {matched_right}")
-    else:
-        print(f"✗ {left} 未匹配")
+    # 可视化匹配关系
+    print("\n匹配可视化:")
+    for left in sorted(G.keys()):
+        matched_right = None
+        for right, matched_left in matching.items():
+            if matched_left == left:
+                matched_right = right
+                break
+        if matched_right:
+            print(f"✓ {left} 匹配 {matched_right}")
+        else:
+            print(f"✗ {left} 未匹配")
 
-print("\n未匹配的右部顶点:")
-all_right = set()
-for neighbors in G.values():
-    all_right.update(neighbors)
-matched_right = set(matching.keys())
-unmatched_right = all_right - matched_right
-if unmatched_right:
-    for r in sorted(unmatched_right):
-        print(f"  - {r}")
-else:
-    print("  所有右部顶点都已匹配")
\ No newline at end of file
+    print("\n未匹配的右部顶点:")
+    all_right = set()
+    for neighbors in G.values():
+        all_right.update(neighbors)
+    matched_right = set(matching.keys())
+    unmatched_right = all_right - matched_right
+    if unmatched_right:
+        for r in sorted(unmatched_right):
+            print(f"  - {r}")
+    else:
+        print("  所有右部顶点都已匹配")
\ No newline at end of file
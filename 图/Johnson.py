@@ -0,0 +1,153 @@
+import heapq
+import numpy as np
+from multiprocessing import Pool
+
+from Bellman_Ford import Bellman_Ford
+
+
+def Johnson(G, out=None, callback=None, processes=None, chunksize=16):
+    """
+    Johnson算法：稀疏图上的所有顶点对最短路径，支持负权边
+
+    先从虚拟源点运行一次Bellman-Ford得到势函数h，把每条边重新赋权为
+    w'(u, v) = w(u, v) + h(u) - h(v) >= 0，然后从每个顶点运行一次Dijkstra。
+    总复杂度 O(VE log V)，在 E ≈ 4V 的稀疏图上远优于Floyd-Warshall的 O(V³)
+
+    参数:
+        G: 带权有向图，邻接表表示，格式为 {顶点: {邻居: 权重}}
+        out: 可选，.npy文件路径；给出时每行结果写入磁盘上的内存映射矩阵
+        callback: 可选，回调函数 callback(u, row)，每算完一个源点u调用一次，
+                  row[j] 为u到index_to_vertex[j]的最短距离；给出时不保存整个矩阵
+        processes: 工作进程数，None或1表示在当前进程中串行计算
+        chunksize: 每次分发给工作进程的源点个数
+
+    返回:
+        tuple: (D, index_to_vertex)
+               D: 最短距离矩阵（ndarray或memmap），使用callback时为None
+               index_to_vertex: 索引到顶点的映射
+        如果检测到负权环，抛出ValueError
+    """
+    # 获取所有顶点并排序（与Floyd_Warshall的索引方式保持一致）
+    vertices = sorted(set(G.keys()) | {v for neighbors in G.values() for v in neighbors})
+    n = len(vertices)
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    index_to_vertex = {i: v for i, v in enumerate(vertices)}
+
+    # 第一步：加入虚拟源点q，q到每个顶点有一条权重为0的边
+    # 用Bellman-Ford求出q到各顶点的最短距离，作为势函数h
+    q = object()  # 保证不会与已有顶点重名
+    G_q = dict(G)
+    G_q[q] = {v: 0 for v in vertices}
+    h, _ = Bellman_Ford(G_q, q)
+    if h is None:
+        raise ValueError("图中存在负权环，无法计算所有顶点对最短路径")
+    h_arr = np.array([h[v] for v in vertices], dtype=float)
+
+    # 第二步：重新赋权，得到非负权重的邻接表（使用整数索引）
+    adj = [[] for _ in range(n)]
+    for u, neighbors in G.items():
+        i = vertex_to_index[u]
+        for v, weight in neighbors.items():
+            adj[i].append((vertex_to_index[v], weight + h[u] - h[v]))
+
+    # 第三步：准备输出位置
+    if callback is not None:
+        D = None
+    elif out is not None:
+        D = np.lib.format.open_memmap(out, mode="w+", dtype=float, shape=(n, n))
+    else:
+        D = np.empty((n, n))
+
+    def emit(i, row):
+        # 还原真实距离：d(u, v) = d'(u, v) - h(u) + h(v)
+        row = row - h_arr[i] + h_arr
+        if callback is not None:
+            callback(index_to_vertex[i], row)
+        else:
+            D[i] = row
+
+    # 第四步：从每个顶点运行一次Dijkstra，每算完一行立即输出
+    if processes is None or processes <= 1:
+        for i in range(n):
+            emit(i, Dijkstra_Row(adj, i))
+    else:
+        with Pool(processes, initializer=_init_worker, initargs=(adj,)) as pool:
+            for i, row in pool.imap_unordered(_row_worker, range(n), chunksize):
+                emit(i, row)
+
+    if isinstance(D, np.memmap):
+        D.flush()
+
+    return D, index_to_vertex
+
+
+def Dijkstra_Row(adj, s):
+    """
+    基于二叉堆的Dijkstra算法，计算一行距离
+
+    参数:
+        adj: 整数索引的邻接表，adj[u] = [(v, 非负权重), ...]
+        s: 源点索引
+
+    返回:
+        ndarray: 源点到各顶点的最短距离，不可达为np.inf
+    """
+    dist = [np.inf] * len(adj)
+    dist[s] = 0
+    pq = [(0, s)]
+
+    while pq:
+        d, u = heapq.heappop(pq)
+        # 过期的队列元素（已经找到更短的距离），跳过
+        if d > dist[u]:
+            continue
+        for v, weight in adj[u]:
+            nd = d + weight
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+
+    return np.array(dist, dtype=float)
+
+
+# 工作进程中的重新赋权邻接表，由初始化函数设置一次，避免每个任务重复传输
+_adj = None
+
+
+def _init_worker(adj):
+    global _adj
+    _adj = adj
+
+
+def _row_worker(i):
+    return i, Dijkstra_Row(_adj, i)
+
+
+if __name__ == "__main__":
+    from Floyd_Warshall import Floyd_Warshall
+
+    # 测试图（含负权边的有向图，无负环）
+    G = {
+        1: {2: 3, 3: 8, 5: -4},
+        2: {4: 1, 5: 7},
+        3: {2: 4},
+        4: {1: 2, 3: -5},
+        5: {4: 6},
+    }
+
+    D, idx_to_v = Johnson(G)
+    vertices = [idx_to_v[i] for i in range(len(idx_to_v))]
+
+    print("Johnson算法得到的最短距离矩阵:")
+    print(f"{'':4}" + "".join(f"{v:>6}" for v in vertices))
+    for i, u in enumerate(vertices):
+        print(f"{u:>4}" + "".join(f"{D[i][j]:>6.0f}" for j in range(len(vertices))))
+
+    # 多进程 + 回调：逐行输出，不保存整个矩阵
+    rows = {}
+    Johnson(G, callback=lambda u, row: rows.__setitem__(u, row), processes=2, chunksize=1)
+
+    # 与Floyd-Warshall的结果对比
+    D_fw, _, _ = Floyd_Warshall(G)
+    print("\n与Floyd-Warshall结果一致:", np.array_equal(D, D_fw))
+    print("多进程回调结果一致:", all(np.array_equal(rows[u], D[i]) for i, u in enumerate(vertices)))
@@ -0,0 +1,151 @@
+import numpy as np
+
+
+def Linear_Assignment(C, potentials=None, assignment=None):
+    """
+    带权分配问题（Kuhn-Munkres / Jonker-Volgenant最短增广路径法），复杂度 O(n³)
+
+    逐行加入，每次从新行出发沿约化费用 C[i][j] - u[i] - v[j] 找最短增广路径。
+    寻找最短路时对所有列的松弛、求最小值、更新势函数都是一次NumPy向量运算，
+    Python层面的循环只有 O(n²) 次
+
+    参数:
+        C: 费用矩阵（n行m列，可以不是方阵），np.inf表示该行不能分配到该列
+        potentials: 可选，上一次求解返回的 (u, v)，用于方阵的热启动：
+                    沿用列势v，行势重新取 u[i] = min_j (C[i][j] - v[j])，保证约化费用非负
+        assignment: 可选，上一次求解返回的分配，与potentials一起使用：
+                    约化费用仍为0的行保留原来的列，只为其余的行寻找增广路径
+
+    返回:
+        tuple: (assignment, total_cost, u, v)
+               assignment: ndarray，assignment[i]为第i行分配到的列，行多于列时未分配的行为-1
+               total_cost: 最小总费用
+               u, v: 行势和列势，满足 C[i][j] - u[i] - v[j] >= 0，已分配的位置取等号
+        如果不存在让较小一侧全部分配的方案，抛出ValueError
+    """
+    C = np.asarray(C, dtype=float)
+    n_rows, n_cols = C.shape
+
+    # 行数多于列数时转置求解：保证每一行都能分配到不同的列
+    if n_rows > n_cols:
+        col_of_row, total_cost, u, v = Linear_Assignment(C.T)
+        assignment = np.full(n_rows, -1, dtype=int)
+        assigned = col_of_row >= 0
+        assignment[col_of_row[assigned]] = np.nonzero(assigned)[0]
+        return assignment, total_cost, v, u
+
+    n, m = n_rows, n_cols
+    # 下标0是虚拟列：p[0]为当前正在加入的行，way记录最短路树
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=int)     # p[j]: 第j列分配到的行（1开始编号，0表示未分配）
+    way = np.zeros(m + 1, dtype=int)   # way[j]: 最短路树中j的前一列
+    if potentials is not None and n == m:
+        # 列数多于行数时，最优解要求未分配列的列势为0，因此只有方阵才沿用旧的列势
+        v[1:] = potentials[1]
+        reduced = C - v[1:]
+        row_min = reduced.min(axis=1)
+        u[1:] = np.where(np.isfinite(row_min), row_min, 0)
+        if assignment is not None:
+            # 原来的分配仍然紧（约化费用为0）的行直接保留
+            rows = np.arange(n)
+            cols = np.asarray(assignment)
+            keep = (cols >= 0) & np.isfinite(row_min)
+            keep[keep] = reduced[rows[keep], cols[keep]] - u[1:][keep] <= 0
+            p[cols[keep] + 1] = rows[keep] + 1
+    assigned = np.zeros(n + 1, dtype=bool)
+    assigned[p[1:]] = True
+
+    for i in range(1, n + 1):
+        if assigned[i]:
+            continue
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)  # minv[j]: 树中行到第j列的最小约化费用
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+
+            # 用新加入树的行i0松弛所有不在树中的列
+            cur = C[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+            better = free & (cur < minv[1:])
+            minv[1:][better] = cur[better]
+            way[1:][better] = j0
+
+            # 选出约化费用最小的列j1
+            masked = np.where(free, minv[1:], np.inf)
+            j1 = int(np.argmin(masked)) + 1
+            delta = masked[j1 - 1]
+            if delta == np.inf:
+                raise ValueError(f"第{i - 1}行没有可行的分配（剩余可选位置均为inf）")
+
+            # 更新势函数：树中的行加delta，树中的列减delta，其余列的minv减delta
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[1:][free] -= delta
+
+            j0 = j1
+            if p[j0] == 0:
+                break  # 到达未分配的列，找到增广路径
+
+        # 沿way回溯，翻转增广路径上的分配
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    assignment = np.full(n, -1, dtype=int)
+    cols = np.nonzero(p[1:])[0]
+    assignment[p[1:][cols] - 1] = cols
+    total_cost = C[np.arange(n), assignment].sum()
+    return assignment, total_cost, u[1:], v[1:]
+
+
+if __name__ == "__main__":
+    import time
+    from itertools import permutations
+
+    # 示例：4个工人分配4项工作的费用矩阵，inf表示该工人不能做这项工作
+    C = np.array([
+        [9, 2, 7, 8],
+        [6, 4, 3, 7],
+        [5, 8, 1, 8],
+        [7, 6, np.inf, 4],
+    ])
+    assignment, total_cost, u, v = Linear_Assignment(C)
+    print("分配结果:")
+    for worker, job in enumerate(assignment):
+        print(f"  工人{worker} -> 工作{job}，费用 {C[worker, job]:.0f}")
+    print(f"最小总费用: {total_cost:.0f}")
+
+    # 与枚举所有排列的结果对比
+    brute = min(sum(C[i, p[i]] for i in range(4)) for p in permutations(range(4)))
+    print(f"枚举得到的最小总费用: {brute:.0f}")
+
+    # 矩形矩阵：3个工人，5项工作
+    R = np.array([
+        [4, 1, 3, 9, 2],
+        [2, 0, 5, 3, 8],
+        [3, 2, 2, 7, 1],
+    ])
+    assignment, total_cost, _, _ = Linear_Assignment(R)
+    print(f"\n矩形矩阵分配: {assignment.tolist()}，总费用 {total_cost:.0f}")
+
+    # 大规模稠密矩阵，以及用上一次的列势热启动
+    rng = np.random.default_rng(0)
+    n = 500
+    D = rng.integers(0, 1000, size=(n, n)).astype(float)
+    start = time.perf_counter()
+    assignment, total_cost, u, v = Linear_Assignment(D)
+    print(f"\n{n}x{n}稠密矩阵: 总费用 {total_cost:.0f}，用时 {time.perf_counter() - start:.3f}s")
+
+    D[rng.integers(0, n, 20), rng.integers(0, n, 20)] += 50
+    start = time.perf_counter()
+    warm = Linear_Assignment(D, potentials=(u, v), assignment=assignment)
+    warm_time = time.perf_counter() - start
+    start = time.perf_counter()
+    cold = Linear_Assignment(D)
+    cold_time = time.perf_counter() - start
+    print(f"修改20个费用后: 热启动 {warm[1]:.0f}（{warm_time:.3f}s），冷启动 {cold[1]:.0f}（{cold_time:.3f}s）")
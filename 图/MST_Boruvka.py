@@ -0,0 +1,119 @@
+import numpy as np
+
+from MST_Kruskal import edge_arrays
+from Union_Find import UnionFind
+
+
+def MST_Boruvka(G):
+    """
+    Borůvka算法：求最小生成树（图不连通时为最小生成森林）
+
+    参数:
+        G: 无向带权图的邻接表表示，格式为 {顶点: {邻居: 权重}}
+
+    返回:
+        tuple: (mst_edges, total_weight)，格式与MST_Kruskal相同
+    """
+    vertices, us, vs, ws = edge_arrays(G)
+    chosen = MST_Boruvka_Arrays(len(vertices), us, vs, ws)
+
+    mst_edges = [(vertices[u], vertices[v], w)
+                 for u, v, w in zip(us[chosen].tolist(), vs[chosen].tolist(), ws[chosen].tolist())]
+    total_weight = ws[chosen].sum().item()
+    return mst_edges, total_weight
+
+def MST_Boruvka_Arrays(n, us, vs, ws):
+    """
+    在边数组上运行Borůvka算法
+
+    每一轮同时为所有连通分量找出权重最小的出边（按分量编号做分段最小值，
+    一次NumPy运算完成），把这些边全部加入生成树并用并查集收缩分量，
+    再删掉两端已在同一分量中的边。每轮分量数至少减半，共 O(log V) 轮
+
+    权重相同的边按排序后的名次比较，保证每轮选出的边不会构成环
+
+    参数:
+        n: 顶点数（顶点编号为 0..n-1）
+        us, vs, ws: 边数组
+
+    返回:
+        ndarray: 最小生成树（森林）的边在输入数组中的下标，按权重升序
+    """
+    # rank[e]: 边e按(权重, 下标)排序后的名次，作为互不相同的比较键
+    order = np.argsort(ws, kind="stable")
+    rank = np.empty(len(ws), dtype=np.int64)
+    rank[order] = np.arange(len(ws))
+
+    uf = UnionFind(n)
+    comp = np.arange(n)
+    alive = np.arange(len(ws))  # 仍然连接两个不同分量的边
+    chosen = []
+    none = len(ws)              # 表示"该分量没有出边"
+
+    while True:
+        cu = comp[us[alive]]
+        cv = comp[vs[alive]]
+        crossing = cu != cv
+        alive, cu, cv = alive[crossing], cu[crossing], cv[crossing]
+        if len(alive) == 0:
+            break
+
+        # 分段最小值：best[c]为分量c所有出边中名次最小的一条
+        best = np.full(n, none, dtype=np.int64)
+        r = rank[alive]
+        np.minimum.at(best, cu, r)
+        np.minimum.at(best, cv, r)
+
+        # 两个分量可能选中同一条边，去重后按名次还原为边下标
+        picked = order[np.unique(best[best < none])]
+        merged = uf.union_many(us[picked], vs[picked])
+        chosen.append(picked[merged])
+
+        # 收缩：每个顶点换成所在分量的根
+        comp = uf.components()
+
+    if not chosen:
+        return np.zeros(0, dtype=np.int64)
+    chosen = np.concatenate(chosen)
+    return chosen[np.argsort(rank[chosen])]
+
+
+if __name__ == "__main__":
+    import time
+    from MST_Kruskal import MST_Kruskal, MST_Kruskal_Arrays
+
+    # 与MST_Kruskal.py相同的测试图
+    G = {
+        "a": {"b": 4, "h": 8},
+        "b": {"a": 4, "h": 1, "c": 8},
+        "c": {"b": 8, "i": 2, "h": 4, "d": 7},
+        "d": {"c": 7, "f": 14, "z": 9},
+        "f": {"g": 2, "c": 4, "d": 14, "z": 10},
+        "g": {"h": 1, "i": 4, "f": 2},
+        "h": {"a": 8, "b": 1, "i": 7, "g": 1},
+        "i": {"c": 2, "h": 7, "g": 4},
+        "z": {"d": 9, "f": 10}
+    }
+
+    mst_edges, total_weight = MST_Boruvka(G)
+    print("最小生成树的边:")
+    for edge in mst_edges:
+        print(f"  {edge[0]} - {edge[1]} : 权重 {edge[2]}")
+    print(f"\n最小生成树总权重: {total_weight}（Kruskal: {MST_Kruskal(G)[1]}）")
+
+    # 不连通的图：得到最小生成森林
+    H = {1: {2: 3}, 2: {1: 3, 3: 1}, 3: {2: 1}, 4: {5: 2}, 5: {4: 2}, 6: {}}
+    forest, forest_weight = MST_Boruvka(H)
+    print(f"\n不连通图的最小生成森林: {forest}，总权重 {forest_weight}")
+
+    # 大规模稀疏随机图：与Kruskal对比
+    rng = np.random.default_rng(0)
+    n, m = 200000, 2000000
+    us = rng.integers(0, n, m)
+    vs = rng.integers(0, n, m)
+    ws = rng.random(m)
+    for name, mst in (("Kruskal", MST_Kruskal_Arrays), ("Borůvka", MST_Boruvka_Arrays)):
+        start = time.perf_counter()
+        chosen = mst(n, us, vs, ws)
+        print(f"{name}: {n}个顶点 {m}条边，树边 {len(chosen)}，总权重 {ws[chosen].sum():.3f}，"
+              f"用时 {time.perf_counter() - start:.3f}s")
@@ -1,97 +1,164 @@
+import numpy as np
 from collections import defaultdict
 
-class UnionFind:
-    """并查集数据结构"""
-    def __init__(self, vertices):
-        self.parent = {v: v for v in vertices}
-        self.rank = {v: 0 for v in vertices}
-    
-    def find(self, x):
-        """查找根节点，带路径压缩"""
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
-    
-    def union(self, x, y):
-        """合并两个集合"""
-        root_x = self.find(x)
-        root_y = self.find(y)
-        
-        if root_x == root_y:
-            return False  # 已经在同一集合，形成环
-        
-        # 按秩合并
-        if self.rank[root_x] < self.rank[root_y]:
-            self.parent[root_x] = root_y
-        elif self.rank[root_x] > self.rank[root_y]:
-            self.parent[root_y] = root_x
-        else:
-            self.parent[root_y] = root_x
-            self.rank[root_x] += 1
-        
-        return True  # 成功合并
+from Graph_Store import Graph
+from Union_Find import UnionFind
 
-def MST_Kruskal(G):
+def MST_Kruskal(G, filter=False):
     """
     Kruskal算法：求最小生成树
     
     参数:
         G: 无向带权图的邻接表表示
+        filter: 是否使用Filter-Kruskal（先按枢轴划分，只对跨分量的边排序）
     
     返回:
         tuple: (mst_edges, total_weight)
     """
-    # 1. 获取所有边并排序
-    edges = sort_edges_by_weight(G)
+    # 1. 把邻接表转换为去重后的边数组
+    vertices, us, vs, ws = edge_arrays(G)
     
-    # 2. 初始化并查集和结果
-    uf = UnionFind(G.keys())
-    mst_edges = []
-    total_weight = 0
+    # 2. 在边数组上运行Kruskal，得到按权重升序排列的树边下标
+    chosen = MST_Kruskal_Arrays(len(vertices), us, vs, ws, filter=filter)
     
-    # 3. 遍历排序后的边
-    for weight, u, v in edges:
-        # 如果u和v不在同一连通分量（不形成环）
-        if uf.union(u, v):
-            mst_edges.append((u, v, weight))
-            total_weight += weight
+    # 3. 还原为顶点名
+    mst_edges = [(vertices[u], vertices[v], w)
+                 for u, v, w in zip(us[chosen].tolist(), vs[chosen].tolist(), ws[chosen].tolist())]
+    total_weight = ws[chosen].sum().item()
     
     return mst_edges, total_weight
 
-def sort_edges_by_weight(G):
-    """按权重升序排列所有边"""
-    edges = []
-    seen = set()
+def edge_arrays(G):
+    """
+    把邻接表转换为 (u, v, w) 三个NumPy数组，每条无向边只保留一次
+    
+    去重时把 (min(u, v), max(u, v)) 打包成一个int64键：key = min * n + max，
+    用np.unique一次完成，不再为每条边构造元组和集合
+    
+    参数:
+        G: Graph或无向带权图的邻接表表示，格式为 {顶点: {邻居: 权重}}
+           Graph的结果按版本号缓存，图未修改时重复调用直接返回（调用者不应修改返回的数组）
     
-    for u in G:
-        for v, weight in G[u].items():
-            edge_key = tuple(sorted([u, v]))
-            if edge_key not in seen:
-                seen.add(edge_key)
-                edges.append((weight, u, v))
+    返回:
+        tuple: (vertices, us, vs, ws)
+               vertices: 顶点列表（编号 -> 顶点）
+               us, vs: 边端点编号数组（int64）
+               ws: 边权重数组
+    """
+    if isinstance(G, Graph):
+        def build():
+            # 使用Graph缓存的顶点编号和边列表
+            index = G.vertex_index()
+            edges = G.edges()
+            us = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+            vs = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+            ws = np.array([w for _, _, w in edges])
+            return _unique_edges(G.vertices(), us, vs, ws)
+        return G.cached("edge_arrays", build)
+    
+    vertex_to_index = {v: i for i, v in enumerate(G.keys())}
+    for neighbors in G.values():
+        for v in neighbors:
+            vertex_to_index.setdefault(v, len(vertex_to_index))
+    vertices = list(vertex_to_index)
+    
+    us = np.fromiter((vertex_to_index[u] for u in G for _ in G[u]), dtype=np.int64)
+    vs = np.fromiter((vertex_to_index[v] for u in G for v in G[u]), dtype=np.int64)
+    ws = np.array([w for u in G for w in G[u].values()])
+    return _unique_edges(vertices, us, vs, ws)
+
+def _unique_edges(vertices, us, vs, ws):
+    """去掉自环和重复的无向边，每条边保留第一次出现的位置"""
+    n = len(vertices)
+    if len(ws) == 0:
+        return vertices, us, vs, np.zeros(0)
     
-    edges.sort(key=lambda x: x[0])
-    return edges
+    # 去掉自环，并按打包后的键去重（保留每条边第一次出现的位置，维持原来的顺序）
+    keep = us != vs
+    us, vs, ws = us[keep], vs[keep], ws[keep]
+    key = np.minimum(us, vs) * n + np.maximum(us, vs)
+    _, first = np.unique(key, return_index=True)
+    first.sort()
+    return vertices, us[first], vs[first], ws[first]
+
+def MST_Kruskal_Arrays(n, us, vs, ws, filter=False, threshold=1024):
+    """
+    在边数组上运行Kruskal算法
+    
+    参数:
+        n: 顶点数（顶点编号为 0..n-1）
+        us, vs, ws: 边数组
+        filter: 是否使用Filter-Kruskal
+        threshold: Filter-Kruskal中直接排序的子问题规模
+    
+    返回:
+        ndarray: 最小生成树（森林）的边在输入数组中的下标，按权重升序
+    """
+    uf = UnionFind(n)
+    if not filter:
+        order = np.argsort(ws, kind="stable")
+        return order[uf.union_many(us[order], vs[order])]
+    
+    # Filter-Kruskal：用显式栈代替递归，较轻的一半总是先处理
+    chosen = []
+    stack = [np.arange(len(ws))]
+    while stack:
+        # 所有顶点已经连通：剩下的边都会被过滤掉，直接结束
+        if uf.count == 1:
+            break
+        idx = stack.pop()
+        # 过滤：两端已经连通的边不可能再进入生成树，直接丢弃
+        if len(idx) > 0:
+            idx = idx[uf.find_many(us[idx]) != uf.find_many(vs[idx])]
+        if len(idx) == 0:
+            continue
+        w = ws[idx]
+        if len(idx) > threshold:
+            # 以中位数为枢轴划分：先处理较轻的一半，较重的一半留到之后再过滤
+            pivot = np.partition(w, len(w) // 2)[len(w) // 2]
+            light = w <= pivot
+            if not light.all():
+                stack.append(idx[~light])
+                stack.append(idx[light])
+                continue
+        order = idx[np.argsort(w, kind="stable")]
+        chosen.append(order[uf.union_many(us[order], vs[order])])
+    
+    return np.concatenate(chosen) if chosen else np.zeros(0, dtype=np.int64)
+
+if __name__ == "__main__":
+    # 测试图
+    G = {
+        "a": {"b": 4, "h": 8},
+        "b": {"a": 4, "h": 1, "c": 8},
+        "c": {"b": 8, "i": 2, "h": 4, "d": 7},
+        "d": {"c": 7, "f": 14, "z": 9},
+        "f": {"g": 2, "c": 4, "d": 14, "z": 10},
+        "g": {"h": 1, "i": 4, "f": 2},
+        "h": {"a": 8, "b": 1, "i": 7, "g": 1},
+        "i": {"c": 2, "h": 7, "g": 4},
+        "z": {"d": 9, "f": 10}
+    }
 
-# 测试图
-G = {
-    "a": {"b": 4, "h": 8},
-    "b": {"a": 4, "h": 1, "c": 8},
-    "c": {"b": 8, "i": 2, "h": 4, "d": 7},
-    "d": {"c": 7, "f": 14, "z": 9},
-    "f": {"g": 2, "c": 4, "d": 14, "z": 10},
-    "g": {"h": 1, "i": 4, "f": 2},
-    "h": {"a": 8, "b": 1, "i": 7, "g": 1},
-    "i": {"c": 2, "h": 7, "g": 4},
-    "z": {"d": 9, "f": 10}
-}
+    # 执行Kruskal算法
+    mst_edges, total_weight = MST_Kruskal(G)
 
-# 执行Kruskal算法
-mst_edges, total_weight = MST_Kruskal(G)
+    # 打印结果
+    print("最小生成树的边:")
+    for edge in mst_edges:
+        print(f"  {edge[0]} - {edge[1]} : 权重 {edge[2]}")
 
-# 打印结果
-print("最小生成树的边:")
-for edge in mst_edges:
-    print(f"  {edge[0]} - {edge[1]} : 权重 {edge[2]}")
+    print(f"\n最小生成树总权重: {total_weight}")
 
-print(f"\n最小生成树总权重: {total_weight}")
\ No newline at end of file
+    # 大规模稀疏随机图：普通Kruskal（全部排序）与Filter-Kruskal对比
+    import time
+    rng = np.random.default_rng(0)
+    n, m = 200000, 2000000
+    us = rng.integers(0, n, m)
+    vs = rng.integers(0, n, m)
+    ws = rng.random(m)
+    for name, use_filter in (("Kruskal", False), ("Filter-Kruskal", True)):
+        start = time.perf_counter()
+        chosen = MST_Kruskal_Arrays(n, us, vs, ws, filter=use_filter)
+        print(f"{name}: {n}个顶点 {m}条边，树边 {len(chosen)}，总权重 {ws[chosen].sum():.3f}，"
+              f"用时 {time.perf_counter() - start:.3f}s")
@@ -67,25 +67,109 @@ def MST_Prim(G):
     return mst_edges, total_weight
 
 
-# 测试图（无向带权图，注意大小写统一）
-G = {
-    "a": {"b": 4, "h": 8},
-    "b": {"a": 4, "h": 1, "c": 8},
-    "c": {"b": 8, "i": 2, "h": 4, "d": 7},  # 修复：统一为"c"小写
-    "d": {"c": 7, "f": 14, "z": 9},
-    "f": {"g": 2, "c": 4, "d": 14, "z": 10},
-    "g": {"h": 1, "i": 4, "f": 2},
-    "h": {"a": 8, "b": 1, "i": 7, "g": 1},
-    "i": {"c": 2, "h": 7, "g": 4},
-    "z": {"d": 9, "f": 10}  # 添加了"z"的出边（双向图）
-}
+def MST_Prim_Dense(W, n=None, start=0):
+    """
+    稠密图上的Prim算法：dist和pred都是NumPy数组，复杂度 O(V²)
+    
+    每一步只做一次argmin选出新顶点，再用新顶点的一行权重做一次向量化比较来更新dist，
+    适合完全图或接近完全图（例如点集之间的距离矩阵）。
+    尚未加入MST的顶点紧凑地存放在数组前部，每一步只计算和比较这些顶点
+    
+    参数:
+        W: 权重矩阵（n x n的ndarray，np.inf表示没有边），
+           或者函数 W(i, js)，返回顶点i到顶点编号数组js中各顶点的权重，
+           这样不需要一次性生成完整的n²矩阵
+        n: 顶点数，W为函数时必须提供
+        start: 起始顶点编号
+    
+    返回:
+        tuple: (mst_edges, total_weight)
+               mst_edges: MST边的列表，格式为(起点编号, 终点编号, 权重)
+               total_weight: 最小生成树的总权重
+        图不连通时从未访问的顶点重新开始，得到最小生成森林
+    """
+    if callable(W):
+        row = W
+    else:
+        W = np.asarray(W, dtype=float)
+        n = len(W)
+        row = lambda i, js: W[i, js]
+    if not n:
+        return [], 0
+    
+    # rest[:k]为尚未加入MST的顶点，dist[:k]和pred[:k]与之一一对应
+    rest = np.arange(n)
+    dist = np.full(n, np.inf)              # 各顶点到当前MST的最短距离
+    pred = np.full(n, -1, dtype=np.int64)  # 前驱节点
+    
+    mst_edges = []
+    total_weight = 0
+    v = start
+    k = n
+    pos = start
+    while True:
+        # 把v从未加入部分删除：与最后一个元素交换
+        k -= 1
+        for arr in (rest, dist, pred):
+            arr[pos], arr[k] = arr[k], arr[pos]
+        if k == 0:
+            break
+        
+        # 用新顶点v的一行权重更新dist和pred
+        r = np.asarray(row(v, rest[:k]), dtype=float)
+        better = r < dist[:k]
+        dist[:k][better] = r[better]
+        pred[:k][better] = v
+        
+        # 选出dist最小的顶点
+        pos = int(np.argmin(dist[:k]))
+        v = int(rest[pos])
+        if dist[pos] == np.inf:
+            continue  # 剩下的顶点与当前树不连通：从v开始新的树
+        mst_edges.append((int(pred[pos]), v, dist[pos].item()))
+        total_weight += dist[pos].item()
+    
+    return mst_edges, total_weight
 
-# 执行Prim算法
-mst_edges, total_weight = MST_Prim(G)
 
-# 打印结果
-print("最小生成树的边:")
-for edge in mst_edges:
-    print(f"  {edge[0]} - {edge[1]} : 权重 {edge[2]}")
+if __name__ == "__main__":
+    # 测试图（无向带权图，注意大小写统一）
+    G = {
+        "a": {"b": 4, "h": 8},
+        "b": {"a": 4, "h": 1, "c": 8},
+        "c": {"b": 8, "i": 2, "h": 4, "d": 7},  # 修复：统一为"c"小写
+        "d": {"c": 7, "f": 14, "z": 9},
+        "f": {"g": 2, "c": 4, "d": 14, "z": 10},
+        "g": {"h": 1, "i": 4, "f": 2},
+        "h": {"a": 8, "b": 1, "i": 7, "g": 1},
+        "i": {"c": 2, "h": 7, "g": 4},
+        "z": {"d": 9, "f": 10}  # 添加了"z"的出边（双向图）
+    }
+
+    # 执行Prim算法
+    mst_edges, total_weight = MST_Prim(G)
+
+    # 打印结果
+    print("最小生成树的边:")
+    for edge in mst_edges:
+        print(f"  {edge[0]} - {edge[1]} : 权重 {edge[2]}")
+
+    print(f"\n最小生成树总权重: {total_weight}")
+
+    # 同一张图的权重矩阵（按顶点顺序编号）
+    vertices = list(G.keys())
+    W = np.full((len(vertices), len(vertices)), np.inf)
+    for u in G:
+        for v, weight in G[u].items():
+            W[vertices.index(u), vertices.index(v)] = weight
+    dense_edges, dense_weight = MST_Prim_Dense(W)
+    print(f"稠密矩阵版本总权重: {dense_weight}")
 
-print(f"\n最小生成树总权重: {total_weight}")
\ No newline at end of file
+    # 完全距离图：20000个随机点，按行即时计算距离，不生成完整矩阵
+    import time
+    rng = np.random.default_rng(0)
+    x, y = rng.random(20000), rng.random(20000)
+    start = time.perf_counter()
+    dense_edges, dense_weight = MST_Prim_Dense(lambda i, js: np.hypot(x[js] - x[i], y[js] - y[i]), n=len(x))
+    print(f"{len(x)}个点的欧氏完全图: 树边 {len(dense_edges)}，总权重 {dense_weight:.3f}，"
+          f"用时 {time.perf_counter() - start:.3f}s")
\ No newline at end of file
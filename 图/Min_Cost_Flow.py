@@ -0,0 +1,149 @@
+import heapq
+import numpy as np
+
+from Bellman_Ford import Bellman_Ford
+from Dinic import build_residual
+
+
+def Min_Cost_Flow(G, cost, s, t):
+    """
+    最小费用最大流：连续最短路算法 + Johnson势函数
+
+    每一轮在残差图上用二叉堆Dijkstra按约化费用 c(u, v) + h(u) - h(v) >= 0 求s到t的最短路，
+    沿最短路增广后用本轮距离更新势函数h，保证下一轮约化费用仍然非负。
+    若存在负费用边，初始势函数由Bellman-Ford从连接所有顶点的虚拟源点求出
+
+    参数:
+        G: 网络的邻接表表示，格式为 {起点: {终点: 容量}}（与Ford_Fulkerson相同）
+        cost: 单位流量费用，格式为 {起点: {终点: 费用}}，与G的边一一对应
+        s: 源点
+        t: 汇点
+
+    返回:
+        tuple: (max_flow, min_cost, edges, flow, reduced_cost)
+               max_flow: 最大流值
+               min_cost: 达到最大流的最小总费用
+               edges: 边列表 [(起点, 终点), ...]，顺序与G的遍历顺序一致
+               flow: ndarray，flow[k]为edges[k]上的流量
+               reduced_cost: ndarray，reduced_cost[k]为edges[k]在最终势函数下的约化费用
+        如果存在负费用环，抛出ValueError
+    """
+    vertices, vertex_to_index, to, cap, adj = build_residual(G)
+    n = len(vertices)
+    m = len(to)
+
+    # 边的费用：正向边为c，反向边为-c（退回流量可以退回费用）
+    ecost = [0] * m
+    edges = []
+    e = 0
+    for u, neighbors in G.items():
+        for v in neighbors:
+            c = cost[u][v]
+            ecost[e] = c
+            ecost[e ^ 1] = -c
+            edges.append((u, v))
+            e += 2
+
+    # tail[e]: 边e的起点索引
+    tail = [to[e ^ 1] for e in range(m)]
+
+    # 初始势函数：费用全部非负时取0，否则用Bellman-Ford求最短距离。
+    # 从一个虚拟源点（到每个顶点有一条费用为0的边）出发，所有负费用环都能被发现，
+    # 且每个顶点的势函数都是有限值
+    h = [0] * n
+    if s in vertex_to_index and any(ecost[e] < 0 for e in range(0, m, 2)):
+        H = {i: {} for i in range(n)}
+        for e in range(0, m, 2):
+            if cap[e] > 0:
+                H[tail[e]][to[e]] = ecost[e]
+        H[n] = {i: 0 for i in range(n)}
+        dist, _ = Bellman_Ford(H, n)
+        if dist is None:
+            raise ValueError("网络中存在负费用环")
+        h = [dist[i] for i in range(n)]
+
+    max_flow = 0
+    min_cost = 0
+    if s in vertex_to_index and t in vertex_to_index and s != t:
+        si = vertex_to_index[s]
+        ti = vertex_to_index[t]
+        while True:
+            # Dijkstra：按约化费用求s到各顶点的最短距离，prev[v]为最短路上进入v的边
+            dist = [np.inf] * n
+            prev = [-1] * n
+            dist[si] = 0
+            pq = [(0, si)]
+            while pq:
+                d, u = heapq.heappop(pq)
+                if d > dist[u]:
+                    continue
+                hu = h[u]
+                for e in adj[u]:
+                    if cap[e] > 0:
+                        v = to[e]
+                        nd = d + ecost[e] + hu - h[v]
+                        if nd < dist[v]:
+                            dist[v] = nd
+                            prev[v] = e
+                            heapq.heappush(pq, (nd, v))
+
+            # 汇点不可达，已经是最大流
+            if dist[ti] == np.inf:
+                break
+
+            # 更新势函数，使下一轮的约化费用仍然非负
+            for v in range(n):
+                if dist[v] != np.inf:
+                    h[v] += dist[v]
+
+            # 沿最短路增广瓶颈流量
+            f = np.inf
+            v = ti
+            while v != si:
+                e = prev[v]
+                f = min(f, cap[e])
+                v = tail[e]
+            v = ti
+            while v != si:
+                e = prev[v]
+                cap[e] -= f
+                cap[e ^ 1] += f
+                min_cost += f * ecost[e]
+                v = tail[e]
+            max_flow += f
+
+    flow = np.array([cap[e ^ 1] for e in range(0, m, 2)])
+    reduced_cost = np.array([ecost[e] + h[tail[e]] - h[to[e]] for e in range(0, m, 2)])
+    return max_flow, min_cost, edges, flow, reduced_cost
+
+
+if __name__ == "__main__":
+    from Dinic import Dinic
+
+    # 示例网络：容量与单位费用
+    G = {
+        "s": {"v1": 4, "v2": 2},
+        "v1": {"v2": 2, "v3": 2},
+        "v2": {"v3": 3, "t": 1},
+        "v3": {"t": 4},
+        "t": {}
+    }
+    cost = {
+        "s": {"v1": 2, "v2": 2},
+        "v1": {"v2": 1, "v3": 4},
+        "v2": {"v3": 2, "t": 6},
+        "v3": {"t": 1},
+        "t": {}
+    }
+
+    max_flow, min_cost, edges, flow, reduced_cost = Min_Cost_Flow(G, cost, "s", "t")
+    print(f"最大流值: {max_flow}（Dinic: {Dinic(G, 's', 't')[0]}）")
+    print(f"最小费用: {min_cost}")
+    print(f"\n{'边':<10} {'容量':<6} {'费用':<6} {'流量':<6} {'约化费用':<6}")
+    for (u, v), f, rc in zip(edges, flow, reduced_cost):
+        print(f"{u} -> {v:<4} {G[u][v]:<6} {cost[u][v]:<6} {f:<6} {rc:<6}")
+
+    # 最优性检验：有剩余容量的边约化费用非负，有流量的边约化费用非正
+    optimal = all((f == G[u][v] or rc >= 0) and (f == 0 or rc <= 0)
+                  for (u, v), f, rc in zip(edges, flow, reduced_cost))
+    print(f"\n满足互补松弛条件: {optimal}")
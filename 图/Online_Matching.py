@@ -0,0 +1,255 @@
+from collections import deque
+
+from Hopcroft_Karp import Hopcroft_Karp
+
+
+class OnlineMatching:
+    """
+    在线二分图最大匹配：工人（左部）和任务（右部）不断加入和离开，
+    每个事件只从受影响的顶点出发做一次增广路径搜索，不需要重新运行Hungarian
+
+    不变式：每个事件处理完后，当前匹配都是最大匹配。
+    因此新的增广路径一定经过本次事件涉及的顶点或边，只需从那里开始搜索
+    左部顶点和右部顶点的名字不能重复
+    """
+    def __init__(self, G=None):
+        """
+        参数:
+            G: 可选，初始二分图，格式为 {左部顶点: {右部顶点集合}}（与Hungarian相同）
+        """
+        self.adj_left = {}    # 左部顶点 -> 右部邻居集合
+        self.adj_right = {}   # 右部顶点 -> 左部邻居集合
+        self.match_left = {}  # 左部顶点 -> 匹配的右部顶点
+        self.matched = {}     # 右部顶点 -> 匹配的左部顶点（与Hungarian的返回值格式相同）
+
+        for l, rights in (G or {}).items():
+            self.adj_left[l] = set(rights)
+            for r in rights:
+                self.adj_right.setdefault(r, set()).add(l)
+        if G:
+            self.matched = Hopcroft_Karp(G)
+            self.match_left = {l: r for r, l in self.matched.items()}
+
+    def matching(self):
+        """返回当前匹配 {右部顶点: 左部顶点}"""
+        return dict(self.matched)
+
+    def add_left(self, l, rights=()):
+        """
+        加入左部顶点l及其边（l已存在时只加入新边）
+
+        新边都与l关联，匹配数最多增加1：
+        l是新顶点或未匹配时，先加入所有边，再从l做一次增广；
+        l已匹配时，新边可能打开经过l的配偶的增广路径，逐条按add_edge处理，成功一次后不再搜索
+
+        返回:
+            bool: 匹配数是否增加
+        """
+        rights = [r for r in rights if r not in self.adj_left.get(l, ())]
+        self.adj_left.setdefault(l, set())
+        if l not in self.match_left:
+            for r in rights:
+                self._link(l, r)
+            return self._augment(l, self.adj_left, self.match_left, self.matched)
+        for i, r in enumerate(rights):
+            if self.add_edge(l, r):
+                for rest in rights[i + 1:]:
+                    self._link(l, rest)
+                return True
+        return False
+
+    def add_right(self, r, lefts=()):
+        """
+        加入右部顶点r及其边（r已存在时只加入新边），处理方式与add_left相同
+
+        返回:
+            bool: 匹配数是否增加
+        """
+        lefts = [l for l in lefts if l not in self.adj_right.get(r, ())]
+        self.adj_right.setdefault(r, set())
+        if r not in self.matched:
+            for l in lefts:
+                self._link(l, r)
+            return self._augment(r, self.adj_right, self.matched, self.match_left)
+        for i, l in enumerate(lefts):
+            if self.add_edge(l, r):
+                for rest in lefts[i + 1:]:
+                    self._link(rest, r)
+                return True
+        return False
+
+    def add_edge(self, l, r):
+        """
+        加入边(l, r)，顶点不存在时自动加入
+
+        返回:
+            bool: 匹配数是否增加
+        """
+        self._link(l, r)
+        l_free = l not in self.match_left
+        r_free = r not in self.matched
+        if l_free and r_free:
+            self.match_left[l] = r
+            self.matched[r] = l
+            return True
+        if l_free:
+            return self._augment(l, self.adj_left, self.match_left, self.matched)
+        if r_free:
+            return self._augment(r, self.adj_right, self.matched, self.match_left)
+
+        # 两端都已匹配：增广路径形如 未匹配左部 ~> l -> r ~> 未匹配右部。
+        # r一侧：从r的配偶出发找未匹配的右部顶点（不能经过r）；
+        # l一侧：从l的配偶出发找未匹配的左部顶点（不能经过l）。
+        # 由于原匹配是最大匹配，两段路径一定不相交，可以分别搜索
+        b = self.matched[r]
+        a = self.match_left[l]
+        right_part = self._search(b, self.adj_left, self.matched, banned=r)
+        if right_part is None:
+            return False
+        left_part = self._search(a, self.adj_right, self.match_left, banned=l)
+        if left_part is None:
+            return False
+        self._flip(b, *right_part, self.match_left, self.matched)
+        self._flip(a, *left_part, self.matched, self.match_left)
+        self.match_left[l] = r
+        self.matched[r] = l
+        return True
+
+    def remove_vertex(self, v):
+        """
+        删除顶点v及其所有边；若v原来已匹配，从它的配偶出发尝试重新增广
+
+        返回:
+            bool: 删除后是否通过增广保持了原来的匹配数；v不存在时返回False
+        """
+        if v not in self.adj_left and v not in self.adj_right:
+            return False
+        if v in self.adj_left:
+            adj, other_adj, match_v, match_other = self.adj_left, self.adj_right, self.match_left, self.matched
+        else:
+            adj, other_adj, match_v, match_other = self.adj_right, self.adj_left, self.matched, self.match_left
+
+        for w in adj.pop(v):
+            other_adj[w].discard(v)
+        partner = match_v.pop(v, None)
+        if partner is None:
+            return False
+        del match_other[partner]
+        return self._augment(partner, other_adj, match_other, match_v)
+
+    def _link(self, l, r):
+        self.adj_left.setdefault(l, set()).add(r)
+        self.adj_right.setdefault(r, set()).add(l)
+
+    def _augment(self, x, adj, match_x, match_y):
+        """从未匹配的顶点x出发做一次BFS增广，找到则翻转路径"""
+        found = self._search(x, adj, match_y)
+        if found is None:
+            return False
+        self._flip(x, *found, match_x, match_y)
+        return True
+
+    def _search(self, x, adj, match_y, banned=None):
+        """
+        从x出发沿交错路径BFS，寻找对面一侧未匹配的顶点
+
+        参数:
+            x: 起点（x一侧的顶点）
+            adj: x一侧的邻接表
+            match_y: 对面一侧的匹配字典
+            banned: 不允许经过的对面顶点
+
+        返回:
+            tuple: (parent, end)，parent[y]为路径上进入y的x侧顶点，end为找到的未匹配顶点；
+                   找不到时返回None
+        """
+        parent = {}
+        if banned is not None:
+            parent[banned] = None
+        queue = deque([x])
+        while queue:
+            u = queue.popleft()
+            for y in adj[u]:
+                if y in parent:
+                    continue
+                parent[y] = u
+                if y not in match_y:
+                    return parent, y
+                queue.append(match_y[y])
+        return None
+
+    def _flip(self, x, parent, end, match_x, match_y):
+        """沿parent从end回溯到x，把路径上的非匹配边变为匹配边"""
+        y = end
+        while True:
+            u = parent[y]
+            prev = match_x.get(u)
+            match_x[u] = y
+            match_y[y] = u
+            if u == x:
+                break
+            y = prev
+
+
+if __name__ == "__main__":
+    import random
+
+    # 与Hungarian.py相同的初始二分图
+    G = {
+        "L1": {"R2"},
+        "L2": {"R1", "R3", "R5"},
+        "L3": {"R1", "R4"},
+        "L4": {"R3"},
+        "L5": {"R4"},
+    }
+    M = OnlineMatching(G)
+    print(f"初始匹配数: {len(M.matched)}")
+    M.add_right("R6", ["L5"])
+    print(f"加入任务R6后: {len(M.matched)}")
+    M.remove_vertex("R1")
+    print(f"删除任务R1后: {len(M.matched)}")
+    M.add_left("L6", ["R1", "R2"])
+    print(f"加入工人L6后: {len(M.matched)}")
+
+    # 随机事件序列：每个事件后与从头运行Hopcroft_Karp的结果对比
+    random.seed(0)
+    M = OnlineMatching()
+    lefts, rights = set(), set()
+    consistent = True
+    for step in range(2000):
+        op = random.random()
+        if op < 0.25:
+            # 一部分事件给已有的（可能已匹配的）工人加入新边
+            l = random.choice(sorted(lefts)) if lefts and random.random() < 0.3 else f"W{step}"
+            lefts.add(l)
+            M.add_left(l, random.sample(sorted(rights), min(3, len(rights))))
+        elif op < 0.5:
+            r = random.choice(sorted(rights)) if rights and random.random() < 0.3 else f"T{step}"
+            rights.add(r)
+            M.add_right(r, random.sample(sorted(lefts), min(3, len(lefts))))
+        elif op < 0.8 and lefts and rights:
+            M.add_edge(random.choice(sorted(lefts)), random.choice(sorted(rights)))
+        elif lefts and rights:
+            v = random.choice(sorted(lefts | rights))
+            (lefts if v in lefts else rights).discard(v)
+            M.remove_vertex(v)
+        consistent &= len(M.matched) == len(Hopcroft_Karp(M.adj_left))
+    print(f"\n2000个随机事件后匹配数: {len(M.matched)}，每一步都与Hopcroft_Karp一致: {consistent}")
+
+    # 回归检查：给已匹配的顶点加入新边时也可能出现增广路径（小图上更容易触发）
+    consistent = True
+    for seed in range(300):
+        rng = random.Random(seed)
+        M = OnlineMatching()
+        lefts, rights = [], []
+        for step in range(30):
+            if rng.random() < 0.5:
+                l = rng.choice(lefts) if lefts and rng.random() < 0.5 else f"W{step}"
+                lefts.append(l)
+                M.add_left(l, rng.sample(rights, min(2, len(rights))))
+            else:
+                r = rng.choice(rights) if rights and rng.random() < 0.5 else f"T{step}"
+                rights.append(r)
+                M.add_right(r, rng.sample(lefts, min(2, len(lefts))))
+            consistent &= len(M.matched) == len(Hopcroft_Karp(M.adj_left))
+    print(f"300个小图上给已有顶点加边，每一步都与Hopcroft_Karp一致: {consistent}")
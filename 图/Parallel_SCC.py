@@ -0,0 +1,316 @@
+from multiprocessing import Pool
+
+import numpy as np
+
+from Vertex_Reordering import csr_arrays
+
+
+def transpose_csr(indptr, indices):
+    """反向图的CSR数组"""
+    n = len(indptr) - 1
+    sources = np.repeat(np.arange(n), np.diff(indptr))
+    order = np.argsort(indices, kind="stable")
+    rev_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n), out=rev_indptr[1:])
+    return rev_indptr, sources[order]
+
+def gather(indptr, indices, vertices):
+    """一次取出多个顶点的全部出边目标"""
+    degree = indptr[vertices + 1] - indptr[vertices]
+    offset = np.repeat(indptr[vertices] - np.concatenate(([0], np.cumsum(degree)[:-1])), degree)
+    return indices[np.arange(degree.sum()) + offset]
+
+def trim(indptr, indices, rev_indptr, rev_indices, alive):
+    """
+    反复删除入度或出度为0的顶点：它们各自单独构成一个强连通分量
+
+    只对本轮被删除顶点的邻居更新度数，总工作量 O(V + E)
+
+    参数:
+        alive: 布尔数组，参与计算的顶点；函数会把被删除的顶点置为False
+
+    返回:
+        ndarray: 被删除的顶点（每个都是平凡的强连通分量）
+    """
+    n = len(indptr) - 1
+    # 只统计两端都在alive中的边
+    sources = np.repeat(np.arange(n), np.diff(indptr))
+    inside = alive[sources] & alive[indices]
+    out_degree = np.bincount(sources[inside], minlength=n)
+    in_degree = np.bincount(indices[inside], minlength=n)
+
+    removed = []
+    frontier = np.flatnonzero(alive & ((in_degree == 0) | (out_degree == 0)))
+    while len(frontier):
+        alive[frontier] = False
+        removed.append(frontier)
+        # 被删除顶点的后继失去一条入边，前驱失去一条出边
+        succ = gather(indptr, indices, frontier)
+        pred = gather(rev_indptr, rev_indices, frontier)
+        in_degree -= np.bincount(succ, minlength=n)
+        out_degree -= np.bincount(pred, minlength=n)
+        touched = np.unique(np.concatenate([succ, pred]))
+        touched = touched[alive[touched]]
+        frontier = touched[(in_degree[touched] == 0) | (out_degree[touched] == 0)]
+    return np.concatenate(removed) if removed else np.zeros(0, dtype=np.int64)
+
+def induced_subgraph(indptr, indices, keep):
+    """
+    keep中顶点导出的子图，顶点按原顺序重新编号为 0..k-1
+
+    只访问keep中顶点的出边，工作量与子图的规模成正比
+
+    返回:
+        tuple: (indptr, indices)，子图的CSR数组
+    """
+    kept = np.flatnonzero(keep)
+    local = np.cumsum(keep) - 1               # 原编号 -> 新编号
+    degree = indptr[kept + 1] - indptr[kept]
+    targets = gather(indptr, indices, kept)
+    inside = keep[targets]
+    row = np.repeat(np.arange(len(kept)), degree)
+    sub_indptr = np.zeros(len(kept) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row[inside], minlength=len(kept)), out=sub_indptr[1:])
+    return sub_indptr, local[targets[inside]]
+
+def reach(indptr, indices, start, alive):
+    """从start出发、只经过alive中顶点的BFS，返回可达顶点的布尔数组"""
+    seen = np.zeros(len(alive), dtype=bool)
+    seen[start] = True
+    frontier = np.array([start])
+    while len(frontier):
+        nbrs = gather(indptr, indices, frontier)
+        nbrs = np.unique(nbrs[alive[nbrs] & ~seen[nbrs]])
+        seen[nbrs] = True
+        frontier = nbrs
+    return seen
+
+def tarjan(indptr, indices):
+    """
+    迭代版Tarjan算法（用于较小的子问题）
+
+    返回:
+        list: 强连通分量列表，每个分量是一个顶点编号列表
+    """
+    ptr = indptr.tolist()
+    nbrs = indices.tolist()
+    n = len(ptr) - 1
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack = []
+    components = []
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(nbrs[ptr[root]:ptr[root + 1]]))]
+        while work:
+            v, it = work[-1]
+            for w in it:
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, iter(nbrs[ptr[w]:ptr[w + 1]])))
+                    break
+                if on_stack[w]:
+                    low[v] = min(low[v], index[w])
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    low[u] = min(low[u], low[v])
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+    return components
+
+
+def _split(task):
+    """
+    处理一个子问题：较小时直接用Tarjan；否则先修剪，再选一个枢轴做前向-后向可达性分解
+
+    子问题是自包含的导出子图，所有计算只涉及它自己的顶点和边
+
+    参数:
+        task: (vertices, indptr, indices, threshold)，vertices为子图顶点的全局编号，
+              indptr/indices为按局部编号表示的子图
+
+    返回:
+        tuple: (components, subproblems)
+               components: 已确定的强连通分量（全局编号）
+               subproblems: 还需要继续分解的子问题（格式与task相同）
+    """
+    vertices, indptr, indices, threshold = task
+    if len(vertices) <= threshold:
+        return [vertices[c].tolist() for c in tarjan(indptr, indices)], []
+
+    rev_indptr, rev_indices = transpose_csr(indptr, indices)
+    alive = np.ones(len(vertices), dtype=bool)
+    components = [[v] for v in vertices[trim(indptr, indices, rev_indptr, rev_indices, alive)].tolist()]
+    remaining = np.flatnonzero(alive)
+    if len(remaining) == 0:
+        return components, []
+
+    # 枢轴所在的强连通分量 = 前向可达集 ∩ 后向可达集
+    pivot = remaining[len(remaining) // 2]
+    forward = reach(indptr, indices, pivot, alive)
+    backward = reach(rev_indptr, rev_indices, pivot, alive)
+    scc = forward & backward
+    components.append(vertices[scc].tolist())
+
+    # 其余顶点分成三部分，任何强连通分量都不会跨越两部分；每部分切出自己的子图
+    subproblems = []
+    for part in (forward & ~scc, backward & ~scc, alive & ~forward & ~backward):
+        if part.any():
+            subproblems.append((vertices[part], *induced_subgraph(indptr, indices, part), threshold))
+    return components, subproblems
+
+def Parallel_SCC(G, processes=None, threshold=2000):
+    """
+    并行强连通分量：修剪 + 前向-后向（Forward-Backward）分解
+
+    1. 向量化地反复删除入度或出度为0的顶点（它们都是单独的强连通分量）
+    2. 对剩余顶点选一个枢轴，分别做前向和后向BFS，交集就是枢轴所在的强连通分量；
+       其余顶点分成三个互不相关的子问题，每个子问题切出自己的导出子图
+    3. 各子问题互相独立，交给进程池并行处理（只传送子图本身）；较小的子问题直接用迭代Tarjan求解
+
+    每一层分解中各子问题的顶点和边互不重叠，因此每层的总工作量为 O(V + E)
+
+    参数:
+        G: Graph或有向图的邻接表，格式为 {顶点: 邻居列表} 或 {顶点: {邻居: 权重}}
+        processes: 工作进程数，None或1表示在当前进程中串行计算
+        threshold: 顶点数不超过该值的子问题直接用Tarjan求解
+
+    返回:
+        list: 强连通分量列表，每个分量是一个顶点列表（与Strongly_Connected_Component相同）
+    """
+    indptr, indices, _, vertices = csr_arrays(G)
+    return [[vertices[v] for v in component]
+            for component in Parallel_SCC_CSR(indptr, indices, processes, threshold)]
+
+def Parallel_SCC_CSR(indptr, indices, processes=None, threshold=2000):
+    """
+    直接在CSR数组上求强连通分量（大图可以跳过邻接表字典），参数与Parallel_SCC相同
+
+    返回:
+        list: 强连通分量列表，每个分量是一个顶点编号列表
+    """
+    n = len(indptr) - 1
+    tasks = [(np.arange(n), indptr, indices, threshold)] if n else []
+    components = []
+
+    if processes is None or processes <= 1:
+        while tasks:
+            found, more = _split(tasks.pop())
+            components.extend(found)
+            tasks.extend(more)
+    else:
+        with Pool(processes) as pool:
+            while tasks:
+                # 同一轮的子问题互相独立，一起分发
+                results = pool.map(_split, tasks, chunksize=1)
+                tasks = []
+                for found, more in results:
+                    components.extend(found)
+                    tasks.extend(more)
+    return components
+
+if __name__ == "__main__":
+    import sys
+    import threading
+    import time
+    from Strongly_Connected_Component import Strongly_Connected_Component
+
+    # 与Strongly_Connected_Component.py相同的示例图
+    G = {
+        1: [10, 3],
+        2: [6],
+        3: [4, 7],
+        4: [1, 6],
+        5: [2],
+        6: [5],
+        7: [7],
+        8: [9, 10],
+        9: [7, 8],
+        10: [1]
+    }
+    print(f"Parallel_SCC: {sorted(map(sorted, Parallel_SCC(G)))}")
+    print(f"Kosaraju:     {sorted(map(sorted, Strongly_Connected_Component(G)))}")
+
+    # 随机有向图：一个巨大的强连通分量 + 大量平凡分量 + 若干小环
+    rng = np.random.default_rng(0)
+    n, m = 200000, 300000
+    sources = rng.integers(0, n, m)
+    targets = rng.integers(0, n, m)
+    ring = rng.permutation(n)[:20000].reshape(-1, 10)  # 2000个长度为10的环
+    sources = np.concatenate([sources, ring.ravel()])
+    targets = np.concatenate([targets, np.roll(ring, -1, axis=1).ravel()])
+    D = {v: [] for v in range(n)}
+    for u, v in zip(sources.tolist(), targets.tolist()):
+        D[u].append(v)
+
+    def canonical(components):
+        return sorted(sorted(c) for c in components)
+
+    results = {}
+    start = time.perf_counter()
+    results["Parallel_SCC（串行）"] = (Parallel_SCC(D), time.perf_counter() - start)
+    start = time.perf_counter()
+    results["Parallel_SCC（4进程）"] = (Parallel_SCC(D, processes=4), time.perf_counter() - start)
+
+    # 递归版Kosaraju需要很深的递归：在大栈的线程中运行
+    sys.setrecursionlimit(10 ** 7)
+    threading.stack_size(1 << 29)
+
+    def run_kosaraju():
+        start = time.perf_counter()
+        results["Kosaraju（递归）"] = (Strongly_Connected_Component(D), time.perf_counter() - start)
+    thread = threading.Thread(target=run_kosaraju)
+    thread.start()
+    thread.join()
+
+    reference = canonical(results["Kosaraju（递归）"][0])
+    print(f"\n{n}个顶点 {len(sources)}条边的随机有向图:")
+    for name, (components, elapsed) in results.items():
+        print(f"  {name}: {len(components)} 个强连通分量，最大 {max(map(len, components))}，"
+              f"用时 {elapsed:.3f}s，与Kosaraju一致: {canonical(components) == reference}")
+
+    # 许多中等大小的强连通分量：300块，每块3000个顶点（环加随机弦），块之间只有从前往后的边。
+    # 直接构造CSR数组，分解会产生大量较大的子问题
+    blocks, size = 300, 3000
+    n = blocks * size
+    block_start = np.arange(n) - np.arange(n) % size
+    ring_next = np.where(np.arange(n) % size == size - 1, block_start, np.arange(n) + 1)
+    chord_u = rng.integers(0, n, n)
+    chord_v = block_start[chord_u] + rng.integers(0, size, n)
+    cross_u = rng.integers(0, n - size, n)
+    cross_v = rng.integers(block_start[cross_u] + size, n)
+    sources = np.concatenate([np.arange(n), chord_u, cross_u])
+    targets = np.concatenate([ring_next, chord_v, cross_v])
+    label = rng.permutation(n)  # 打乱编号
+    sources, targets = label[sources], label[targets]
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+    indices = targets[order]
+
+    expected = sorted(sorted(label[b * size:(b + 1) * size].tolist()) for b in range(blocks))
+    print(f"\n{blocks}块 x {size}个顶点、{len(indices)}条边的CSR图:")
+    for processes in (None, 4):
+        start = time.perf_counter()
+        components = Parallel_SCC_CSR(indptr, indices, processes)
+        print(f"  Parallel_SCC_CSR（{processes or 1}进程）: {len(components)} 个强连通分量，"
+              f"用时 {time.perf_counter() - start:.3f}s，与各块一致: {canonical(components) == expected}")
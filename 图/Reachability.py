@@ -0,0 +1,249 @@
+from collections import deque
+
+import numpy as np
+
+from Topological_Sort_BFS import Topological_Sort_BFS
+from Vertex_Reordering import csr_arrays
+
+
+def topological_csr(G):
+    """
+    按拓扑序重新编号的CSR：编号即拓扑序中的位置，因此每条边都从小编号指向大编号
+
+    返回:
+        tuple: (indptr, indices, order, position)
+               order: 拓扑序（顶点列表）；position: 顶点 -> 编号
+    """
+    order = Topological_Sort_BFS(G)
+    if len(order) == 0 and len(G) > 0:
+        raise ValueError("图中存在环，可达性索引只支持有向无环图")
+    indptr, indices, _, vertices = csr_arrays(G)
+    position = {v: i for i, v in enumerate(order)}
+    rank = np.array([position[v] for v in vertices], dtype=np.int64)
+    perm = np.argsort(rank)  # 新编号i对应的原编号
+    degree = np.diff(indptr)[perm]
+    new_indptr = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(degree, out=new_indptr[1:])
+    src = np.repeat(indptr[perm] - new_indptr[:-1], degree) + np.arange(new_indptr[-1])
+    return new_indptr, rank[indices[src]], order, position
+
+
+class TransitiveClosure:
+    """
+    位并行传递闭包：每个顶点用一行uint64位集记录它能到达的所有顶点
+
+    按逆拓扑序处理顶点，一个顶点的位集等于自身加上所有后继位集的按位或，
+    每次或运算一次处理64个顶点。内存为 n * ceil(n/64) * 8 字节，查询O(1)
+    """
+    def __init__(self, G):
+        """
+        参数:
+            G: Graph或有向无环图的邻接表，格式为 {顶点: 邻居列表} 或 {顶点: {邻居: 权重}}
+        """
+        indptr, indices, self.order, self.position = topological_csr(G)
+        n = len(self.order)
+        words = -(-n // 64)
+        self.bits = np.zeros((n, words), dtype=np.uint64)
+        one = np.uint64(1)
+        for v in range(n - 1, -1, -1):
+            # 后继的编号都比v大，只有从v所在的字开始的部分可能非零
+            w = v >> 6
+            succ = indices[indptr[v]:indptr[v + 1]]
+            if len(succ):
+                np.bitwise_or.reduce(self.bits[succ, w:], axis=0, out=self.bits[v, w:])
+            self.bits[v, w] |= one << np.uint64(v & 63)
+
+    def nbytes(self):
+        """位集占用的字节数"""
+        return self.bits.nbytes
+
+    def reachable(self, u, v):
+        """u是否能到达v（每个顶点都能到达自身）"""
+        i, j = self.position[u], self.position[v]
+        return bool((int(self.bits[i, j >> 6]) >> (j & 63)) & 1)
+
+    def reachable_many(self, us, vs):
+        """
+        批量查询，一次向量化地回答多对 (us[k], vs[k])
+
+        返回:
+            ndarray: 布尔数组
+        """
+        i = np.array([self.position[u] for u in us], dtype=np.int64)
+        j = np.array([self.position[v] for v in vs], dtype=np.int64)
+        word = self.bits[i, j >> 6]
+        return ((word >> (j & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def descendants(self, u):
+        """u能到达的所有顶点（不含u自身），按拓扑序排列"""
+        row = np.unpackbits(self.bits[self.position[u]].view(np.uint8), bitorder="little")
+        i = self.position[u]
+        return [self.order[j] for j in np.flatnonzero(row[:len(self.order)]).tolist() if j != i]
+
+
+class ReachabilityIndex:
+    """
+    2-hop可达性标签（剪枝地标标签法）：用于闭包放不进内存的大规模DAG
+
+    每个顶点v有两个标签：Lout[v]为v能到达的地标集合，Lin[v]为能到达v的地标集合，
+    u能到达v当且仅当 Lout[u] ∩ Lin[v] 非空。按度数从大到小依次以顶点为地标做
+    前向/后向BFS，已经能由现有标签回答的顶点被剪枝（不再加入标签，也不继续扩展），
+    因此大部分顶点只有很少的标签。
+
+    查询前先用拓扑序过滤：拓扑序中u在v之后时u一定不能到达v
+    """
+    def __init__(self, G):
+        """
+        参数:
+            G: Graph或有向无环图的邻接表
+        """
+        indptr, indices, self.order, self.position = topological_csr(G)
+        n = len(self.order)
+        sources = np.repeat(np.arange(n), np.diff(indptr))
+        rev_order = np.argsort(indices, kind="stable")
+        rev_indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=n), out=rev_indptr[1:])
+        succ_ptr, succ = indptr.tolist(), indices.tolist()
+        pred_ptr, pred = rev_indptr.tolist(), sources[rev_order].tolist()
+
+        # 地标顺序：(入度+1)*(出度+1) 大的顶点覆盖的路径多，先处理
+        out_degree = np.diff(indptr)
+        in_degree = np.diff(rev_indptr)
+        landmarks = np.argsort(-(in_degree + 1) * (out_degree + 1), kind="stable").tolist()
+
+        self.label_out = [set() for _ in range(n)]
+        self.label_in = [set() for _ in range(n)]
+        for k, s in enumerate(landmarks):
+            # 前向BFS：s能到达的顶点把地标k加入Lin
+            out_s = self.label_out[s]
+            queue = deque([s])
+            visited = {s}
+            while queue:
+                u = queue.popleft()
+                if u != s and not out_s.isdisjoint(self.label_in[u]):
+                    continue  # s到u已经能由其他地标回答
+                self.label_in[u].add(k)
+                for v in succ[succ_ptr[u]:succ_ptr[u + 1]]:
+                    if v not in visited:
+                        visited.add(v)
+                        queue.append(v)
+            # 后向BFS：能到达s的顶点把地标k加入Lout
+            in_s = self.label_in[s]
+            queue = deque([s])
+            visited = {s}
+            while queue:
+                u = queue.popleft()
+                if u != s and not in_s.isdisjoint(self.label_out[u]):
+                    continue
+                self.label_out[u].add(k)
+                for v in pred[pred_ptr[u]:pred_ptr[u + 1]]:
+                    if v not in visited:
+                        visited.add(v)
+                        queue.append(v)
+
+    def label_size(self):
+        """所有标签中的地标总数"""
+        return sum(map(len, self.label_out)) + sum(map(len, self.label_in))
+
+    def reachable(self, u, v):
+        """u是否能到达v（每个顶点都能到达自身）"""
+        i, j = self.position[u], self.position[v]
+        if i == j:
+            return True
+        if i > j:
+            return False
+        return not self.label_out[i].isdisjoint(self.label_in[j])
+
+
+def Reachability(G, max_bytes=256 * 2 ** 20):
+    """
+    为DAG建立可达性查询结构：闭包位集不超过max_bytes时用TransitiveClosure，否则用ReachabilityIndex
+
+    参数:
+        G: Graph或有向无环图的邻接表
+        max_bytes: 传递闭包允许使用的最大内存
+
+    返回:
+        TransitiveClosure 或 ReachabilityIndex，两者都提供 reachable(u, v)
+    """
+    n = len(set(G) | {v for neighbors in G.values() for v in neighbors})
+    if n * (-(-n // 64)) * 8 <= max_bytes:
+        return TransitiveClosure(G)
+    return ReachabilityIndex(G)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from BFS import BFS
+
+    # 与Topological_Sort_BFS.py相同的穿衣顺序图
+    G = {
+        "袜子": ["鞋"],
+        "鞋": [],
+        "手表": [],
+        "衬衫": ["腰带", "领带"],
+        "短裤": ["长裤", "鞋"],
+        "长裤": ["腰带"],
+        "腰带": ["外套"],
+        "领带": ["外套"],
+        "外套": []
+    }
+    TC = TransitiveClosure(G)
+    index = ReachabilityIndex(G)
+    for u, v in [("短裤", "外套"), ("衬衫", "鞋"), ("外套", "衬衫"), ("袜子", "鞋")]:
+        print(f"{u} -> {v}: 闭包 {TC.reachable(u, v)}，2-hop标签 {index.reachable(u, v)}")
+    print(f"短裤之后必须穿的: {TC.descendants('短裤')}")
+
+    # 随机依赖DAG：边从小编号指向大编号，多数依赖指向相近的编号
+    def random_dag(n, m, seed):
+        rng = random.Random(seed)
+        D = {v: set() for v in range(n)}
+        for _ in range(m):
+            u = rng.randrange(n - 1)
+            D[u].add(min(n - 1, u + 1 + int(rng.expovariate(1 / 50))))
+        return {v: list(D[v]) for v in range(n)}
+
+    n, m, queries = 20000, 60000, 200000
+    D = random_dag(n, m, 0)
+    rng = random.Random(1)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+    print(f"\n{n}个顶点 {m}条边的随机DAG，{queries}次查询:")
+
+    start = time.perf_counter()
+    TC = TransitiveClosure(D)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    closure_answers = [TC.reachable(u, v) for u, v in pairs]
+    query = time.perf_counter() - start
+    start = time.perf_counter()
+    batch_answers = TC.reachable_many([u for u, _ in pairs], [v for _, v in pairs])
+    batch = time.perf_counter() - start
+    print(f"  传递闭包: 构建 {build:.3f}s（{TC.nbytes() / 2 ** 20:.1f}MB），"
+          f"逐个查询 {query:.3f}s，批量查询 {batch:.3f}s，"
+          f"批量与逐个一致: {batch_answers.tolist() == closure_answers}")
+
+    start = time.perf_counter()
+    index = ReachabilityIndex(D)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    index_answers = [index.reachable(u, v) for u, v in pairs]
+    query = time.perf_counter() - start
+    print(f"  2-hop标签: 构建 {build:.3f}s（平均每个顶点 {index.label_size() / n:.1f} 个标签），"
+          f"查询 {query:.3f}s，与闭包一致: {index_answers == closure_answers}")
+
+    # 每次查询都做一次BFS（只测前200次）
+    start = time.perf_counter()
+    bfs_answers = [BFS(D, u)[1][v] != np.inf for u, v in pairs[:200]]
+    elapsed = time.perf_counter() - start
+    print(f"  每次查询做BFS: 200次 {elapsed:.3f}s（折合{queries}次约 {elapsed * queries / 200:.0f}s），"
+          f"与闭包一致: {bfs_answers == closure_answers[:200]}")
+
+    # 闭包放不进内存时自动改用2-hop标签
+    n, m = 200000, 600000
+    D = random_dag(n, m, 2)
+    start = time.perf_counter()
+    R = Reachability(D)
+    build = time.perf_counter() - start
+    print(f"\n{n}个顶点的DAG（闭包需要 {n * (-(-n // 64)) * 8 / 2 ** 30:.1f}GB）: "
+          f"使用 {type(R).__name__}，构建 {build:.3f}s，平均每个顶点 {R.label_size() / n:.1f} 个标签")
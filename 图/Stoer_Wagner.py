@@ -0,0 +1,100 @@
+import heapq
+from itertools import count
+
+
+def Stoer_Wagner(G):
+    """
+    Stoer-Wagner算法：求无向带权图的全局最小割，不需要指定源点和汇点
+
+    每个阶段按"最大邻接顺序"把顶点逐个加入集合A（用堆选出与A连接权重最大的顶点），
+    最后加入的顶点t与A-{t}之间的割是一个候选割，然后把t合并到倒数第二个顶点上。
+    共 V-1 个阶段；堆用惰性删除（heapq没有decrease-key），每个阶段 O(E log V)，
+    总复杂度 O(VE log V)（用斐波那契堆才能达到 O(VE + V² log V)）
+
+    参数:
+        G: 无向带权图的邻接表表示，格式为 {顶点: {邻居: 权重}}，每条边在两个方向上都要列出
+
+    返回:
+        tuple: (cut_value, (S, T))
+               cut_value: 全局最小割的权重
+               S, T: 割的两侧顶点集合
+    """
+    # 复制邻接表（合并顶点时会修改），并补全只作为邻居出现的顶点
+    adj = {u: {} for u in G}
+    for u, neighbors in G.items():
+        for v, weight in neighbors.items():
+            if u != v:
+                adj.setdefault(u, {})[v] = weight
+                adj.setdefault(v, {})[u] = weight
+    vertices = set(adj)
+
+    if len(adj) < 2:
+        return 0, (vertices, set())
+
+    # groups[v]: 被合并到超级顶点v中的原始顶点
+    groups = {v: [v] for v in adj}
+    best_value = float("inf")
+    best_group = None
+    tiebreak = count()  # 堆中权重相同时按入堆顺序，避免比较顶点本身
+
+    while len(adj) > 1:
+        # 一个阶段：按最大邻接顺序依次加入顶点
+        key = {v: 0 for v in adj}  # key[v]: v与集合A之间边的权重之和
+        in_A = set()
+        heap = [(0, next(tiebreak), v) for v in adj]
+        heapq.heapify(heap)
+        prev = last = None
+        while heap:
+            neg_key, _, v = heapq.heappop(heap)
+            # 跳过已加入A的顶点和过期的堆元素
+            if v in in_A or -neg_key != key[v]:
+                continue
+            in_A.add(v)
+            prev, last = last, v
+            for w, weight in adj[v].items():
+                if w not in in_A:
+                    key[w] += weight
+                    heapq.heappush(heap, (-key[w], next(tiebreak), w))
+
+        # 阶段割：最后加入的顶点last与其余顶点之间的割
+        if key[last] < best_value:
+            best_value = key[last]
+            best_group = list(groups[last])
+
+        # 把last合并到prev上
+        for w, weight in adj.pop(last).items():
+            del adj[w][last]
+            if w != prev:
+                adj[prev][w] = adj[prev].get(w, 0) + weight
+                adj[w][prev] = adj[prev][w]
+        groups[prev].extend(groups.pop(last))
+
+    T = set(best_group)
+    return best_value, (vertices - T, T)
+
+
+if __name__ == "__main__":
+    from Gomory_Hu import GomoryHuTree
+
+    # Stoer与Wagner论文中的示例图，全局最小割为4
+    G = {
+        1: {2: 2, 5: 3},
+        2: {1: 2, 3: 3, 5: 2, 6: 2},
+        3: {2: 3, 4: 4, 7: 2},
+        4: {3: 4, 7: 2, 8: 2},
+        5: {1: 3, 2: 2, 6: 3},
+        6: {2: 2, 5: 3, 7: 1},
+        7: {3: 2, 4: 2, 6: 1, 8: 3},
+        8: {4: 2, 7: 3},
+    }
+
+    cut_value, (S, T) = Stoer_Wagner(G)
+    print(f"全局最小割: {cut_value}")
+    print(f"S: {sorted(S)}")
+    print(f"T: {sorted(T)}")
+    crossing = sum(G[u][v] for u in S for v in G[u] if v in T)
+    print(f"割边权重之和: {crossing}")
+
+    # 验证：全局最小割等于Gomory-Hu树上的最小边权
+    tree = GomoryHuTree(G)
+    print(f"Gomory-Hu树最小边权: {min(tree.weight[1:])}")
@@ -1,5 +1,7 @@
 from collections import defaultdict
 
+from Graph_Store import Graph
+
 def Strongly_Connected_Component(G):
     """
     Kosaraju算法：计算有向图的强连通分量(SCC)
@@ -29,11 +31,14 @@ def Strongly_Connected_Component(G):
         if vertex not in visited:
             dfs_first(vertex)
     
-    # 第二步：构建反向图GR
-    GR = defaultdict(list)
-    for u in G:
-        for v in G[u]:
-            GR[v].append(u)  # 将边u->v反转为v->u
+    # 第二步：构建反向图GR（Graph直接使用缓存的反向图）
+    if isinstance(G, Graph):
+        GR = G.reverse()
+    else:
+        GR = defaultdict(list)
+        for u in G:
+            for v in G[u]:
+                GR[v].append(u)  # 将边u->v反转为v->u
     
     # 第三步：按完成时间逆序对反向图进行DFS
     visited.clear()
@@ -79,23 +84,24 @@ def DFS(G):
     return finish_order
 
 
-# 示例图：包含多个强连通分量
-# 1,10,3,4构成一个SCC；2,5,6构成一个SCC；7自成一个SCC；8,9构成一个SCC
-G = {
-    1: [10, 3],
-    2: [6],
-    3: [4, 7],
-    4: [1, 6],
-    5: [2],
-    6: [5],
-    7: [7],
-    8: [9, 10],
-    9: [7, 8],
-    10: [1]
-}
+if __name__ == "__main__":
+    # 示例图：包含多个强连通分量
+    # 1,10,3,4构成一个SCC；2,5,6构成一个SCC；7自成一个SCC；8,9构成一个SCC
+    G = {
+        1: [10, 3],
+        2: [6],
+        3: [4, 7],
+        4: [1, 6],
+        5: [2],
+        6: [5],
+        7: [7],
+        8: [9, 10],
+        9: [7, 8],
+        10: [1]
+    }
 
-# 计算并打印强连通分量
-scc_list = Strongly_Connected_Component(G)
-print(f"图中共有 {len(scc_list)} 个强连通分量:")
-for i, component in enumerate(scc_list, 1):
-    print(f"SCC {i}: {component}")
\ No newline at end of file
+    # 计算并打印强连通分量
+    scc_list = Strongly_Connected_Component(G)
+    print(f"图中共有 {len(scc_list)} 个强连通分量:")
+    for i, component in enumerate(scc_list, 1):
+        print(f"SCC {i}: {component}")
\ No newline at end of file
@@ -0,0 +1,158 @@
+from array import array
+
+import numpy as np
+
+
+class UnionFind:
+    """
+    数组实现的并查集：顶点编号为 0..n-1，parent和size存放在array('i')中
+
+    find使用迭代的路径减半（不会递归爆栈），union按集合大小合并；
+    find_many/union_many可以直接处理整条边数组
+    """
+    def __init__(self, n):
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.count = n  # 当前连通分量（集合）的个数
+        # 与parent共享内存的NumPy视图，用于批量查询
+        self._parent_np = np.frombuffer(self.parent, dtype=np.int32) if n else np.zeros(0, dtype=np.int32)
+
+    def find(self, x):
+        """查找根节点，路径减半：每个顶点直接指向祖父节点"""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x, y):
+        """
+        合并x和y所在的集合
+
+        返回:
+            bool: 是否真正发生了合并（已在同一集合则返回False）
+        """
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return False
+        # 按大小合并：小集合挂到大集合下
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        self.count -= 1
+        return True
+
+    def find_many(self, xs):
+        """
+        批量查找根节点：所有查询同时沿parent向上跳，每一步是一次数组索引
+
+        参数:
+            xs: 顶点编号数组
+
+        返回:
+            ndarray: 各顶点的根节点
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        parent = self._parent_np
+        roots = parent[xs]
+        while True:
+            grand = parent[roots]
+            if np.array_equal(grand, roots):
+                break
+            roots = grand
+        # 路径压缩：被查询的顶点直接指向根
+        parent[xs] = roots
+        return roots
+
+    def union_many(self, us, vs):
+        """
+        按顺序合并多条边(us[i], vs[i])的两个端点
+
+        参数:
+            us, vs: 端点编号数组
+
+        返回:
+            ndarray: 布尔数组，第i个元素表示第i条边是否合并了两个不同的集合
+                     （Kruskal中即为该边是否加入生成树）
+        """
+        parent = self.parent
+        size = self.size
+        merged = np.zeros(len(us), dtype=bool)
+        count = self.count
+        for i, (x, y) in enumerate(zip(np.asarray(us).tolist(), np.asarray(vs).tolist())):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            count -= 1
+            merged[i] = True
+        self.count = count
+        return merged
+
+    def components(self):
+        """
+        返回:
+            ndarray: 每个顶点的根节点（同一连通分量的顶点根相同）
+        """
+        return self.find_many(np.arange(len(self.parent)))
+
+
+def Connected_Components(G):
+    """
+    用并查集求无向图的连通分量
+
+    参数:
+        G: 无向图的邻接表表示，格式为 {顶点: 邻居列表} 或 {顶点: {邻居: 权重}}
+
+    返回:
+        list: 连通分量列表，每个分量是一个顶点列表
+    """
+    vertices = list(G.keys())
+    vertex_to_index = {v: i for i, v in enumerate(vertices)}
+    for neighbors in G.values():
+        for v in neighbors:
+            if v not in vertex_to_index:
+                vertex_to_index[v] = len(vertices)
+                vertices.append(v)
+
+    us = [vertex_to_index[u] for u in G for _ in G[u]]
+    vs = [vertex_to_index[v] for u in G for v in G[u]]
+    uf = UnionFind(len(vertices))
+    uf.union_many(us, vs)
+
+    groups = {}
+    for v, root in zip(vertices, uf.components().tolist()):
+        groups.setdefault(root, []).append(v)
+    return list(groups.values())
+
+
+if __name__ == "__main__":
+    # 包含三个连通分量的无向图
+    G = {
+        "a": ["b", "c"],
+        "b": ["a"],
+        "c": ["a"],
+        "d": ["e"],
+        "e": ["d"],
+        "f": [],
+    }
+    components = Connected_Components(G)
+    print(f"图中共有 {len(components)} 个连通分量:")
+    for i, component in enumerate(components, 1):
+        print(f"  分量 {i}: {component}")
+
+    # 长链上的并查集：递归实现会超出递归深度，迭代实现没有问题
+    n = 200000
+    uf = UnionFind(n)
+    uf.union_many(np.arange(1, n), np.arange(n - 1))
+    print(f"\n{n}个顶点的链: 连通分量数 = {uf.count}，find(0) = {uf.find(0)}")
@@ -0,0 +1,228 @@
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from Graph_Store import Graph
+
+
+class ReorderedGraph:
+    """
+    重新编号后的CSR图，保存新旧编号之间的置换
+
+    order[i]: 新编号i对应的原顶点编号；rank[v]: 原顶点编号v的新编号
+    """
+    def __init__(self, indptr, indices, weights, order, vertices=None):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.order = order
+        self.rank = np.empty_like(order)
+        self.rank[order] = np.arange(len(order))
+        self.vertices = vertices  # 可选，原编号 -> 顶点名
+
+    def to_original(self, values):
+        """把按新编号排列的数组（如BFS距离）换回按原编号排列"""
+        return np.asarray(values)[self.rank]
+
+    def from_original(self, values):
+        """把按原编号排列的数组换成按新编号排列"""
+        return np.asarray(values)[self.order]
+
+    def to_dict(self):
+        """转换为以新编号为顶点的邻接表 {i: {j: 权重}}，可以直接交给BFS、Dijkstra_PriQueue等"""
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        weights = self.weights.tolist()
+        return {i: dict(zip(indices[indptr[i]:indptr[i + 1]], weights[indptr[i]:indptr[i + 1]]))
+                for i in range(len(indptr) - 1)}
+
+
+def csr_arrays(G):
+    """
+    把邻接表转换为CSR数组
+
+    参数:
+        G: Graph，或格式为 {顶点: {邻居: 权重}} / {顶点: 邻居列表} 的邻接表
+
+    返回:
+        tuple: (indptr, indices, weights, vertices)
+    """
+    if not isinstance(G, Graph):
+        G = Graph(G)
+    indptr, indices, weights = G.csr()
+    return indptr, indices, weights, G.vertices()
+
+def degree_order(indptr, indices):
+    """按度数从大到小排列（度数相同时保持原顺序）"""
+    return np.argsort(-np.diff(indptr), kind="stable")
+
+def bfs_order(indptr, indices, by_degree=False):
+    """
+    按BFS访问顺序排列：每个连通分量从其中度数最小的顶点开始
+
+    参数:
+        by_degree: 为True时邻居按度数从小到大访问（Cuthill-McKee顺序）
+    """
+    n = len(indptr) - 1
+    degree = np.diff(indptr)
+    if by_degree:
+        # 一次性把每一行的邻居按度数排好序，之后BFS只需按顺序访问
+        row = np.repeat(np.arange(n), degree)
+        indices = indices[np.lexsort((degree[indices], row))]
+    nbrs = indices.tolist()
+    ptr = indptr.tolist()
+
+    visited = bytearray(n)
+    order = []
+    for start in np.argsort(degree, kind="stable").tolist():
+        if visited[start]:
+            continue
+        visited[start] = 1
+        order.append(start)
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v in nbrs[ptr[u]:ptr[u + 1]]:
+                if not visited[v]:
+                    visited[v] = 1
+                    order.append(v)
+                    queue.append(v)
+    return np.array(order, dtype=np.int64)
+
+def rcm_order(indptr, indices):
+    """Reverse Cuthill-McKee顺序：Cuthill-McKee顺序反转，减小邻接矩阵的带宽"""
+    return bfs_order(indptr, indices, by_degree=True)[::-1].copy()
+
+def permute_csr(indptr, indices, weights, order):
+    """
+    按新顺序重写CSR数组，每一行的邻居按新编号升序排列
+
+    参数:
+        order: order[i]为新编号i对应的原编号
+
+    返回:
+        tuple: (indptr, indices, weights)
+    """
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    degree = np.diff(indptr)[order]
+    new_indptr = np.zeros(len(order) + 1, dtype=np.int64)
+    np.cumsum(degree, out=new_indptr[1:])
+
+    # 新的第i行来自原来的第order[i]行：一次性算出所有元素在原数组中的位置
+    shift = np.repeat(indptr[order] - new_indptr[:-1], degree)
+    src = np.arange(new_indptr[-1]) + shift
+    new_indices = rank[indices[src]]
+    new_weights = weights[src]
+
+    row = np.repeat(np.arange(len(order)), degree)
+    within = np.lexsort((new_indices, row))
+    return new_indptr, new_indices[within], new_weights[within]
+
+def Reorder(G, method="rcm"):
+    """
+    重新编号顶点以提高访存局部性
+
+    参数:
+        G: Graph或邻接表
+        method: "rcm"（Reverse Cuthill-McKee）、"bfs"（BFS访问顺序）或 "degree"（度数降序）
+
+    返回:
+        ReorderedGraph
+    """
+    indptr, indices, weights, vertices = csr_arrays(G)
+    orders = {"rcm": rcm_order, "bfs": bfs_order, "degree": degree_order}
+    if method not in orders:
+        raise ValueError(f"未知的重排方法: {method}")
+    order = orders[method](indptr, indices)
+    return ReorderedGraph(*permute_csr(indptr, indices, weights, order), order, vertices)
+
+def bandwidth(indptr, indices):
+    """
+    局部性指标
+
+    返回:
+        tuple: (带宽 max|i-j|, 平均边跨度 mean|i-j|)
+    """
+    row = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    gap = np.abs(row - indices)
+    return (int(gap.max()) if len(gap) else 0), (gap.mean() if len(gap) else 0.0)
+
+def simulated_cache_misses(indptr, indices, line=8, capacity=1024):
+    """
+    模拟按顶点编号顺序扫描全图时，访问每个顶点属性数组（如dist[]）的缓存缺失次数
+
+    属性数组每 line 个顶点占一个缓存行，缓存为容量 capacity 行的LRU缓存。
+    纯Python无法读取硬件计数器，用这个模拟值比较不同编号方式的访存局部性
+
+    返回:
+        int: 缓存缺失次数
+    """
+    cache = OrderedDict()
+    misses = 0
+    ptr = indptr.tolist()
+    lines = (indices // line).tolist()
+    for u in range(len(ptr) - 1):
+        for key in [u // line] + lines[ptr[u]:ptr[u + 1]]:
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                misses += 1
+                cache[key] = None
+                if len(cache) > capacity:
+                    cache.popitem(last=False)
+    return misses
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from BFS import BFS
+    from Dijkstra_PriQueue import Dijkstra_PriQueue
+
+    # 300x300的网格图，顶点按随机顺序插入（模拟按插入顺序编号的数据）
+    side = 300
+    n = side * side
+    random.seed(0)
+    label = list(range(n))
+    random.shuffle(label)
+    G = {}
+    for x in range(side):
+        for y in range(side):
+            u = label[x * side + y]
+            G[u] = {}
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if 0 <= x + dx < side and 0 <= y + dy < side:
+                    G[u][label[(x + dx) * side + y + dy]] = random.randint(1, 10)
+    G = {u: G[u] for u in range(n)}  # 顶点按编号排列
+
+    indptr, indices, weights, vertices = csr_arrays(G)
+    candidates = [("原始编号", G, None)]
+    for method in ("bfs", "rcm", "degree"):
+        R = Reorder(G, method)
+        candidates.append((method, R.to_dict(), R))
+
+    print(f"{side}x{side}网格图（{n}个顶点），随机编号:")
+    reference = None
+    for name, H, R in candidates:
+        ip, ix, _, _ = csr_arrays(H)
+        band, span = bandwidth(ip, ix)
+        misses = simulated_cache_misses(ip, ix)
+
+        source = 0 if R is None else int(R.rank[0])
+        start = time.perf_counter()
+        _, bfs_dist, _ = BFS(H, source)
+        bfs_time = time.perf_counter() - start
+        start = time.perf_counter()
+        dist, _ = Dijkstra_PriQueue(H, source)
+        dijkstra_time = time.perf_counter() - start
+
+        # 把结果换回原编号，检查与原图上的结果一致
+        dist = np.array([dist[i] for i in range(n)])
+        if R is not None:
+            dist = R.to_original(dist)
+        if reference is None:
+            reference = dist
+        print(f"  {name:6}: 带宽 {band:6d}，平均边跨度 {span:9.1f}，模拟缓存缺失 {misses:7d}，"
+              f"BFS {bfs_time:.3f}s，Dijkstra {dijkstra_time:.3f}s，"
+              f"结果一致: {np.array_equal(dist, reference)}")